@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from typing import List, Optional
+from datetime import date
 from app.core.database import get_db
-from app.models import Asset, NetworkInterface, Account
+from app.models import Asset
+from app.services.asset_search import AssetSearchService
+from app.services.asset_detail import AssetDetailService
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -24,24 +26,78 @@ class AssetResponse(BaseModel):
         from_attributes = True
 
 
+class NamedRef(BaseModel):
+    id: int
+    name: str
+
+
+class NetworkInterfaceResponse(BaseModel):
+    id: int
+    interface_name: Optional[str]
+    ip_address: Optional[str]
+    mac_address: Optional[str]
+
+
+class AccountResponse(BaseModel):
+    """계정 (비밀번호 해시는 응답에 포함하지 않음)"""
+    id: int
+    username: str
+    role: Optional[str]
+
+
+class LogDetailItem(BaseModel):
+    id: int
+    item_name: str
+    value: Optional[str]
+
+
+class LogFileItem(BaseModel):
+    id: int
+    file_type: str
+    filename: str
+
+
+class RecentLogResponse(BaseModel):
+    id: int
+    check_date: date
+    check_type: str
+    worker: Optional[str]
+    result_status: Optional[str]
+    details: List[LogDetailItem]
+    files: List[LogFileItem]
+
+
+class AssetDetailResponse(BaseModel):
+    id: int
+    name: str
+    asset_tag: Optional[str]
+    status: Optional[str]
+    model: Optional[str]
+    manufacturer: Optional[str]
+    os_info: Optional[str]
+    specs_cpu: Optional[str]
+    specs_memory: Optional[str]
+    specs_disk: Optional[str]
+    system: Optional[NamedRef]
+    location: Optional[NamedRef]
+    network_interfaces: List[NetworkInterfaceResponse]
+    accounts: List[AccountResponse]
+    recent_logs: List[RecentLogResponse]
+
+
 @router.get("/", response_model=List[AssetResponse])
 def get_assets(
-    search: Optional[str] = Query(None, description="자산명, IP, 위치 검색"),
+    response: Response,
+    search: Optional[str] = Query(None, description="자산명, 자산번호 부분 일치 / IP 접두 또는 CIDR 검색"),
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    after_id: Optional[int] = Query(None, description="이전 페이지 마지막 자산 id"),
     db: Session = Depends(get_db)
 ):
-    """자산 목록 조회 (검색 가능)"""
-    query = db.query(Asset)
-    
-    if search:
-        query = query.join(NetworkInterface, isouter=True).filter(
-            or_(
-                Asset.name.ilike(f"%{search}%"),
-                Asset.asset_tag.ilike(f"%{search}%"),
-                NetworkInterface.ip_address.ilike(f"%{search}%")
-            )
-        ).distinct()
-    
-    return query.all()
+    """자산 목록 조회 (검색 가능, 다음 페이지가 있으면 X-Next-Cursor 헤더에 after_id 반환)"""
+    assets, next_after_id = AssetSearchService.search(db, search, limit, after_id)
+    if next_after_id is not None:
+        response.headers["X-Next-Cursor"] = str(next_after_id)
+    return assets
 
 
 @router.get("/{asset_id}", response_model=AssetResponse)
@@ -52,3 +108,15 @@ def get_asset(asset_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Asset not found")
     return asset
 
+
+@router.get("/{asset_id}/detail", response_model=AssetDetailResponse)
+def get_asset_detail(
+    asset_id: int,
+    log_limit: int = Query(20, ge=1, le=200, description="최근 점검 이력 건수"),
+    db: Session = Depends(get_db)
+):
+    """자산 상세 화면 데이터 (설비/위치, NIC, 계정, 최근 점검 이력과 상세) - 이력 건수와 무관하게 고정 쿼리 수"""
+    detail = AssetDetailService.get(db, asset_id, log_limit)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return detail
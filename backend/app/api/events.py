@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+from app.core.database import get_db
+from app.services.event_counts import EventCountService
+
+router = APIRouter()
+
+
+@router.get("/top")
+def get_top_events(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    level: Optional[int] = Query(None, ge=1, le=3, description="1 (Critical), 2 (Error), 3 (Warning)"),
+    channel: Optional[str] = Query(None, description="sys, app, sec"),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """기간 내 발생 건수 상위 EventID"""
+    return {"events": EventCountService.top_events(db, start_date, end_date, level, channel, limit)}
+
+
+@router.get("/assets")
+def get_event_asset_ranking(
+    event_id: Optional[int] = Query(None, description="미지정 시 전체 이벤트 기준"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    level: Optional[int] = Query(None, ge=1, le=3),
+    channel: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """이벤트 발생 건수 기준 자산 순위 (예: 이번 달 Critical EventID 41 기록 자산)"""
+    return {"assets": EventCountService.asset_ranking(db, event_id, start_date, end_date, level, channel, limit)}
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.database import get_db
+from app.models.jobs import JobStatus
+from app.services.ingest_queue import IngestQueue, JobNotFound, JobStateError
+
+router = APIRouter()
+
+
+def _job_error(e: Exception) -> HTTPException:
+    if isinstance(e, JobNotFound):
+        return HTTPException(status_code=404, detail=str(e))
+    return HTTPException(status_code=409, detail=str(e))
+
+
+@router.get("/")
+def list_jobs(
+    response: Response,
+    status: Optional[JobStatus] = Query(None, description="queued, running, succeeded, failed"),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    db: Session = Depends(get_db)
+):
+    """업로드 처리 작업 목록 (최신순) 및 상태별 작업 수"""
+    queue = IngestQueue(db)
+    jobs = queue.list(status, cursor, limit + 1)
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        response.headers["X-Next-Cursor"] = str(jobs[-1]['id'])
+    return {"counts": queue.counts(), "jobs": jobs}
+
+
+@router.get("/{job_id}")
+def get_job(job_id: int, db: Session = Depends(get_db)):
+    """작업 상태, 처리 중이면 마지막 진행률(progress), 완료 시 처리 결과(stats)"""
+    try:
+        return IngestQueue(db).get(job_id)
+    except JobNotFound as e:
+        raise _job_error(e)
+
+
+@router.post("/{job_id}/retry")
+def retry_job(job_id: int, db: Session = Depends(get_db)):
+    """재시도 횟수를 모두 소진한 실패 작업을 다시 대기열로"""
+    try:
+        return IngestQueue(db).retry(job_id)
+    except (JobNotFound, JobStateError) as e:
+        raise _job_error(e)
+
+
+@router.delete("/{job_id}", status_code=204)
+def delete_job(job_id: int, db: Session = Depends(get_db)):
+    """처리 중이 아닌 작업 삭제 (대기열 파일 포함)"""
+    try:
+        IngestQueue(db).delete(job_id)
+    except (JobNotFound, JobStateError) as e:
+        raise _job_error(e)
@@ -1,13 +1,24 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select, tuple_
+from typing import Any, List, Optional, Tuple
 from datetime import date
-from app.core.database import get_db
-from app.models import MaintenanceLog, Asset
+import json
+from urllib.parse import quote
+from app.core.database import get_db, SessionLocal
+from app.models import MaintenanceLog, MaintenanceDetail, LogFile, Asset, RuleHit
+from app.models.maintenance import CheckType
+from app.services.blob_store import BlobStore
+from app.services.evtx_archive import EvtxArchive
+from app.services.maintenance_export import MaintenanceExport
 from pydantic import BaseModel
 
 router = APIRouter()
 
+# 스트리밍 모드에서 DB 커서로 한 번에 가져오는 행 수
+STREAM_FETCH_SIZE = 1000
+
 
 class MaintenanceLogResponse(BaseModel):
     id: int
@@ -16,27 +27,179 @@ class MaintenanceLogResponse(BaseModel):
     check_type: str
     worker: Optional[str]
     result_status: str
-    
+
     class Config:
         from_attributes = True
 
 
+class MaintenanceDetailResponse(BaseModel):
+    id: int
+    log_id: int
+    item_name: str
+    value: Optional[str]
+    raw_data: Any  # 큰 값은 {"blob": 해시, "size", "type"} 참조 - /details/{id}/raw로 조회
+
+    class Config:
+        from_attributes = True
+
+
+def _encode_cursor(check_date: date, log_id: int) -> str:
+    return f"{check_date.isoformat()}_{log_id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[date, int]:
+    try:
+        date_part, id_part = cursor.split('_', 1)
+        return date.fromisoformat(date_part), int(id_part)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _log_query(asset_id: Optional[int], start_date: Optional[date], end_date: Optional[date],
+               cursor: Optional[str]):
+    """점검 이력 조회 쿼리 ((check_date, id) 내림차순 keyset)"""
+    query = select(
+        MaintenanceLog.id,
+        MaintenanceLog.asset_id,
+        MaintenanceLog.check_date,
+        MaintenanceLog.check_type,
+        MaintenanceLog.worker,
+        MaintenanceLog.result_status
+    )
+
+    if asset_id:
+        query = query.where(MaintenanceLog.asset_id == asset_id)
+    if start_date:
+        query = query.where(MaintenanceLog.check_date >= start_date)
+    if end_date:
+        query = query.where(MaintenanceLog.check_date <= end_date)
+    if cursor:
+        query = query.where(tuple_(MaintenanceLog.check_date, MaintenanceLog.id) < _decode_cursor(cursor))
+
+    return query.order_by(MaintenanceLog.check_date.desc(), MaintenanceLog.id.desc())
+
+
+def _row_to_dict(row) -> dict:
+    return {
+        "id": row.id,
+        "asset_id": row.asset_id,
+        "check_date": row.check_date.isoformat(),
+        "check_type": row.check_type.value,
+        "worker": row.worker,
+        "result_status": row.result_status.value if row.result_status else None
+    }
+
+
+def _stream_ndjson(query):
+    """행을 읽는 즉시 한 줄씩 직렬화 (응답 수명 동안 별도 세션 사용)"""
+    db = SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=STREAM_FETCH_SIZE))
+        for row in result:
+            yield json.dumps(_row_to_dict(row), ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+
 @router.get("/logs", response_model=List[MaintenanceLogResponse])
 def get_maintenance_logs(
+    response: Response,
     asset_id: Optional[int] = Query(None),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    limit: int = Query(1000, ge=1, le=10000, description="페이지 크기 (stream 모드에서는 무시)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    stream: bool = Query(False, description="조건에 맞는 전체 이력을 NDJSON으로 스트리밍"),
     db: Session = Depends(get_db)
 ):
-    """점검 이력 조회"""
-    query = db.query(MaintenanceLog)
-    
-    if asset_id:
-        query = query.filter(MaintenanceLog.asset_id == asset_id)
-    if start_date:
-        query = query.filter(MaintenanceLog.check_date >= start_date)
-    if end_date:
-        query = query.filter(MaintenanceLog.check_date <= end_date)
-    
-    return query.order_by(MaintenanceLog.check_date.desc()).all()
+    """점검 이력 조회 (최신순, 다음 페이지가 있으면 X-Next-Cursor 헤더 반환)"""
+    query = _log_query(asset_id, start_date, end_date, cursor)
+
+    if stream:
+        return StreamingResponse(_stream_ndjson(query), media_type="application/x-ndjson")
+
+    # 한 건 더 읽어 다음 페이지 존재 여부 판단
+    rows = db.execute(query.limit(limit + 1)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1].check_date, rows[-1].id)
+
+    return [_row_to_dict(row) for row in rows]
+
+
+@router.get("/export")
+def export_maintenance_history(
+    format: str = Query("csv", pattern="^(csv|xlsx)$"),
+    asset_id: Optional[List[int]] = Query(None, description="여러 번 지정 가능 (미지정 시 전체 자산)"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    check_type: Optional[CheckType] = Query(None)
+):
+    """
+    점검 이력/상세/증빙 파일 목록 전체 추출 (CSV 또는 XLSX 스트리밍)
+
+    점검 상세 1건이 1행이며 자산/설비/위치 이름과 증빙 파일명을 함께 기록한다.
+    XLSX는 시트당 Excel 최대 행 수를 넘으면 다음 시트로 이어진다.
+    """
+    export = MaintenanceExport(asset_id, start_date, end_date, check_type)
+    filename = f"maintenance_export_{date.today().strftime('%Y%m%d')}.{format}"
+    headers = {"Content-Disposition": f"attachment; filename=\"{filename}\""}
+
+    if format == "xlsx":
+        return StreamingResponse(
+            export.xlsx(),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers=headers
+        )
+    return StreamingResponse(export.csv(), media_type="text/csv", headers=headers)
+
+
+@router.get("/logs/{log_id}/details", response_model=List[MaintenanceDetailResponse])
+def get_maintenance_details(log_id: int, db: Session = Depends(get_db)):
+    """점검 상세 데이터 (분리 저장된 raw_data는 참조만 반환)"""
+    return db.query(MaintenanceDetail).filter(MaintenanceDetail.log_id == log_id).order_by(MaintenanceDetail.id).all()
+
+
+@router.get("/logs/{log_id}/rule-hits")
+def get_rule_hits(log_id: int, db: Session = Depends(get_db)):
+    """점검 이력의 판정 규칙 적중 내역 (Fail 사유)"""
+    hits = db.execute(
+        select(RuleHit.rule, RuleHit.subject, RuleHit.value, RuleHit.threshold)
+        .where(RuleHit.log_id == log_id)
+        .order_by(RuleHit.rule, RuleHit.subject)
+    ).all()
+    return [
+        {"rule": rule, "subject": subject, "value": value, "threshold": threshold}
+        for rule, subject, value, threshold in hits
+    ]
+
+
+@router.get("/details/{detail_id}/raw")
+def get_maintenance_detail_raw(detail_id: int, db: Session = Depends(get_db)):
+    """상세 데이터 raw_data 원본 조회 (blob 참조이면 압축 해제하여 반환)"""
+    detail = db.get(MaintenanceDetail, detail_id)
+    if not detail:
+        raise HTTPException(status_code=404, detail="Detail not found")
+    try:
+        raw_data = BlobStore.load(db, detail.raw_data)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"id": detail.id, "item_name": detail.item_name, "raw_data": raw_data}
+
+
+@router.get("/files/{file_id}/download")
+def download_log_file(file_id: int, db: Session = Depends(get_db)):
+    """증빙 파일 다운로드 (아카이브 객체를 압축 해제하며 스트리밍)"""
+    log_file = db.get(LogFile, file_id)
+    if not log_file:
+        raise HTTPException(status_code=404, detail="File not found")
+    try:
+        filename, chunks = EvtxArchive().open_stream(db, log_file.file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Archived file is missing")
 
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    )
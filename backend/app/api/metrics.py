@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, cast, Date
+from typing import List, Optional
+from datetime import date
+from enum import Enum
+from app.core.database import get_db
+from app.models import PerformanceMetric
+
+router = APIRouter()
+
+
+class Bucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+def _bucket_expr(db: Session, bucket: Bucket):
+    """집계 구간 시작일 (주는 월요일 시작)"""
+    column = PerformanceMetric.metric_date
+    if db.get_bind().dialect.name == 'postgresql':
+        if bucket == Bucket.DAY:
+            return column
+        return cast(func.date_trunc(bucket.value, column), Date)
+
+    # SQLite (로컬 개발)
+    if bucket == Bucket.DAY:
+        return column
+    if bucket == Bucket.WEEK:
+        return func.date(column, 'weekday 0', '-6 days')
+    return func.date(column, 'start of month')
+
+
+@router.get("/")
+def get_metrics(
+    metric: str = Query(..., description="지표명 (예: CPU Usage)"),
+    asset_id: Optional[List[int]] = Query(None, description="자산 id (여러 개 지정 가능, 미지정 시 전체)"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    bucket: Bucket = Query(Bucket.DAY, description="집계 단위"),
+    db: Session = Depends(get_db)
+):
+    """성능 지표 추이 (자산별/구간별 min/max/avg를 한 번의 쿼리로 집계)"""
+    period = _bucket_expr(db, bucket).label("period")
+    query = select(
+        PerformanceMetric.asset_id,
+        period,
+        func.min(PerformanceMetric.value),
+        func.max(PerformanceMetric.value),
+        func.avg(PerformanceMetric.value),
+        func.count(),
+        func.max(PerformanceMetric.unit)
+    ).where(PerformanceMetric.metric == metric)
+
+    if asset_id:
+        query = query.where(PerformanceMetric.asset_id.in_(asset_id))
+    if start_date:
+        query = query.where(PerformanceMetric.metric_date >= start_date)
+    if end_date:
+        query = query.where(PerformanceMetric.metric_date <= end_date)
+
+    query = query.group_by(PerformanceMetric.asset_id, period).order_by(PerformanceMetric.asset_id, period)
+
+    series = {}
+    unit = None
+    for row_asset_id, row_period, min_value, max_value, avg_value, count, row_unit in db.execute(query):
+        unit = unit or row_unit
+        series.setdefault(row_asset_id, []).append({
+            "period": str(row_period),
+            "min": min_value,
+            "max": max_value,
+            "avg": round(avg_value, 3),
+            "count": count
+        })
+
+    return {
+        "metric": metric,
+        "unit": unit,
+        "bucket": bucket.value,
+        "series": [{"asset_id": key, "points": points} for key, points in series.items()]
+    }
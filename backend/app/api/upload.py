@@ -1,53 +1,268 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Header, Request, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from typing import Dict, Optional
+import asyncio
+import json
 import os
-import aiofiles
-from app.core.database import get_db
 from app.core.config import settings
-from app.services.upload_service import UploadService
+from app.core.database import SessionLocal
+from app.services.ingest_executor import run_ingest
+from app.services.ingest_queue import IngestQueue
+from app.services.upload_receiver import receive_upload, UploadTooLargeError, InvalidZipError, MultipartUploadError
+from app.services.upload_sessions import (
+    UploadSessionStore, UploadSessionError, UploadSessionNotFound, UploadIncompleteError
+)
+from app.services.upload_progress import UploadProgress, create_channel, get_channel
 
 router = APIRouter()
 
+# 백그라운드 처리 중인 업로드 task (GC로 사라지지 않도록 참조 유지)
+_background_tasks = set()
 
-@router.post("/")
+
+class UploadSessionCreate(BaseModel):
+    filename: str
+    size: int
+    chunk_size: Optional[int] = None
+
+
+def _session_error(e: Exception) -> HTTPException:
+    """세션 예외 -> HTTP 상태 코드"""
+    if isinstance(e, UploadSessionNotFound):
+        return HTTPException(status_code=404, detail=str(e))
+    if isinstance(e, UploadIncompleteError):
+        return HTTPException(status_code=409, detail=str(e))
+    if isinstance(e, UploadTooLargeError):
+        return HTTPException(status_code=413, detail=str(e))
+    return HTTPException(status_code=400, detail=str(e))
+
+
+async def _ingest_with_progress(channel: UploadProgress, file_path: str, worker: Optional[str],
+                                upload_info: Dict) -> Dict:
+    """진행 이벤트를 채널로 내보내며 처리하고 수신 파일 삭제"""
+    try:
+        stats = await run_ingest(file_path, worker, channel.publish)
+        channel.publish({'event': 'completed', 'stats': stats, 'upload': upload_info})
+        return stats
+    except Exception as e:
+        channel.publish({'event': 'failed', 'error': str(e)})
+        raise
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+async def _ingest_in_background(channel: UploadProgress, file_path: str, worker: Optional[str],
+                                upload_info: Dict):
+    try:
+        await _ingest_with_progress(channel, file_path, worker, upload_info)
+    except Exception as e:
+        print(f"Error processing upload {channel.upload_id}: {e}")
+
+
+def _enqueue(file_path: str, worker: Optional[str], upload_info: Dict) -> Dict:
+    db = SessionLocal()
+    try:
+        return IngestQueue(db).enqueue(
+            file_path, upload_info['filename'], upload_info['size'], upload_info.get('sha256'), worker
+        )
+    finally:
+        db.close()
+
+
+async def _process_received(file_path: str, worker: Optional[str], upload_info: Dict, background: bool):
+    """
+    수신 완료된 ZIP 처리 (background=True이면 upload_id만 바로 반환하고 이벤트 스트림으로 진행 상황 제공)
+
+    INGEST_QUEUE가 켜져 있으면 ingest_jobs에 등록만 하고 job_id를 반환한다 (진행 상황은 /api/jobs/{job_id}).
+    """
+    if settings.INGEST_QUEUE:
+        try:
+            job = await run_in_threadpool(_enqueue, file_path, worker, upload_info)
+        except Exception as e:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise HTTPException(status_code=500, detail=f"Queueing error: {str(e)}")
+        return JSONResponse(status_code=202, content={
+            "message": "Upload queued",
+            "job_id": job['id'],
+            "upload": upload_info
+        })
+
+    channel = create_channel()
+
+    if background:
+        task = asyncio.create_task(_ingest_in_background(channel, file_path, worker, upload_info))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return JSONResponse(status_code=202, content={
+            "message": "Upload accepted",
+            "upload_id": channel.upload_id,
+            "upload": upload_info
+        })
+
+    try:
+        # 업로드 서비스로 처리 (요청 세션과 분리된 전용 세션)
+        stats = await _ingest_with_progress(channel, file_path, worker, upload_info)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
+
+    return {
+        "message": "Upload processed successfully",
+        "upload_id": channel.upload_id,
+        "stats": stats,
+        "upload": upload_info
+    }
+
+
+# 본문을 직접 스트리밍 파싱하므로 OpenAPI 문서용 요청 스키마를 별도로 지정
+_UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"]
+                }
+            }
+        }
+    }
+}
+
+
+@router.post("/", openapi_extra=_UPLOAD_REQUEST_BODY)
 async def upload_zip(
-    file: UploadFile = File(...),
+    request: Request,
     worker: str = None,
-    db: Session = Depends(get_db)
+    background: bool = Query(False, description="수신 후 바로 202 + upload_id 반환 (진행 상황은 /{upload_id}/events)")
 ):
     """
-    ZIP 파일 업로드 및 처리
+    ZIP 파일 업로드 및 처리 (multipart/form-data의 file 필드)
+
+    파싱/DB 적재는 전용 스레드 풀에서 실행되어 이벤트 루프를 막지 않으며,
+    동시 처리 수(INGEST_CONCURRENCY)를 넘는 업로드는 대기 후 처리된다.
     """
-    # 파일 크기 검증
-    if file.size > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(status_code=400, detail="File size exceeds maximum limit")
+    # 청크 단위 스트리밍 저장 (.zip 파일명, 수신 중 크기 제한 및 ZIP 구조 검증 포함)
+    try:
+        received = await receive_upload(request, settings.UPLOAD_DIR)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (InvalidZipError, MultipartUploadError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # ZIP 파일인지 확인
-    if not file.filename.endswith('.zip'):
+    upload_info = {
+        "filename": received['filename'],
+        "size": received['size'],
+        "sha256": received['sha256']
+    }
+    return await _process_received(received['path'], worker, upload_info, background)
+
+
+@router.post("/sessions", status_code=201)
+def create_upload_session(body: UploadSessionCreate):
+    """
+    재개 가능한 청크 업로드 세션 생성
+
+    이후 PUT /sessions/{id}/chunks/{n}으로 청크를 (병렬로) 보내고,
+    연결이 끊기면 GET /sessions/{id}의 received 구간을 확인해 빠진 청크만 다시 보낸다.
+    """
+    if not body.filename.endswith('.zip'):
         raise HTTPException(status_code=400, detail="Only ZIP files are allowed")
-    
-    # 업로드 디렉토리 생성
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    
-    # 파일 저장
-    file_path = os.path.join(settings.UPLOAD_DIR, file.filename)
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await file.read()
-        await f.write(content)
-    
     try:
-        # 업로드 서비스로 처리
-        service = UploadService(db)
-        stats = service.process_upload(file_path, worker)
-        
-        return {
-            "message": "Upload processed successfully",
-            "stats": stats
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
-    finally:
-        # 원본 ZIP 파일 삭제 (선택사항)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        return UploadSessionStore().create(body.filename, body.size, body.chunk_size)
+    except (UploadSessionError, UploadTooLargeError) as e:
+        raise _session_error(e)
+
+
+@router.get("/sessions/{session_id}")
+def get_upload_session(session_id: str):
+    """세션 상태 및 수신된 청크 구간"""
+    try:
+        return UploadSessionStore().status(session_id)
+    except UploadSessionError as e:
+        raise _session_error(e)
+
+
+@router.put("/sessions/{session_id}/chunks/{index}")
+async def put_upload_chunk(
+    session_id: str,
+    index: int,
+    request: Request,
+    x_chunk_sha256: Optional[str] = Header(None, description="청크 내용 SHA-256 (hex) - 지정 시 검증")
+):
+    """청크 본문(application/octet-stream)을 파일의 해당 위치에 기록"""
+    try:
+        return await UploadSessionStore().write_chunk(session_id, index, request.stream(), x_chunk_sha256)
+    except UploadSessionError as e:
+        raise _session_error(e)
+
+
+@router.post("/sessions/{session_id}/finalize")
+async def finalize_upload_session(session_id: str, worker: str = None, background: bool = Query(False)):
+    """모든 청크 수신 후 조립된 ZIP을 일반 업로드와 같은 방식으로 처리"""
+    try:
+        received = await run_in_threadpool(UploadSessionStore().finalize, session_id)
+    except (UploadSessionError, InvalidZipError) as e:
+        raise _session_error(e)
+
+    upload_info = {
+        "filename": received['filename'],
+        "size": received['size'],
+        "chunks_sha256": received['chunks_sha256']
+    }
+    return await _process_received(received['path'], worker, upload_info, background)
+
+
+@router.delete("/sessions/{session_id}", status_code=204)
+def abort_upload_session(session_id: str):
+    """업로드 중단 (수신된 청크 삭제)"""
+    try:
+        UploadSessionStore().abort(session_id)
+    except UploadSessionError as e:
+        raise _session_error(e)
+
+
+def _progress_channel(upload_id: str) -> UploadProgress:
+    channel = get_channel(upload_id)
+    if channel is None:
+        raise HTTPException(status_code=404, detail="Upload not found (expired or handled by another worker)")
+    return channel
+
+
+@router.get("/{upload_id}")
+def get_upload_status(upload_id: str):
+    """업로드 처리 상태 (queued/processing/completed/failed)와 마지막 진행률"""
+    return _progress_channel(upload_id).snapshot
+
+
+@router.get("/{upload_id}/events")
+async def stream_upload_events(
+    upload_id: str,
+    format: str = Query("sse", pattern="^(sse|ndjson)$", description="sse: text/event-stream, ndjson: 줄 단위 JSON")
+):
+    """
+    업로드 진행 이벤트 스트림 (started / file / progress / completed / failed)
+
+    접속 전의 이벤트도 최근 것부터 재전송하며 completed/failed 이후 연결을 닫는다.
+    """
+    channel = _progress_channel(upload_id)
+
+    async def sse():
+        async for event in channel.stream():
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {event['seq']}\nevent: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    async def ndjson():
+        async for event in channel.stream():
+            yield json.dumps(event or {'event': 'heartbeat'}, ensure_ascii=False) + "\n"
 
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if format == "ndjson":
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson", headers=headers)
+    return StreamingResponse(sse(), media_type="text/event-stream", headers=headers)
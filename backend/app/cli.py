@@ -0,0 +1,334 @@
+"""
+관리 명령
+
+사용법 (backend 디렉토리에서):
+    python -m app.cli rebuild-stats
+    python -m app.cli backfill-metrics
+    python -m app.cli backfill-events
+    python -m app.cli backfill-inet
+    python -m app.cli evaluate-rules --start 2025-01-01 --end 2025-12-31
+    python -m app.cli compact-blobs
+    python -m app.cli archive-legacy
+    python -m app.cli verify-archive
+    python -m app.cli ingest /media/usb/2025Q4 --workers 4
+    python -m app.cli ingest /srv/dropbox --watch
+    python -m app.cli ingest-worker --processes 4
+"""
+import argparse
+import hashlib
+import os
+import time
+from datetime import date
+from collections import Counter
+from sqlalchemy import select, update, delete, bindparam
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.core.schema import ensure_schema, backfill_ip_inet
+from app.models import (
+    MaintenanceLog, MaintenanceDetail, PerformanceMetric, Blob, LogFile, ArchiveObject, EventCount
+)
+from app.models.maintenance import CheckType
+from app.services.bulk_writer import BulkWriter
+from app.services.dashboard_stats import DashboardStatsService
+from app.services.metrics import MetricNormalizer, MetricPartitions
+from app.services.blob_store import BlobStore
+from app.services.evtx_archive import EvtxArchive, ARCHIVE_SCHEME
+from app.services.event_counts import EventCountService
+from app.services.bulk_ingest import BulkIngest
+from app.services.ingest_worker import run_workers
+from app.services.rules import RuleEngine, load_rules
+
+
+def rebuild_stats(args):
+    """대시보드 요약 테이블 전체 재계산"""
+    db = SessionLocal()
+    try:
+        values = DashboardStatsService.rebuild(db)
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"total_assets={values['total_assets']} operational_assets={values['operational_assets']} "
+          f"days={len(values['daily_logs'])} warning_days={len(values['warning_assets'])}")
+
+
+# performance_metrics로 정규화하는 점검 유형 (성능 데이터, 프로세스 수)
+METRIC_CHECK_TYPES = (CheckType.DISK, CheckType.PROCESS)
+
+
+def backfill_metrics(args):
+    """기존 disk,task 성능 데이터와 프로세스 수(MaintenanceDetail)를 performance_metrics로 정규화"""
+    db = SessionLocal()
+    try:
+        dates = db.execute(
+            select(MaintenanceLog.check_date).where(MaintenanceLog.check_type.in_(METRIC_CHECK_TYPES)).distinct()
+        ).scalars().all()
+        MetricPartitions.ensure(engine, dates)
+
+        writer = BulkWriter(db, settings.INGEST_BATCH_SIZE,
+                            upserts={PerformanceMetric: ['asset_id', 'metric', 'metric_date']})
+        rows = db.execute(
+            select(MaintenanceLog.id, MaintenanceLog.asset_id, MaintenanceLog.check_date,
+                   MaintenanceDetail.item_name, MaintenanceDetail.value)
+            .join(MaintenanceDetail, MaintenanceDetail.log_id == MaintenanceLog.id)
+            .where(MaintenanceLog.check_type.in_(METRIC_CHECK_TYPES))
+            .order_by(MaintenanceLog.id, MaintenanceDetail.id)
+            .execution_options(yield_per=settings.INGEST_BATCH_SIZE)
+        )
+        for log_id, asset_id, check_date, item_name, value in rows:
+            metric_rows = MetricNormalizer.rows([{'item_name': item_name, 'value': value}],
+                                                asset_id, check_date, log_id)
+            for file_key, error in writer.add(str(log_id), {PerformanceMetric: metric_rows}):
+                print(f"Error writing metrics for log {file_key}: {error}")
+        for file_key, error in writer.flush():
+            print(f"Error writing metrics for log {file_key}: {error}")
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"metrics_written={writer.rows_inserted}")
+
+
+def backfill_events(args):
+    """
+    기존 EVTX 집계(Event Stats raw_data)로 event_counts 재구성
+
+    건수는 같은 키끼리 합산되므로 기존 행을 모두 지우고 같은 트랜잭션에서 다시 채운다.
+    """
+    db = SessionLocal()
+    try:
+        db.execute(delete(EventCount))
+        writer = BulkWriter(db, settings.INGEST_BATCH_SIZE,
+                            upserts={EventCount: ['log_id', 'channel', 'level', 'event_id']},
+                            accumulate={EventCount: ['count']})
+        rows = db.execute(
+            select(MaintenanceLog.id, MaintenanceLog.asset_id, MaintenanceLog.check_date,
+                   MaintenanceDetail.item_name, MaintenanceDetail.raw_data)
+            .join(MaintenanceDetail, MaintenanceDetail.log_id == MaintenanceLog.id)
+            .where(MaintenanceDetail.item_name.like('% Event Stats'))
+            .order_by(MaintenanceLog.id, MaintenanceDetail.id)
+        ).all()
+        for log_id, asset_id, check_date, item_name, raw_data in rows:
+            detail = {'item_name': item_name, 'raw_data': BlobStore.load(db, raw_data)}
+            event_rows = EventCountService.rows(detail, asset_id, check_date, log_id)
+            for file_key, error in writer.add(str(log_id), {EventCount: event_rows}):
+                print(f"Error writing event counts for log {file_key}: {error}")
+        for file_key, error in writer.flush():
+            print(f"Error writing event counts for log {file_key}: {error}")
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"event_counts_written={writer.rows_inserted}")
+
+
+def backfill_inet(args):
+    """network_interfaces.ip_inet 재계산 (SQL로 직접 적재한 NIC 등 ORM을 거치지 않은 행)"""
+    print(f"valid_addresses={backfill_ip_inet(engine)}")
+
+
+def evaluate_rules(args):
+    """기존 점검 이력 전체(또는 점검일 구간)를 판정 규칙으로 재평가 (result_status, rule_hits 갱신)"""
+    rules = load_rules(args.rules)
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        result = RuleEngine(rules).evaluate(db, start_date=args.start, end_date=args.end)
+        # 경고 자산 목록은 Fail 판정 기준이므로 요약 테이블도 다시 계산
+        DashboardStatsService.rebuild(db)
+        db.commit()
+    finally:
+        db.close()
+
+    hits = " ".join(f"{name}={count}" for name, count in result['hits'].items())
+    print(f"{hits} failed_logs={result['failed']} changed={len(result['changed'])} seconds={time.perf_counter() - start:.2f}")
+
+
+def compact_blobs(args):
+    """기존 상세 데이터의 큰 raw_data를 압축 blob으로 이전 (배치 단위 커밋)"""
+    db = SessionLocal()
+    store = BlobStore()
+    moved = 0
+    last_id = 0
+    try:
+        while True:
+            rows = db.execute(
+                select(MaintenanceDetail.id, MaintenanceDetail.raw_data)
+                .where(MaintenanceDetail.id > last_id, MaintenanceDetail.raw_data.isnot(None))
+                .order_by(MaintenanceDetail.id)
+                .limit(settings.INGEST_BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            blob_rows = {}
+            updates = []
+            for detail_id, raw_data in rows:
+                ref, blob_row = store.pack(raw_data)
+                if blob_row:
+                    blob_rows[blob_row['hash']] = blob_row
+                    updates.append({'detail_id': detail_id, 'ref': ref})
+
+            if updates:
+                writer = BulkWriter(db, settings.INGEST_BATCH_SIZE, ignore_conflicts=[Blob])
+                writer.add('blobs', {Blob: list(blob_rows.values())})
+                for _, error in writer.flush():
+                    raise error
+                db.execute(
+                    update(MaintenanceDetail.__table__)
+                    .where(MaintenanceDetail.id == bindparam('detail_id'))
+                    .values(raw_data=bindparam('ref')),
+                    updates
+                )
+                db.commit()
+                moved += len(updates)
+            store.release()
+    finally:
+        db.close()
+
+    print(f"details_compacted={moved}")
+
+
+def archive_legacy(args):
+    """아카이브 도입 이전에 일반 경로로 저장된 증빙 파일을 내용 주소 기반 아카이브로 이전"""
+    archive = EvtxArchive()
+    db = SessionLocal()
+    moved = missing = 0
+    try:
+        log_files = db.execute(
+            select(LogFile.id, LogFile.log_id, LogFile.file_path)
+            .where(LogFile.file_path.notlike(f"{ARCHIVE_SCHEME}%"))
+            .order_by(LogFile.id)
+        ).all()
+        for file_id, log_id, file_path in log_files:
+            if not os.path.exists(file_path):
+                print(f"Missing archived file for log_file {file_id}: {file_path}")
+                missing += 1
+                continue
+
+            hasher = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            obj = archive.store(file_path, hasher.hexdigest())
+
+            # 파일 단위로 커밋 (store가 원본을 삭제하므로 경로 갱신을 바로 확정)
+            EvtxArchive.add_refs(db, {obj['hash']: obj}, Counter([obj['hash']]))
+            db.execute(
+                update(LogFile).where(LogFile.id == file_id)
+                .values(file_path=EvtxArchive.file_path(obj['hash'], os.path.basename(file_path)))
+            )
+            db.commit()
+            moved += 1
+    finally:
+        db.close()
+
+    print(f"files_archived={moved} missing={missing}")
+
+
+def verify_archive(args):
+    """아카이브 객체 무결성 검증 (압축 해제 후 해시/크기 비교)"""
+    archive = EvtxArchive()
+    db = SessionLocal()
+    checked = corrupt = 0
+    try:
+        for obj in db.execute(select(ArchiveObject).order_by(ArchiveObject.hash)).scalars():
+            checked += 1
+            if not archive.verify(obj):
+                corrupt += 1
+                print(f"Corrupt or missing archive object: {obj.hash}")
+    finally:
+        db.close()
+
+    print(f"objects_checked={checked} corrupt={corrupt}")
+    if corrupt:
+        raise SystemExit(1)
+
+
+def ingest(args):
+    """디렉토리의 ZIP 일괄 적재 (--watch: 새로 들어오는 ZIP 계속 적재)"""
+    if not os.path.isdir(args.directory):
+        raise SystemExit(f"Directory not found: {args.directory}")
+
+    runner = BulkIngest(
+        args.directory,
+        workers=args.workers,
+        state_path=args.state,
+        report_path=args.report,
+        worker_name=args.worker,
+        recursive=args.recursive
+    )
+    report = runner.run(watch=args.watch, interval=args.interval)
+
+    totals = report['totals']
+    print(f"archives={totals['archives']} ingested={totals['ingested']} skipped={totals['skipped']} "
+          f"failed={totals['failed']} files={totals['total_files']} rows={totals['rows_inserted']} "
+          f"seconds={report['seconds']} report={runner.report_path}")
+    if totals['failed']:
+        raise SystemExit(1)
+
+
+def ingest_worker(args):
+    """ingest_jobs 대기열 처리 워커 (여러 호스트에서 동시에 실행 가능)"""
+    handled = run_workers(args.processes, once=args.once, poll_interval=args.poll_interval)
+    if args.processes <= 1:
+        print(f"jobs_processed={handled}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="PowerPlant-PMS 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = subparsers.add_parser("rebuild-stats", help="대시보드 요약 통계 전체 재계산")
+    rebuild.set_defaults(func=rebuild_stats)
+
+    backfill = subparsers.add_parser("backfill-metrics", help="기존 성능 데이터를 지표 시계열 테이블로 정규화")
+    backfill.set_defaults(func=backfill_metrics)
+
+    events = subparsers.add_parser("backfill-events", help="기존 EVTX 집계를 이벤트 집계 테이블로 정규화")
+    events.set_defaults(func=backfill_events)
+
+    inet = subparsers.add_parser("backfill-inet", help="NIC IP 주소를 검증하여 CIDR 검색용 inet 컬럼 재계산")
+    inet.set_defaults(func=backfill_inet)
+
+    rules = subparsers.add_parser("evaluate-rules", help="점검 이력을 판정 규칙으로 일괄 재평가")
+    rules.add_argument("--start", type=date.fromisoformat, help="점검일 시작 (YYYY-MM-DD, 기본: 전체)")
+    rules.add_argument("--end", type=date.fromisoformat, help="점검일 끝 (YYYY-MM-DD, 기본: 전체)")
+    rules.add_argument("--rules", help="규칙 JSON 파일 (기본: RULES_FILE 또는 기본 규칙)")
+    rules.set_defaults(func=evaluate_rules)
+
+    compact = subparsers.add_parser("compact-blobs", help="기존 대용량 raw_data를 압축 blob 저장소로 이전")
+    compact.set_defaults(func=compact_blobs)
+
+    legacy = subparsers.add_parser("archive-legacy", help="기존 증빙 파일을 압축 아카이브로 이전")
+    legacy.set_defaults(func=archive_legacy)
+
+    verify = subparsers.add_parser("verify-archive", help="아카이브 객체 무결성 검증")
+    verify.set_defaults(func=verify_archive)
+
+    bulk = subparsers.add_parser("ingest", help="디렉토리의 ZIP 일괄 적재 (HTTP 업로드 없이)")
+    bulk.add_argument("directory", help="ZIP이 있는 디렉토리")
+    bulk.add_argument("--workers", type=int, default=2, help="동시에 처리할 ZIP 수 (SQLite는 1 권장)")
+    bulk.add_argument("--watch", action="store_true", help="종료할 때까지 새 ZIP을 감시하며 적재")
+    bulk.add_argument("--interval", type=float, default=10.0, help="감시 주기(초)")
+    bulk.add_argument("--recursive", action="store_true", help="하위 디렉토리 포함")
+    bulk.add_argument("--state", help="완료 기록 파일 (기본: <directory>/.ingest_state.json)")
+    bulk.add_argument("--report", help="JSON 리포트 경로 (기본: <directory>/ingest_report.json)")
+    bulk.add_argument("--worker", help="점검 이력에 기록할 작업자명")
+    bulk.set_defaults(func=ingest)
+
+    queue_worker = subparsers.add_parser("ingest-worker", help="업로드 작업 대기열(ingest_jobs) 처리 워커")
+    queue_worker.add_argument("--processes", type=int, default=1, help="워커 프로세스 수 (동시에 처리할 ZIP 수)")
+    queue_worker.add_argument("--once", action="store_true", help="처리 가능한 작업이 없으면 종료")
+    queue_worker.add_argument("--poll-interval", type=float, default=None,
+                              help="대기 작업이 없을 때 조회 주기(초, 기본: JOB_POLL_SECONDS)")
+    queue_worker.set_defaults(func=ingest_worker)
+
+    args = parser.parse_args()
+    ensure_schema(engine)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
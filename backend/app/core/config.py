@@ -15,6 +15,30 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "/app/uploads"
     ARCHIVE_DIR: str = "/app/archive"
     MAX_UPLOAD_SIZE: int = 500 * 1024 * 1024  # 500MB
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 1MB 단위 스트리밍 저장
+    RESUMABLE_CHUNK_SIZE: int = 8 * 1024 * 1024  # 재개 가능 업로드 기본 청크 크기
+    RESUMABLE_MAX_CHUNK_SIZE: int = 64 * 1024 * 1024  # 클라이언트가 지정할 수 있는 최대 청크 크기
+    UPLOAD_SESSION_TTL_HOURS: int = 24  # 마지막 청크 수신 후 미완료 세션 보관 시간
+    
+    # Ingestion
+    INGEST_WORKERS: int = 1  # 파싱 프로세스 수 (1 = 순차 처리)
+    INGEST_CONCURRENCY: int = 2  # 동시에 처리하는 업로드 수 (초과분은 대기)
+    INGEST_BATCH_SIZE: int = 1000  # 다중 행 INSERT 배치 크기 (행 수)
+    BLOB_THRESHOLD: int = 4096  # 이 크기(bytes) 이상의 raw_data는 압축 blob으로 분리 저장
+
+    # Ingest job queue (python -m app.cli ingest-worker)
+    INGEST_QUEUE: bool = False  # True이면 업로드를 ingest_jobs에 등록만 하고 워커 프로세스가 처리
+    JOB_LEASE_SECONDS: int = 120  # 하트비트 없이 이 시간이 지나면 워커 중단으로 보고 다시 대기열로
+    JOB_MAX_ATTEMPTS: int = 3  # 실패 시 재시도 포함 최대 처리 횟수
+    JOB_RETRY_BASE_SECONDS: int = 30  # 재시도 대기 시간 (시도마다 2배, JOB_RETRY_MAX_SECONDS까지)
+    JOB_RETRY_MAX_SECONDS: int = 1800
+    JOB_POLL_SECONDS: float = 2.0  # 대기 작업이 없을 때 워커 조회 주기
+    
+    # Result rules
+    RULES_FILE: Optional[str] = None  # 판정 규칙 JSON 파일 (미지정 시 app.services.rules.DEFAULT_RULES)
+    
+    # Dashboard
+    DASHBOARD_SUMMARY_DAYS: int = 30  # 요약 테이블에 보관하는 일자별 집계 기간
     
     class Config:
         env_file = ".env"
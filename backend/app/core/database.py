@@ -15,6 +15,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def dialect_insert(db, model):
+    """
+    ON CONFLICT 절을 지원하는 방언별 INSERT 구문
+
+    운영 DB는 PostgreSQL이며, SQLite(로컬 개발/벤치마크)도 동일한 문법을 지원한다.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(model)
+
+
 def get_db():
     """데이터베이스 세션 의존성"""
     db = SessionLocal()
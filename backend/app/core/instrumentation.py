@@ -0,0 +1,187 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# 외부 의존성 없이 Prometheus 텍스트 형식(0.0.4)으로 내보내는 최소 지표 레지스트리
+# (uvicorn 워커 프로세스별로 따로 집계된다)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+BYTES_PER_SECOND_BUCKETS = (1e4, 1e5, 1e6, 5e6, 1e7, 5e7, 1e8, 5e8, 1e9)
+RECORDS_PER_SECOND_BUCKETS = (10, 100, 1e3, 1e4, 5e4, 1e5, 5e5, 1e6, 1e7)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_series(list(zip(self.label_names, key)), value))
+        return lines
+
+    def _render_series(self, labels: List[Tuple[str, str]], value) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_series(self, labels, value):
+        return [f"{self.name}_total{_format_labels(labels)} {_format_value(value)}"]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (_bucket/_sum/_count)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # [버킷별 건수..., +Inf 건수, 합계]
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def _render_series(self, labels, value):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), value[:-1]):
+            cumulative += count
+            bucket_labels = labels + [('le', _format_value(float(bound)))]
+            lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(value[-1])}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """지표 목록과 텍스트 형식 출력"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help_text, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help_text, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "pms_http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route", "status"]
+)
+INGEST_UPLOADS = REGISTRY.counter(
+    "pms_ingest_uploads", "Processed ZIP uploads", ["status"]
+)
+INGEST_STAGE_SECONDS = REGISTRY.histogram(
+    "pms_ingest_stage_seconds", "Ingestion stage duration (per upload, or per file for extract/parse/archive)",
+    ["stage"]
+)
+INGEST_FILES = REGISTRY.counter(
+    "pms_ingest_files", "Parsed ZIP members", ["file_type"]
+)
+INGEST_FILE_ERRORS = REGISTRY.counter(
+    "pms_ingest_file_errors", "ZIP members that failed to parse or write", ["stage"]
+)
+INGEST_FILE_BYTES_PER_SECOND = REGISTRY.histogram(
+    "pms_ingest_file_bytes_per_second", "Uncompressed member bytes per second of extract+parse time",
+    ["file_type"], BYTES_PER_SECOND_BUCKETS
+)
+INGEST_FILE_RECORDS_PER_SECOND = REGISTRY.histogram(
+    "pms_ingest_file_records_per_second", "Parsed records per second of extract+parse time",
+    ["file_type"], RECORDS_PER_SECOND_BUCKETS
+)
+
+
+class StageTimer:
+    """
+    업로드 1건의 단계별 누적 시간
+
+    각 측정값은 INGEST_STAGE_SECONDS에도 기록되며, breakdown()은 응답 stats['timings']용이다.
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float):
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        INGEST_STAGE_SECONDS.observe(seconds, stage=name)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def breakdown(self) -> Dict[str, float]:
+        timings = {name: round(seconds, 3) for name, seconds in self.totals.items()}
+        timings['total'] = round(self.elapsed(), 3)
+        return timings
@@ -0,0 +1,152 @@
+from sqlalchemy import text, select, update, delete, exists, func, and_, inspect, bindparam
+from sqlalchemy.engine import Engine
+from typing import List
+from app.core.database import Base
+
+NATURAL_KEY_INDEX = "uq_maintenance_logs_natural_key"
+
+
+def ensure_schema(engine: Engine):
+    """
+    테이블 및 인덱스 생성
+
+    create_all은 이미 존재하는 테이블에 새로 추가된 컬럼/인덱스를 만들지 않으므로,
+    모델에 선언된 nullable 컬럼과 인덱스 중 누락된 것을 개별적으로 생성한다.
+    maintenance_logs 자연키 유니크 인덱스가 없으면 기존 중복 이력을 먼저 병합한다.
+    유니크 인덱스는 업로드의 ON CONFLICT 대상이므로 생성에 실패하면 예외를 그대로 발생시켜
+    기동을 중단하고, 일반 인덱스는 경고만 출력하고 계속 진행한다.
+    """
+    import app.models  # noqa: F401 - 모델 등록
+
+    if engine.dialect.name == 'postgresql':
+        # 자산 검색 trigram 인덱스에 필요
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        except Exception as e:
+            print(f"Warning: could not create extension pg_trgm: {e}")
+
+    Base.metadata.create_all(bind=engine)
+
+    added = add_missing_columns(engine)
+    if 'network_interfaces.ip_inet' in added:
+        print(f"Backfilled ip_inet for {backfill_ip_inet(engine)} network interfaces")
+
+    existing = {index['name'] for index in inspect(engine).get_indexes('maintenance_logs')}
+    if NATURAL_KEY_INDEX not in existing:
+        merged = merge_duplicate_logs(engine)
+        if merged:
+            print(f"Merged {merged} duplicate maintenance logs before creating {NATURAL_KEY_INDEX}")
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with engine.begin() as conn:
+                    index.create(conn, checkfirst=True)
+            except Exception as e:
+                if index.unique:
+                    raise RuntimeError(f"Could not create unique index {index.name}: {e}") from e
+                print(f"Warning: could not create index {index.name}: {e}")
+
+
+def merge_duplicate_logs(engine: Engine) -> int:
+    """
+    (asset_id, check_date, check_type)이 같은 점검 이력을 가장 작은 id로 병합
+
+    maintenance_logs를 참조하는 모든 테이블의 log_id를 남길 이력으로 옮긴 뒤 나머지 이력을 삭제한다.
+    log_id가 기본키에 포함된 테이블(event_counts, rule_hits)은 남길 이력에 같은 키의 행이 이미 있으면
+    중복 이력 쪽 행을 삭제한다 (같은 자료를 다시 적재한 경우이므로).
+
+    Returns:
+        int: 삭제된 중복 이력 수
+    """
+    logs = Base.metadata.tables['maintenance_logs']
+    keep_id = func.min(logs.c.id).over(partition_by=(logs.c.asset_id, logs.c.check_date, logs.c.check_type))
+    ranked = select(logs.c.id, keep_id.label('keep_id')).subquery()
+
+    with engine.begin() as conn:
+        pairs = [
+            {'dup_id': dup_id, 'keep_id': keep}
+            for dup_id, keep in conn.execute(select(ranked.c.id, ranked.c.keep_id).where(ranked.c.id != ranked.c.keep_id))
+        ]
+        if not pairs:
+            return 0
+
+        for table in Base.metadata.sorted_tables:
+            for fk in table.foreign_keys:
+                if fk.column is not logs.c.id:
+                    continue
+                column = fk.parent
+                if column.primary_key:
+                    kept = table.alias()
+                    other_keys = [kept.c[c.name] == c for c in table.primary_key.columns if c is not column]
+                    conn.execute(
+                        delete(table).where(
+                            column == bindparam('dup_id'),
+                            exists().where(kept.c[column.name] == bindparam('keep_id'), and_(*other_keys))
+                        ),
+                        pairs
+                    )
+                conn.execute(
+                    update(table).where(column == bindparam('dup_id')).values({column.name: bindparam('keep_id')}),
+                    pairs
+                )
+
+        conn.execute(delete(logs).where(logs.c.id == bindparam('dup_id')), [{'dup_id': p['dup_id']} for p in pairs])
+    return len(pairs)
+
+
+def add_missing_columns(engine: Engine) -> List[str]:
+    """
+    기존 테이블에 없는 nullable 컬럼을 ALTER TABLE로 추가
+
+    Returns:
+        List[str]: 추가된 컬럼 ("테이블.컬럼")
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                print(f"Warning: cannot add NOT NULL column {table.name}.{column.name} to an existing table")
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def backfill_ip_inet(engine: Engine) -> int:
+    """
+    network_interfaces.ip_inet을 ip_address에서 다시 계산 (ORM을 거치지 않고 기록된 행 포함)
+
+    유효하지 않은 주소는 NULL로 두어 CIDR 검색에서 제외한다.
+
+    Returns:
+        int: 유효한 주소로 채워진 행 수
+    """
+    from app.models.asset import NetworkInterface, parse_ip
+
+    table = NetworkInterface.__table__
+    with engine.begin() as conn:
+        rows = conn.execute(select(table.c.id, table.c.ip_address, table.c.ip_inet)).all()
+        changes = []
+        valid = 0
+        for nic_id, ip_address, ip_inet in rows:
+            parsed = parse_ip(ip_address)
+            valid += parsed is not None
+            if parsed != (str(ip_inet) if ip_inet is not None else None):
+                changes.append({'nic_id': nic_id, 'parsed': parsed})
+        if changes:
+            conn.execute(
+                update(table).where(table.c.id == bindparam('nic_id')).values(ip_inet=bindparam('parsed')),
+                changes
+            )
+    return valid
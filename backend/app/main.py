@@ -1,11 +1,16 @@
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.api import upload, assets, maintenance, dashboard
+from app.core.database import engine
+from app.core.schema import ensure_schema
+from app.core.instrumentation import REGISTRY, HTTP_REQUEST_SECONDS
+from app.services.ingest_executor import shutdown_ingest_executor
+from app.api import upload, assets, maintenance, dashboard, metrics, events, jobs
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 데이터베이스 테이블 및 인덱스 생성
+ensure_schema(engine)
 
 app = FastAPI(
     title="PowerPlant-PMS API",
@@ -20,13 +25,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """라우트 템플릿(/api/assets/{asset_id} 등)별 응답 지연 기록 (스트리밍은 헤더 전송까지)"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status
+        )
+
+
 # 라우터 등록
 app.include_router(upload.router, prefix="/api/upload", tags=["upload"])
 app.include_router(assets.router, prefix="/api/assets", tags=["assets"])
 app.include_router(maintenance.router, prefix="/api/maintenance", tags=["maintenance"])
 app.include_router(dashboard.router, prefix="/api/dashboard", tags=["dashboard"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
+app.include_router(events.router, prefix="/api/events", tags=["events"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
+
+
+@app.on_event("shutdown")
+def wait_for_ingest():
+    # 처리 중인 업로드가 중간에 끊기지 않도록 종료 전 대기
+    shutdown_ingest_executor()
 
 
 @app.get("/")
@@ -34,6 +69,12 @@ async def root():
     return {"message": "PowerPlant-PMS API", "version": "1.0.0"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표 (HTTP 지연, 업로드 단계별 시간/처리율)"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
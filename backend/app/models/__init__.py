@@ -1,15 +1,32 @@
-from app.models.system import System, Location
+from app.models.system import System, Location, HierarchyVersion
 from app.models.asset import Asset, NetworkInterface, Account
 from app.models.maintenance import MaintenanceLog, MaintenanceDetail, LogFile
+from app.models.ingest import IngestedMember
+from app.models.dashboard import DashboardSummary
+from app.models.metrics import PerformanceMetric
+from app.models.blob import Blob
+from app.models.archive import ArchiveObject
+from app.models.events import EventCount
+from app.models.jobs import IngestJob
+from app.models.rules import RuleHit
 
 __all__ = [
     "System",
     "Location",
+    "HierarchyVersion",
     "Asset",
     "NetworkInterface",
     "Account",
     "MaintenanceLog",
     "MaintenanceDetail",
     "LogFile",
+    "IngestedMember",
+    "DashboardSummary",
+    "PerformanceMetric",
+    "Blob",
+    "ArchiveObject",
+    "EventCount",
+    "IngestJob",
+    "RuleHit",
 ]
 
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class ArchiveObject(Base):
+    """EVTX 아카이브 객체 인덱스 (내용 주소 기반, 참조 수 관리)"""
+    __tablename__ = "archive_objects"
+
+    hash = Column(String(64), primary_key=True)  # 원본 내용 SHA-256
+    codec = Column(String(8), nullable=False)  # zstd, zlib
+    size = Column(BigInteger, nullable=False)  # 원본 크기
+    stored_size = Column(BigInteger, nullable=False)  # 압축 후 크기
+    refcount = Column(Integer, nullable=False, default=0)  # 참조하는 LogFile 수
+    created_at = Column(DateTime, server_default=func.now())
@@ -1,6 +1,9 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Enum, Index, event
+from sqlalchemy.dialects.postgresql import INET
 from sqlalchemy.orm import relationship
+from typing import Optional
 import enum
+import ipaddress
 from app.core.database import Base
 
 
@@ -13,6 +16,13 @@ class AssetStatus(str, enum.Enum):
 class Asset(Base):
     """장비 마스터"""
     __tablename__ = "assets"
+    __table_args__ = (
+        # 부분 일치 검색(ILIKE '%검색어%')용 pg_trgm GIN 인덱스
+        Index("ix_assets_name_trgm", "name",
+              postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        Index("ix_assets_asset_tag_trgm", "asset_tag",
+              postgresql_using="gin", postgresql_ops={"asset_tag": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     system_id = Column(Integer, ForeignKey("systems.id"), nullable=True)
@@ -38,16 +48,42 @@ class Asset(Base):
 class NetworkInterface(Base):
     """네트워크 인터페이스 (1:N)"""
     __tablename__ = "network_interfaces"
+    __table_args__ = (
+        # IP 접두 일치 검색(LIKE '10.20.%')용
+        Index("ix_network_interfaces_ip_address_pattern", "ip_address",
+              postgresql_ops={"ip_address": "varchar_pattern_ops"}).ddl_if(dialect="postgresql"),
+        # CIDR 포함 검색(ip_inet <<= '10.0.0.0/8')용
+        Index("ix_network_interfaces_ip_inet", "ip_inet",
+              postgresql_using="gist", postgresql_ops={"ip_inet": "inet_ops"}).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False, index=True)
     ip_address = Column(String(45), nullable=True, index=True)  # IPv6 지원
+    # ip_address가 유효한 주소일 때만 채워지는 inet 값 (저장 시 parse_ip로 설정, 그 외 NULL)
+    ip_inet = Column(String(45).with_variant(INET(), "postgresql"), nullable=True)
     mac_address = Column(String(17), nullable=True)
     interface_name = Column(String(100), nullable=True)
 
     asset = relationship("Asset", back_populates="network_interfaces")
 
 
+def parse_ip(value: Optional[str]) -> Optional[str]:
+    """유효한 IPv4/IPv6 주소면 정규화된 문자열, 아니면 None (192.168.1.300, 1.2.3 등)"""
+    if not value:
+        return None
+    try:
+        return str(ipaddress.ip_address(value.strip()))
+    except ValueError:
+        return None
+
+
+@event.listens_for(NetworkInterface, 'before_insert')
+@event.listens_for(NetworkInterface, 'before_update')
+def _set_ip_inet(mapper, connection, target):
+    target.ip_inet = parse_ip(target.ip_address)
+
+
 class Account(Base):
     """접속 계정 (1:N)"""
     __tablename__ = "accounts"
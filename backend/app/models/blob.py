@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, LargeBinary, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class Blob(Base):
+    """압축된 내용 주소 기반(content-addressed) 대용량 데이터 저장소"""
+    __tablename__ = "blobs"
+
+    hash = Column(String(64), primary_key=True)  # 원본 바이트의 SHA-256
+    codec = Column(String(8), nullable=False)  # zstd, zlib
+    size = Column(Integer, nullable=False)  # 원본 크기 (bytes)
+    data = Column(LargeBinary, nullable=False)  # 압축된 데이터
+    created_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, DateTime, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class DashboardSummary(Base):
+    """대시보드 통계 요약 (단일 행, 업로드 시 증분 갱신)"""
+    __tablename__ = "dashboard_summary"
+
+    id = Column(Integer, primary_key=True)  # 항상 1
+    total_assets = Column(Integer, nullable=False, default=0)
+    operational_assets = Column(Integer, nullable=False, default=0)
+    daily_logs = Column(JSON, nullable=False, default=dict)  # {"YYYY-MM-DD": 점검 이력 수}
+    warning_assets = Column(JSON, nullable=False, default=dict)  # {"YYYY-MM-DD": {"자산 id": 자산명}}
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
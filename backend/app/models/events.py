@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Index
+from app.core.database import Base
+
+
+class EventCount(Base):
+    """EVTX 이벤트 집계 (점검 이력/채널/Level/EventID별 발생 건수)"""
+    __tablename__ = "event_counts"
+    __table_args__ = (
+        # 특정 EventID를 기록한 자산 조회 / 기간별 Top-N 및 경고 자산 조회
+        Index("ix_event_counts_event_level_date", "event_id", "level", "event_date"),
+        Index("ix_event_counts_date_level", "event_date", "level"),
+        Index("ix_event_counts_asset_date", "asset_id", "event_date"),
+    )
+
+    log_id = Column(Integer, ForeignKey("maintenance_logs.id"), primary_key=True)
+    channel = Column(String(16), primary_key=True)  # sys, app, sec, unknown
+    level = Column(Integer, primary_key=True)  # 1 (Critical), 2 (Error), 3 (Warning)
+    event_id = Column(Integer, primary_key=True)
+    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    event_date = Column(Date, nullable=False)  # 점검일
+    count = Column(Integer, nullable=False)
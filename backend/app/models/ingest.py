@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class IngestedMember(Base):
+    """적재 완료된 ZIP 멤버 지문 (중복 업로드 제외용)"""
+    __tablename__ = "ingested_members"
+    __table_args__ = (
+        Index("uq_ingested_members_fingerprint", "file_path", "crc32", "file_size", "content_hash", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_path = Column(String(500), nullable=False)  # ZIP 내부 경로 (작업구분/설비군/자산/날짜_파일)
+    crc32 = Column(BigInteger, nullable=False)  # Central Directory CRC-32
+    file_size = Column(BigInteger, nullable=False)  # 압축 해제 크기
+    content_hash = Column(String(64), nullable=False)  # SHA-256
+    log_id = Column(Integer, ForeignKey("maintenance_logs.id"), nullable=True)
+    ingested_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Enum, JSON, Index
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestJob(Base):
+    """ZIP 적재 작업 대기열 (워커 프로세스가 FOR UPDATE SKIP LOCKED로 가져가 처리)"""
+    __tablename__ = "ingest_jobs"
+    __table_args__ = (
+        # 대기 작업 선점 (status, available_at 순) / 만료된 임대 회수
+        Index("ix_ingest_jobs_status_available", "status", "available_at"),
+        Index("ix_ingest_jobs_status_lease", "status", "lease_expires_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    file_path = Column(String(500), nullable=False)  # UPLOAD_DIR/queue/ 아래 수신 파일 (워커 간 공유 스토리지)
+    filename = Column(String(255), nullable=True)  # 업로드 원본 파일명
+    file_size = Column(BigInteger, nullable=True)
+    sha256 = Column(String(64), nullable=True)
+    worker = Column(String(100), nullable=True)  # 점검 이력에 기록할 작업자명
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    available_at = Column(DateTime, nullable=False)  # 재시도 대기(backoff) 중이면 이후 시각
+    locked_by = Column(String(100), nullable=True)  # 처리 중인 워커 (호스트:pid)
+    lease_expires_at = Column(DateTime, nullable=True)  # 하트비트가 끊기면 이 시각 이후 다시 대기열로
+    progress = Column(JSON, nullable=True)  # 마지막 진행 이벤트
+    stats = Column(JSON, nullable=True)  # 처리 결과
+    error = Column(Text, nullable=True)  # 마지막 실패 사유
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
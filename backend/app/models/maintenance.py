@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, Enum, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import date
 import enum
@@ -20,6 +20,13 @@ class ResultStatus(str, enum.Enum):
 class MaintenanceLog(Base):
     """점검 이력 (Header)"""
     __tablename__ = "maintenance_logs"
+    __table_args__ = (
+        # 자연키 (자산, 점검일, 점검유형) - 업로드 시 ON CONFLICT 대상
+        Index("uq_maintenance_logs_natural_key", "asset_id", "check_date", "check_type", unique=True),
+        # (check_date, id) keyset 페이지네이션 - 자산별 / 전체
+        Index("ix_maintenance_logs_asset_date_id", "asset_id", "check_date", "id"),
+        Index("ix_maintenance_logs_date_id", "check_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
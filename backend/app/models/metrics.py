@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Float, Index
+from app.core.database import Base
+
+
+class PerformanceMetric(Base):
+    """
+    성능 지표 시계열 (disk,task 성능 데이터의 수치 정규화)
+
+    PostgreSQL에서는 metric_date 기준 월별 RANGE 파티션 테이블로 생성되며,
+    파티션은 적재 시 필요한 월만 생성한다 (app.services.metrics.MetricPartitions).
+
+    자산/지표/점검일당 한 값만 보관한다. 같은 날 한 자산의 여러 .txt 파일(disk.txt, task.txt 등)에
+    같은 항목명이 있으면 ZIP 멤버 순서상 마지막 파일의 값이 남고(배치 안/배치 간 동일),
+    값을 제공한 파일명은 source에 기록된다. 파일별 원본 값은 maintenance_details에 모두 남는다.
+    """
+    __tablename__ = "performance_metrics"
+    __table_args__ = (
+        # 여러 자산의 같은 지표 추이 조회용
+        Index("ix_performance_metrics_metric_date", "metric", "metric_date"),
+        {"postgresql_partition_by": "RANGE (metric_date)"},
+    )
+
+    asset_id = Column(Integer, ForeignKey("assets.id"), primary_key=True)
+    metric = Column(String(255), primary_key=True)  # 항목명 (예: "CPU Usage", "Disk C")
+    metric_date = Column(Date, primary_key=True)  # 점검일 (파티션 키)
+    value = Column(Float, nullable=False)  # 단위 변환된 수치
+    unit = Column(String(16), nullable=True)  # %, GB, MHz, ... (크기 단위는 GB로 통일)
+    log_id = Column(Integer, ForeignKey("maintenance_logs.id"), nullable=True)
+    source = Column(String(255), nullable=True)  # 값을 제공한 멤버 파일명 (예: "disk.txt", 백필 데이터는 NULL)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Float, Index
+from app.core.database import Base
+
+
+class RuleHit(Base):
+    """판정 규칙 적중 기록 (점검 이력별로 어떤 규칙이 어떤 값에서 발생했는지)"""
+    __tablename__ = "rule_hits"
+    __table_args__ = (
+        # 기간 단위 재평가 시 삭제 범위 / 자산별 조회
+        Index("ix_rule_hits_check_date", "check_date"),
+        Index("ix_rule_hits_asset_date", "asset_id", "check_date"),
+    )
+
+    log_id = Column(Integer, ForeignKey("maintenance_logs.id"), primary_key=True)
+    rule = Column(String(64), primary_key=True)  # 규칙 이름
+    subject = Column(String(255), primary_key=True)  # 적중 대상 (지표명, level_1 등)
+    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    check_date = Column(Date, nullable=False)
+    value = Column(Float, nullable=True)  # 관측값 (delta 규칙은 직전 측정값과의 차이)
+    threshold = Column(Float, nullable=True)
@@ -30,3 +30,16 @@ class Location(Base):
     children = relationship("Location", backref="parent", remote_side=[id])
     assets = relationship("Asset", back_populates="location")
 
+
+
+class HierarchyVersion(Base):
+    """
+    계층 트리 버전 (단일 행)
+
+    System/Location/Asset을 변경하는 트랜잭션 안에서 증가시키며, 각 프로세스의 계층 트리 캐시는
+    이 값과 비교하여 재구성 여부를 판단한다 (API/워커/CLI 프로세스 간 무효화).
+    """
+    __tablename__ = "hierarchy_version"
+
+    id = Column(Integer, primary_key=True)  # 항상 1
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,101 @@
+from typing import Dict, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
+from app.models import Asset, Account, MaintenanceLog, MaintenanceDetail, LogFile
+
+# 자산 상세 1건 조회에 실행되는 쿼리 수 (최근 이력 건수와 무관)
+#   자산+설비+위치(JOIN), 네트워크 인터페이스, 계정, 최근 이력, 이력별 상세, 이력별 증빙 파일
+QUERY_COUNT = 6
+
+
+class AssetDetailService:
+    """자산 상세 화면용 집계 조회 (관계는 모두 즉시 로딩 - 지연 로딩 N+1 없음)"""
+
+    @staticmethod
+    def get(db: Session, asset_id: int, log_limit: int = 20) -> Optional[Dict]:
+        """
+        자산 제원, 설비/위치, 네트워크 인터페이스, 계정(비밀번호 해시 제외), 최근 점검 이력과 상세
+
+        Args:
+            log_limit: 최근 점검 이력 건수 (점검일, id 내림차순)
+
+        Returns:
+            Optional[Dict]: 자산이 없으면 None
+        """
+        asset = db.execute(
+            select(Asset)
+            .where(Asset.id == asset_id)
+            .options(
+                joinedload(Asset.system),
+                joinedload(Asset.location),
+                selectinload(Asset.network_interfaces),
+                # password_hash 컬럼은 SELECT하지 않음
+                selectinload(Asset.accounts).load_only(Account.id, Account.asset_id, Account.username, Account.role)
+            )
+        ).unique().scalar_one_or_none()
+        if asset is None:
+            return None
+
+        logs = db.execute(
+            select(MaintenanceLog)
+            .where(MaintenanceLog.asset_id == asset_id)
+            .order_by(MaintenanceLog.check_date.desc(), MaintenanceLog.id.desc())
+            .limit(log_limit)
+            .options(
+                # raw_data는 크기가 커서 제외 (/api/maintenance/details/{id}/raw로 조회)
+                selectinload(MaintenanceLog.details).load_only(
+                    MaintenanceDetail.id, MaintenanceDetail.log_id, MaintenanceDetail.item_name, MaintenanceDetail.value
+                ),
+                selectinload(MaintenanceLog.log_files)
+            )
+        ).scalars().all()
+
+        return {
+            'id': asset.id,
+            'name': asset.name,
+            'asset_tag': asset.asset_tag,
+            'status': asset.status.value if asset.status else None,
+            'model': asset.model,
+            'manufacturer': asset.manufacturer,
+            'os_info': asset.os_info,
+            'specs_cpu': asset.specs_cpu,
+            'specs_memory': asset.specs_memory,
+            'specs_disk': asset.specs_disk,
+            'system': {'id': asset.system.id, 'name': asset.system.name} if asset.system else None,
+            'location': {'id': asset.location.id, 'name': asset.location.name} if asset.location else None,
+            'network_interfaces': [
+                {
+                    'id': nic.id,
+                    'interface_name': nic.interface_name,
+                    'ip_address': nic.ip_address,
+                    'mac_address': nic.mac_address
+                }
+                for nic in sorted(asset.network_interfaces, key=lambda nic: nic.id)
+            ],
+            'accounts': [
+                {'id': account.id, 'username': account.username, 'role': account.role}
+                for account in sorted(asset.accounts, key=lambda account: account.id)
+            ],
+            'recent_logs': [
+                {
+                    'id': log.id,
+                    'check_date': log.check_date,
+                    'check_type': log.check_type.value,
+                    'worker': log.worker,
+                    'result_status': log.result_status.value if log.result_status else None,
+                    'details': [
+                        {'id': detail.id, 'item_name': detail.item_name, 'value': detail.value}
+                        for detail in sorted(log.details, key=lambda detail: detail.id)
+                    ],
+                    'files': [
+                        {
+                            'id': log_file.id,
+                            'file_type': log_file.file_type,
+                            'filename': log_file.file_path.rsplit('/', 1)[-1]
+                        }
+                        for log_file in sorted(log.log_files, key=lambda log_file: log_file.id)
+                    ]
+                }
+                for log in logs
+            ]
+        }
@@ -0,0 +1,64 @@
+import ipaddress
+from typing import List, Optional, Tuple
+from sqlalchemy import select, union, cast
+from sqlalchemy.dialects.postgresql import INET
+from sqlalchemy.orm import Session
+from app.models import Asset, NetworkInterface
+
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class AssetSearchService:
+    """
+    자산 검색 (keyset 페이지네이션)
+
+    자산명/자산번호의 부분 일치(ILIKE '%검색어%')는 pg_trgm GIN 인덱스로 처리되고,
+    IP는 접두 일치(LIKE '검색어%', pattern_ops 인덱스) 또는 CIDR 포함 검색(ip_inet <<=, GiST 인덱스)으로 찾는다.
+    조건별 자산 id를 UNION으로 모아 조인/DISTINCT 없이 id 순으로 페이지를 자른다.
+    """
+
+    @staticmethod
+    def search(db: Session, search: Optional[str] = None, limit: int = 100,
+               after_id: Optional[int] = None) -> Tuple[List[Asset], Optional[int]]:
+        """
+        Returns:
+            Tuple[List[Asset], Optional[int]]: (자산 목록, 다음 페이지 after_id 또는 None)
+        """
+        query = select(Asset)
+
+        if search:
+            query = query.where(Asset.id.in_(AssetSearchService._matching_ids(db, search.strip())))
+        if after_id is not None:
+            query = query.where(Asset.id > after_id)
+
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        assets = db.execute(query.order_by(Asset.id).limit(limit + 1)).scalars().all()
+        if len(assets) > limit:
+            assets = assets[:limit]
+            return assets, assets[-1].id
+        return assets, None
+
+    @staticmethod
+    def _matching_ids(db: Session, term: str):
+        pattern = f"%{_escape_like(term)}%"
+        return union(
+            select(Asset.id).where(Asset.name.ilike(pattern, escape='\\')),
+            select(Asset.id).where(Asset.asset_tag.ilike(pattern, escape='\\')),
+            select(NetworkInterface.asset_id).where(AssetSearchService._ip_condition(db, term)),
+        )
+
+    @staticmethod
+    def _ip_condition(db: Session, term: str):
+        """CIDR 표기(10.0.0.0/8)는 inet 포함 검색, 그 외는 IP 접두 일치"""
+        if '/' in term and db.get_bind().dialect.name == 'postgresql':
+            try:
+                network = ipaddress.ip_network(term, strict=False)
+            except ValueError:
+                network = None
+            if network is not None:
+                # ip_inet은 저장 시 검증된 주소만 담고 있으므로 조회 중 inet 변환 오류가 없다
+                return NetworkInterface.ip_inet.op('<<=')(cast(str(network), INET))
+
+        return NetworkInterface.ip_address.like(f"{_escape_like(term)}%", escape='\\')
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import Blob
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 zlib 사용
+    zstandard = None
+
+
+DEFAULT_CODEC = 'zstd' if zstandard else 'zlib'
+
+
+def _compress(payload: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(payload)
+    return zlib.compress(payload, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstandard package is required to read zstd blobs")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class BlobStore:
+    """
+    raw_data 대용량 값의 압축 blob 분리 저장
+
+    BLOB_THRESHOLD 이상인 raw_data는 SHA-256을 키로 blobs 테이블에 압축 저장하고
+    raw_data에는 {"blob": 해시, "size": 원본 크기, "type": "text"|"json"} 참조만 남긴다.
+    같은 내용은 한 번만 저장된다 (INSERT ... ON CONFLICT DO NOTHING).
+    """
+
+    def __init__(self, threshold: int = None, codec: str = DEFAULT_CODEC):
+        self.threshold = settings.BLOB_THRESHOLD if threshold is None else threshold
+        self.codec = codec
+        # 아직 기록되지 않은 배치에서 압축한 blob 행 (같은 내용 재압축 방지).
+        # 배치가 기록되면 release()로 비워 압축 데이터가 업로드 내내 남지 않도록 한다
+        self._packed: Dict[str, Dict] = {}
+
+    def pack(self, raw_data: Any) -> Tuple[Any, Optional[Dict]]:
+        """
+        Returns:
+            Tuple[Any, Optional[Dict]]: (raw_data에 저장할 값, 기록할 blob 행 또는 None)
+        """
+        if raw_data is None or BlobStore.is_ref(raw_data):
+            return raw_data, None
+
+        if isinstance(raw_data, str):
+            payload, kind = raw_data.encode('utf-8'), 'text'
+        else:
+            payload, kind = json.dumps(raw_data, ensure_ascii=False).encode('utf-8'), 'json'
+
+        if len(payload) < self.threshold:
+            return raw_data, None
+
+        digest = hashlib.sha256(payload).hexdigest()
+        ref = {'blob': digest, 'size': len(payload), 'type': kind}
+
+        # 같은 내용이라도 파일마다 blob 행을 함께 넘겨, 먼저 본 파일의 기록이
+        # 실패해도 참조하는 파일의 blob이 누락되지 않도록 한다 (중복은 ON CONFLICT로 무시).
+        # release() 이후 다시 나온 내용은 한 번 더 압축해 넘긴다
+        if digest not in self._packed:
+            self._packed[digest] = {
+                'hash': digest,
+                'codec': self.codec,
+                'size': len(payload),
+                'data': _compress(payload, self.codec)
+            }
+        return ref, self._packed[digest]
+
+    def pack_rows(self, detail_rows: List[Dict]) -> List[Dict]:
+        """상세 행의 raw_data를 참조로 바꾸고 기록할 blob 행 목록 반환"""
+        blob_rows = []
+        for row in detail_rows:
+            row['raw_data'], blob_row = self.pack(row.get('raw_data'))
+            if blob_row:
+                blob_rows.append(blob_row)
+        return blob_rows
+
+    def release(self):
+        """기록이 끝난 배치의 압축 blob 행 캐시 비움 (BulkWriter on_flush)"""
+        self._packed.clear()
+
+    @staticmethod
+    def is_ref(raw_data: Any) -> bool:
+        return isinstance(raw_data, dict) and set(raw_data) == {'blob', 'size', 'type'}
+
+    @staticmethod
+    def load(db: Session, raw_data: Any) -> Any:
+        """참조이면 blob을 읽어 원래 값으로 복원, 아니면 그대로 반환"""
+        if not BlobStore.is_ref(raw_data):
+            return raw_data
+
+        blob = db.get(Blob, raw_data['blob'])
+        if blob is None:
+            raise LookupError(f"Blob not found: {raw_data['blob']}")
+
+        payload = _decompress(blob.data, blob.codec)
+        if raw_data['type'] == 'text':
+            return payload.decode('utf-8')
+        return json.loads(payload)
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import signal
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.database import engine
+from app.services.ingest_executor import ingest_zip
+from app.services.upload_receiver import validate_zip, InvalidZipError
+
+STATE_FILENAME = ".ingest_state.json"
+REPORT_FILENAME = "ingest_report.json"
+_STAT_KEYS = ('total_files', 'processed', 'errors', 'skipped_duplicates', 'rows_inserted')
+
+
+def _init_worker():
+    # Ctrl+C는 부모 프로세스만 처리 - 진행 중인 ZIP은 끝까지 처리하고 커밋
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # fork로 복제된 커넥션 풀은 부모와 공유되므로 버리고 새로 연결
+    engine.dispose(close=False)
+    # 병렬화는 ZIP 단위로 하므로 ZIP 내부 파싱은 순차 처리
+    settings.INGEST_WORKERS = 1
+
+
+def _ingest_archive(zip_path: str, worker: Optional[str]) -> Tuple[Dict, float]:
+    start = time.perf_counter()
+    stats = ingest_zip(zip_path, worker)
+    return stats, time.perf_counter() - start
+
+
+def _file_sha256(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _write_json(path: str, data: Dict):
+    """임시 파일에 기록 후 rename (중단되어도 이전 내용이 깨지지 않음)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    os.replace(temp_path, path)
+
+
+class IngestState:
+    """
+    처리 완료된 ZIP 기록 (내용 SHA-256 기준)
+
+    파일명이 바뀌거나 다른 USB에서 다시 복사해도 같은 내용이면 건너뛴다.
+    실패한 ZIP은 기록하지 않으므로 다음 실행에서 다시 시도된다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.done = json.load(f).get('done', {})
+
+    def is_done(self, digest: str) -> bool:
+        return digest in self.done
+
+    def mark_done(self, digest: str, entry: Dict):
+        self.done[digest] = entry
+        _write_json(self.path, {'done': self.done})
+
+
+class BulkIngest:
+    """
+    디렉토리 단위 ZIP 일괄 적재 (HTTP 없이 UploadService 직접 호출)
+
+    ZIP마다 별도 프로세스에서 처리하여 CPU를 병렬로 사용하고, 한 건이 끝날 때마다
+    진행 상황 출력/상태 파일/리포트를 갱신한다. 중단 후 다시 실행하면 상태 파일에
+    기록된 ZIP은 건너뛴다 (멤버 단위 중복 제외로 일부만 적재된 ZIP도 남은 멤버만 처리됨).
+    """
+
+    def __init__(self, directory: str, workers: int = 2, state_path: str = None,
+                 report_path: str = None, worker_name: str = None, recursive: bool = False):
+        self.directory = os.path.abspath(directory)
+        self.workers = workers
+        self.state = IngestState(state_path or os.path.join(self.directory, STATE_FILENAME))
+        self.report_path = report_path or os.path.join(self.directory, REPORT_FILENAME)
+        self.worker_name = worker_name
+        self.recursive = recursive
+        self.results: List[Dict] = []
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+
+    def scan(self) -> List[str]:
+        """대상 ZIP 경로 (이름순)"""
+        paths = []
+        if self.recursive:
+            for root, _, files in os.walk(self.directory):
+                paths.extend(os.path.join(root, name) for name in files if name.lower().endswith('.zip'))
+        else:
+            paths = [
+                os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                if name.lower().endswith('.zip') and os.path.isfile(os.path.join(self.directory, name))
+            ]
+        return sorted(paths)
+
+    def run(self, watch: bool = False, interval: float = 10.0) -> Dict:
+        """
+        ZIP 적재 실행
+
+        Args:
+            watch: True이면 종료(Ctrl+C)할 때까지 디렉토리를 감시하며 새 ZIP을 적재
+            interval: 감시 주기(초) - 크기/수정 시각이 한 주기 동안 변하지 않은 ZIP만 처리 (복사 중 제외)
+
+        Returns:
+            Dict: 리포트
+        """
+        pending: Dict[Future, Tuple[str, str]] = {}
+        handled = set()
+        submitted = set()
+        last_seen: Dict[str, Tuple[int, float]] = {}
+        total = None
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+            try:
+                first_pass = True
+                while True:
+                    if watch or first_pass:
+                        paths = [path for path in self.scan() if path not in handled]
+                        if not watch:
+                            total = len(paths)
+                        for path in paths:
+                            if watch and not self._is_stable(path, last_seen):
+                                continue
+                            handled.add(path)
+                            digest = _file_sha256(path)
+                            # 같은 내용의 사본이 이번 실행에 이미 들어간 경우도 건너뜀
+                            if self.state.is_done(digest) or digest in submitted:
+                                self._record(path, digest, 'skipped', total)
+                                continue
+                            submitted.add(digest)
+                            future = executor.submit(_ingest_archive, path, self.worker_name)
+                            pending[future] = (path, digest)
+                        first_pass = False
+
+                    if not pending:
+                        if not watch:
+                            break
+                        time.sleep(interval)
+                        continue
+
+                    done, _ = wait(list(pending), timeout=interval if watch else None, return_when=FIRST_COMPLETED)
+                    self._collect(done, pending, submitted, total)
+            except KeyboardInterrupt:
+                print("Interrupted - waiting for running archives to finish; "
+                      "archives not reported as done will be retried on the next run", flush=True)
+                # 아직 시작하지 않은 ZIP은 취소하고, 실행 중인 ZIP은 끝까지 기다려 상태/리포트에 기록
+                for future in list(pending):
+                    if future.cancel():
+                        pending.pop(future)
+                done, _ = wait(list(pending))
+                self._collect(done, pending, submitted, total)
+
+        return self.write_report()
+
+    def _collect(self, done, pending: Dict[Future, Tuple[str, str]], submitted: set, total: Optional[int]):
+        """완료된 작업의 결과를 상태 파일/리포트에 기록"""
+        for future in done:
+            path, digest = pending.pop(future)
+            try:
+                stats, seconds = future.result()
+            except Exception as e:
+                submitted.discard(digest)
+                self._record(path, digest, 'failed', total, error=str(e))
+                continue
+            self._record(path, digest, 'ingested', total, stats, seconds)
+
+    @staticmethod
+    def _is_stable(path: str, last_seen: Dict[str, Tuple[int, float]]) -> bool:
+        """이전 감시 주기와 크기/수정 시각이 같고 ZIP 구조가 온전하면 복사가 끝난 것으로 판단"""
+        try:
+            current = (os.path.getsize(path), os.path.getmtime(path))
+        except OSError:
+            return False
+        previous = last_seen.get(path)
+        last_seen[path] = current
+        if previous != current:
+            return False
+        try:
+            validate_zip(path)
+        except InvalidZipError:
+            return False
+        return True
+
+    def _record(self, path: str, digest: str, status: str, total: Optional[int],
+                stats: Dict = None, seconds: float = 0.0, error: str = None):
+        entry = {
+            'path': path,
+            'sha256': digest,
+            'size': os.path.getsize(path) if os.path.exists(path) else None,
+            'status': status,
+            'seconds': round(seconds, 2),
+            'stats': stats,
+            'error': error
+        }
+        self.results.append(entry)
+        if status == 'ingested':
+            self.state.mark_done(digest, {
+                'path': path,
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'stats': {key: stats.get(key) for key in _STAT_KEYS}
+            })
+
+        self._print_progress(entry, total)
+        self.write_report()
+
+    def _print_progress(self, entry: Dict, total: Optional[int]):
+        count = len(self.results)
+        elapsed = time.perf_counter() - self._start
+        position = f"[{count}/{total}]" if total else f"[{count}]"
+        line = f"{position} {entry['status']:<8} {os.path.relpath(entry['path'], self.directory)}"
+
+        if entry['stats']:
+            stats = entry['stats']
+            line += (f" files={stats['total_files']} processed={stats['processed']} errors={stats['errors']}"
+                     f" rows={stats.get('rows_inserted', 0)} {entry['seconds']:.1f}s")
+        if entry['error']:
+            line += f" error={entry['error']}"
+
+        line += f" | elapsed {elapsed:.0f}s"
+        if total and count < total:
+            line += f" eta {elapsed / count * (total - count):.0f}s"
+        print(line, flush=True)
+
+    def write_report(self) -> Dict:
+        totals = {'archives': len(self.results), 'ingested': 0, 'failed': 0, 'skipped': 0}
+        totals.update({key: 0 for key in _STAT_KEYS})
+        for entry in self.results:
+            totals[entry['status']] += 1
+            for key in _STAT_KEYS:
+                totals[key] += (entry['stats'] or {}).get(key) or 0
+
+        report = {
+            'directory': self.directory,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(time.perf_counter() - self._start, 2),
+            'workers': self.workers,
+            'totals': totals,
+            'archives': self.results
+        }
+        _write_json(self.report_path, report)
+        return report
@@ -0,0 +1,136 @@
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.database import dialect_insert
+
+
+# 파일 하나가 기록할 행: {모델 클래스: [행 dict, ...]}
+FileRows = Dict[type, List[Dict]]
+
+
+class BulkWriter:
+    """
+    MaintenanceDetail / LogFile 등 업로드 결과 행을 모아 다중 행 INSERT로 기록
+
+    행은 파일 단위로 버퍼링되며 batch_size에 도달하면 하나의 SAVEPOINT 안에서
+    테이블별 executemany(다중 행 VALUES)로 기록한다. 배치가 실패하면 해당
+    배치를 파일별 SAVEPOINT로 다시 기록하여 실패한 파일만 골라낸다.
+    커밋은 호출 측(업로드 단위 트랜잭션)에서 수행한다.
+
+    ignore_conflicts에 지정된 모델은 INSERT ... ON CONFLICT DO NOTHING으로,
+    upserts에 지정된 모델은 {모델: 충돌 키 컬럼}의 ON CONFLICT DO UPDATE로 기록한다.
+    accumulate에 {모델: 합산 컬럼}을 지정하면 해당 컬럼은 덮어쓰지 않고 같은 키끼리 더한다
+    (배치 안 중복 키는 미리 합산, 기존 행과 충돌 시 기존 값 + 새 값).
+    on_flush는 버퍼를 기록한 뒤(성공/실패 무관) 호출되며, 배치 동안만 필요한 캐시 정리에 쓴다.
+    """
+
+    def __init__(self, db: Session, batch_size: int = 1000, ignore_conflicts: Iterable[type] = (),
+                 upserts: Dict[type, List[str]] = None, accumulate: Dict[type, List[str]] = None,
+                 on_flush: Optional[Callable[[], None]] = None):
+        self.db = db
+        self.batch_size = batch_size
+        self.ignore_conflicts = set(ignore_conflicts)
+        self.upserts = upserts or {}
+        self.accumulate = accumulate or {}
+        self.on_flush = on_flush
+        self.rows_inserted = 0
+        self.write_seconds = 0.0
+        self._pending: List[Tuple[str, FileRows]] = []
+        self._pending_rows = 0
+
+    def add(self, file_key: str, rows: FileRows) -> List[Tuple[str, Exception]]:
+        """
+        파일 하나의 행 추가 (배치가 차면 flush)
+
+        Returns:
+            List[Tuple[str, Exception]]: flush 중 기록에 실패한 (file_key, 오류) 목록
+        """
+        self._pending.append((file_key, rows))
+        self._pending_rows += sum(len(model_rows) for model_rows in rows.values())
+
+        if self._pending_rows >= self.batch_size:
+            return self.flush()
+        return []
+
+    def flush(self) -> List[Tuple[str, Exception]]:
+        """버퍼링된 행 기록, 실패한 (file_key, 오류) 목록 반환"""
+        if not self._pending:
+            return []
+
+        pending = self._pending
+        self._pending = []
+        self._pending_rows = 0
+
+        start = time.perf_counter()
+        failed = []
+        try:
+            merged: FileRows = {}
+            for _, rows in pending:
+                for model, model_rows in rows.items():
+                    merged.setdefault(model, []).extend(model_rows)
+
+            with self.db.begin_nested():
+                inserted = self._insert(merged)
+            self.rows_inserted += inserted
+        except Exception:
+            # 배치 실패 시 파일 단위로 재시도하여 실패 파일만 집계
+            for file_key, rows in pending:
+                try:
+                    with self.db.begin_nested():
+                        inserted = self._insert(rows)
+                    self.rows_inserted += inserted
+                except Exception as e:
+                    failed.append((file_key, e))
+        finally:
+            self.write_seconds += time.perf_counter() - start
+            if self.on_flush:
+                self.on_flush()
+
+        return failed
+
+    def _insert(self, rows: FileRows) -> int:
+        # dict 삽입 순서 = 모델 기록 순서 (FK 참조 순서대로 구성할 것)
+        inserted = 0
+        for model, model_rows in rows.items():
+            if not model_rows:
+                continue
+            if model in self.ignore_conflicts:
+                stmt = dialect_insert(self.db, model).on_conflict_do_nothing()
+            elif model in self.upserts:
+                # 한 문장 안에서 같은 키를 두 번 갱신할 수 없으므로 키당 한 행으로 합침
+                # (합산 컬럼은 더하고 나머지는 마지막 행 값)
+                key_columns = self.upserts[model]
+                sum_columns = self.accumulate.get(model, ())
+                model_rows = self._merge_keys(model_rows, key_columns, sum_columns)
+                stmt = dialect_insert(self.db, model)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=key_columns,
+                    set_={
+                        c: model.__table__.c[c] + stmt.excluded[c] if c in sum_columns else stmt.excluded[c]
+                        for c in model_rows[0] if c not in key_columns
+                    }
+                )
+            else:
+                stmt = insert(model)
+            self.db.execute(stmt, model_rows)
+            inserted += len(model_rows)
+        return inserted
+
+    @staticmethod
+    def _merge_keys(model_rows: List[Dict], key_columns: List[str], sum_columns) -> List[Dict]:
+        # 배치 실패 시 파일별로 다시 기록하므로 원본 행 dict는 수정하지 않음
+        merged: Dict[tuple, Dict] = {}
+        for row in model_rows:
+            key = tuple(row[c] for c in key_columns)
+            previous = merged.get(key)
+            if previous is not None and sum_columns:
+                row = {**row, **{c: previous[c] + row[c] for c in sum_columns}}
+            merged[key] = row
+        return list(merged.values())
+
+    def throughput(self) -> float:
+        """기록 시간 기준 초당 삽입 행 수"""
+        if self.write_seconds <= 0:
+            return 0.0
+        return round(self.rows_inserted / self.write_seconds, 1)
@@ -0,0 +1,157 @@
+from datetime import date, timedelta
+from typing import Dict, Iterable, Tuple
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import dialect_insert
+from app.models import Asset, MaintenanceLog, DashboardSummary
+from app.models.asset import AssetStatus
+from app.models.maintenance import ResultStatus
+
+
+SUMMARY_ID = 1
+
+
+class DashboardStatsService:
+    """
+    대시보드 통계 요약 테이블 관리
+
+    자산 수와 최근 일자별 점검 이력 수/경고 자산을 dashboard_summary 단일 행에 보관한다.
+    업로드는 커밋하는 트랜잭션 안에서 행을 잠그고(FOR UPDATE) 증분만 반영하며,
+    /stats는 기본키 조회 한 번으로 응답한다. 전체 재계산은 rebuild로 수행한다.
+    """
+
+    @staticmethod
+    def get_stats(db: Session) -> Dict:
+        """대시보드 통계 (요약 행이 없으면 재계산 후 생성)"""
+        summary = db.get(DashboardSummary, SUMMARY_ID)
+        if summary is None:
+            DashboardStatsService.rebuild(db)
+            db.commit()
+            summary = db.get(DashboardSummary, SUMMARY_ID)
+
+        # 최근 24시간 = 어제 이후 점검일
+        since = (date.today() - timedelta(days=1)).isoformat()
+        recent_logs = sum(count for day, count in summary.daily_logs.items() if day >= since)
+
+        warning_assets = {}
+        for day, assets in summary.warning_assets.items():
+            if day >= since:
+                warning_assets.update(assets)
+
+        return {
+            "total_assets": summary.total_assets,
+            "operational_assets": summary.operational_assets,
+            "recent_logs": recent_logs,
+            "warning_assets": [
+                {"id": int(asset_id), "name": name}
+                for asset_id, name in sorted(warning_assets.items(), key=lambda item: int(item[0]))
+            ]
+        }
+
+    @staticmethod
+    def apply_ingest(db: Session, assets_created: int, created_logs: Iterable[Tuple[int, date]],
+                     warning_days: Iterable[date]):
+        """
+        업로드 결과를 요약 행에 증분 반영 (커밋은 호출 측 트랜잭션에서 수행)
+
+        Args:
+            assets_created: 새로 생성된 자산 수 (모두 운영 상태로 생성됨)
+            created_logs: 새로 생성된 점검 이력의 (자산 id, 점검일)
+            warning_days: 판정(Pass/Fail)이 바뀐 점검 이력의 점검일 - 해당 일자의 경고 자산을 다시 계산
+                (Fail에서 Pass로 바뀐 자산도 제거되도록 추가가 아닌 일자 단위 교체)
+        """
+        summary = DashboardStatsService._lock_summary(db)
+        if summary is None:
+            # 최초 생성: 같은 트랜잭션의 이번 업로드 데이터까지 포함해 재계산되므로 증분 불필요
+            if DashboardStatsService._insert_computed(db):
+                return
+            summary = DashboardStatsService._lock_summary(db)
+
+        daily_logs = dict(summary.daily_logs)
+        for _, check_date in created_logs:
+            day = check_date.isoformat()
+            daily_logs[day] = daily_logs.get(day, 0) + 1
+
+        cutoff = DashboardStatsService._cutoff().isoformat()
+        days = {day for day in warning_days if day.isoformat() >= cutoff}
+        warning_assets = {day: dict(assets) for day, assets in summary.warning_assets.items()}
+        if days:
+            for day in days:
+                warning_assets.pop(day.isoformat(), None)
+            warning_assets.update(DashboardStatsService._warning_assets(db, MaintenanceLog.check_date.in_(days)))
+
+        summary.total_assets += assets_created
+        summary.operational_assets += assets_created
+        # JSON 컬럼은 새 객체를 대입해야 변경이 감지됨
+        summary.daily_logs = {day: count for day, count in daily_logs.items() if day >= cutoff}
+        summary.warning_assets = {day: assets for day, assets in warning_assets.items() if day >= cutoff}
+        db.flush()
+
+    @staticmethod
+    def rebuild(db: Session) -> Dict:
+        """요약 행 전체 재계산 (커밋은 호출 측에서 수행)"""
+        values = DashboardStatsService._compute(db)
+        stmt = dialect_insert(db, DashboardSummary).values(id=SUMMARY_ID, **values)
+        db.execute(stmt.on_conflict_do_update(index_elements=['id'], set_={**values, 'updated_at': func.now()}))
+        db.expire_all()
+        return values
+
+    @staticmethod
+    def _lock_summary(db: Session):
+        return db.execute(
+            select(DashboardSummary).where(DashboardSummary.id == SUMMARY_ID).with_for_update()
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _insert_computed(db: Session) -> bool:
+        """요약 행이 없을 때 재계산 값으로 생성, 다른 트랜잭션이 먼저 생성했으면 False"""
+        values = DashboardStatsService._compute(db)
+        stmt = dialect_insert(db, DashboardSummary).values(id=SUMMARY_ID, **values)
+        return db.execute(stmt.on_conflict_do_nothing(index_elements=['id'])).rowcount == 1
+
+    @staticmethod
+    def _cutoff() -> date:
+        return date.today() - timedelta(days=settings.DASHBOARD_SUMMARY_DAYS)
+
+    @staticmethod
+    def _compute(db: Session) -> Dict:
+        """원본 테이블에서 요약 값 계산"""
+        cutoff = DashboardStatsService._cutoff()
+
+        total_assets, operational_assets = db.execute(
+            select(
+                func.count(Asset.id),
+                func.count(Asset.id).filter(Asset.status == AssetStatus.OPERATIONAL)
+            )
+        ).one()
+
+        daily_logs = {
+            check_date.isoformat(): count
+            for check_date, count in db.execute(
+                select(MaintenanceLog.check_date, func.count(MaintenanceLog.id))
+                .where(MaintenanceLog.check_date >= cutoff)
+                .group_by(MaintenanceLog.check_date)
+            )
+        }
+
+        return {
+            'total_assets': total_assets,
+            'operational_assets': operational_assets,
+            'daily_logs': daily_logs,
+            'warning_assets': DashboardStatsService._warning_assets(db, MaintenanceLog.check_date >= cutoff)
+        }
+
+    @staticmethod
+    def _warning_assets(db: Session, date_condition) -> Dict[str, Dict[str, str]]:
+        """판정 규칙(RuleEngine)으로 Fail 처리된 점검 이력이 있는 자산 {"YYYY-MM-DD": {"자산 id": 자산명}}"""
+        warning_assets = {}
+        rows = db.execute(
+            select(Asset.id, Asset.name, MaintenanceLog.check_date)
+            .join(MaintenanceLog, MaintenanceLog.asset_id == Asset.id)
+            .where(date_condition, MaintenanceLog.result_status == ResultStatus.FAIL)
+            .distinct()
+        )
+        for asset_id, asset_name, check_date in rows:
+            warning_assets.setdefault(check_date.isoformat(), {})[str(asset_id)] = asset_name
+        return warning_assets
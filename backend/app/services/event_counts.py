@@ -0,0 +1,104 @@
+import re
+from datetime import date
+from typing import Dict, List, Optional
+from sqlalchemy import select, func, desc
+from sqlalchemy.orm import Session
+from app.models import Asset, EventCount
+
+_LEVEL_KEY = re.compile(r'^level_(\d)$')
+_EVENT_KEY = re.compile(r'^EventID_(\d+)$')
+
+
+class EventCountService:
+    """
+    EVTX 이벤트 집계 정규화 및 조회
+
+    process_evtx가 만든 {"level_1": {"EventID_41": 2}, ...} 집계를
+    event_counts 행으로 풀어 저장하고, Top-N/자산 순위를 SQL 집계로 조회한다.
+    """
+
+    @staticmethod
+    def rows(detail: Dict, asset_id: int, event_date: date, log_id: int) -> List[Dict]:
+        """'<채널> Event Stats' 상세 데이터를 event_counts 행으로 변환"""
+        event_stats = detail.get('raw_data')
+        if not isinstance(event_stats, dict):
+            return []
+
+        channel = detail['item_name'].split(' ', 1)[0]
+        rows = []
+        for level_key, events in event_stats.items():
+            level_match = _LEVEL_KEY.match(level_key)
+            if not level_match or not isinstance(events, dict):
+                continue
+            for event_key, count in events.items():
+                event_match = _EVENT_KEY.match(event_key)
+                if not event_match or not count:
+                    continue
+                rows.append({
+                    'log_id': log_id,
+                    'channel': channel,
+                    'level': int(level_match.group(1)),
+                    'event_id': int(event_match.group(1)),
+                    'asset_id': asset_id,
+                    'event_date': event_date,
+                    'count': count
+                })
+        return rows
+
+    @staticmethod
+    def _filters(query, start_date: Optional[date], end_date: Optional[date],
+                 level: Optional[int], channel: Optional[str]):
+        if start_date:
+            query = query.where(EventCount.event_date >= start_date)
+        if end_date:
+            query = query.where(EventCount.event_date <= end_date)
+        if level:
+            query = query.where(EventCount.level == level)
+        if channel:
+            query = query.where(EventCount.channel == channel)
+        return query
+
+    @staticmethod
+    def top_events(db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                   level: Optional[int] = None, channel: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """발생 건수 기준 상위 EventID"""
+        total = func.sum(EventCount.count).label("total")
+        query = select(
+            EventCount.event_id,
+            EventCount.level,
+            total,
+            func.count(func.distinct(EventCount.asset_id))
+        )
+        query = EventCountService._filters(query, start_date, end_date, level, channel)
+        query = query.group_by(EventCount.event_id, EventCount.level).order_by(desc(total)).limit(limit)
+
+        return [
+            {"event_id": event_id, "level": row_level, "count": count, "assets": assets}
+            for event_id, row_level, count, assets in db.execute(query)
+        ]
+
+    @staticmethod
+    def asset_ranking(db: Session, event_id: Optional[int] = None, start_date: Optional[date] = None,
+                      end_date: Optional[date] = None, level: Optional[int] = None,
+                      channel: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """이벤트 발생 건수 기준 자산 순위 (event_id 지정 시 해당 이벤트만)"""
+        total = func.sum(EventCount.count).label("total")
+        ranking = select(
+            EventCount.asset_id,
+            total,
+            func.count(func.distinct(EventCount.log_id)).label("logs")
+        )
+        if event_id is not None:
+            ranking = ranking.where(EventCount.event_id == event_id)
+        ranking = EventCountService._filters(ranking, start_date, end_date, level, channel)
+        ranking = ranking.group_by(EventCount.asset_id).order_by(desc(total)).limit(limit).subquery()
+
+        query = (
+            select(Asset.id, Asset.name, ranking.c.total, ranking.c.logs)
+            .join(ranking, ranking.c.asset_id == Asset.id)
+            .order_by(desc(ranking.c.total), Asset.id)
+        )
+        return [
+            {"asset_id": asset_id, "name": name, "count": count, "logs": logs}
+            for asset_id, name, count, logs in db.execute(query)
+        ]
@@ -0,0 +1,177 @@
+import hashlib
+import os
+import tempfile
+import zlib
+from collections import Counter
+from typing import Dict, Iterator, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import dialect_insert
+from app.models import ArchiveObject
+from app.services.blob_store import zstandard, DEFAULT_CODEC
+
+ARCHIVE_SCHEME = "archive://"
+_READ_SIZE = 1024 * 1024
+_EXTENSIONS = {'zstd': '.zst', 'zlib': '.z'}
+
+
+class EvtxArchive:
+    """
+    내용 주소 기반 EVTX 아카이브
+
+    원본 파일은 SHA-256 해시를 이름으로 ARCHIVE_DIR/objects/<앞 2자리>/<해시>.<확장자>에
+    압축 저장하며, 같은 내용은 한 번만 기록한다. archive_objects 테이블이 해시별
+    원본/압축 크기와 참조 수(LogFile 행 수)를 관리한다.
+    LogFile.file_path는 "archive://<해시>/<날짜>_<파일명>" 형태로 저장된다.
+    """
+
+    def __init__(self, root: str = None, codec: str = DEFAULT_CODEC):
+        self.root = os.path.join(root or settings.ARCHIVE_DIR, "objects")
+        self.codec = codec
+
+    def object_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.root, digest[:2], digest + _EXTENSIONS[codec])
+
+    def store(self, src_path: str, digest: str) -> Dict:
+        """
+        파일을 아카이브에 압축 저장 (이미 있는 내용이면 기록 생략) 후 원본 삭제
+
+        Args:
+            src_path: 추출된 원본 파일 경로
+            digest: 원본 내용 SHA-256 (파싱 시 계산된 값)
+
+        Returns:
+            Dict: archive_objects 행 {'hash', 'codec', 'size', 'stored_size'}
+        """
+        size = os.path.getsize(src_path)
+        path = self.object_path(digest, self.codec)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 임시 파일에 압축 후 rename - 동시 업로드가 같은 객체를 써도 결과는 동일
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with open(src_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                    self._compress_stream(src, dst)
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        os.remove(src_path)
+        return {
+            'hash': digest,
+            'codec': self.codec,
+            'size': size,
+            'stored_size': os.path.getsize(path)
+        }
+
+    @staticmethod
+    def file_path(digest: str, display_name: str) -> str:
+        return f"{ARCHIVE_SCHEME}{digest}/{display_name}"
+
+    @staticmethod
+    def parse_file_path(file_path: str) -> Tuple[str, str]:
+        """"archive://<해시>/<이름>" -> (해시, 이름)"""
+        digest, _, name = file_path[len(ARCHIVE_SCHEME):].partition('/')
+        return digest, name
+
+    def open_stream(self, db: Session, file_path: str) -> Tuple[str, Iterator[bytes]]:
+        """
+        LogFile.file_path를 (다운로드 파일명, 압축 해제된 바이트 청크 iterator)로 해석
+
+        아카이브 도입 이전의 일반 파일 경로도 그대로 읽는다.
+        """
+        if not file_path.startswith(ARCHIVE_SCHEME):
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(file_path)
+            return os.path.basename(file_path), self._iter_plain(file_path)
+
+        digest, name = self.parse_file_path(file_path)
+        obj = db.get(ArchiveObject, digest)
+        if obj is None:
+            raise FileNotFoundError(file_path)
+        path = self.object_path(digest, obj.codec)
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        return name, self._iter_decompressed(path, obj.codec)
+
+    def verify(self, obj: ArchiveObject) -> bool:
+        """객체를 압축 해제하며 해시/크기 검증"""
+        path = self.object_path(obj.hash, obj.codec)
+        if not os.path.exists(path):
+            return False
+        hasher = hashlib.sha256()
+        size = 0
+        for chunk in self._iter_decompressed(path, obj.codec):
+            hasher.update(chunk)
+            size += len(chunk)
+        return hasher.hexdigest() == obj.hash and size == obj.size
+
+    @staticmethod
+    def add_refs(db: Session, objects: Dict[str, Dict], refs: Counter):
+        """
+        이번 업로드에서 기록된 LogFile 참조 수를 archive_objects에 반영 (한 번의 upsert)
+
+        Args:
+            objects: 해시별 archive_objects 행
+            refs: 해시별 새 참조 수
+        """
+        rows = [dict(objects[digest], refcount=count) for digest, count in refs.items() if count]
+        if not rows:
+            return
+        stmt = dialect_insert(db, ArchiveObject)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['hash'],
+            set_={'refcount': ArchiveObject.refcount + stmt.excluded.refcount}
+        )
+        db.execute(stmt, rows)
+
+    def _compress_stream(self, src, dst):
+        if self.codec == 'zstd':
+            zstandard.ZstdCompressor(level=3).copy_stream(src, dst, read_size=_READ_SIZE)
+            return
+        compressor = zlib.compressobj(6)
+        while True:
+            chunk = src.read(_READ_SIZE)
+            if not chunk:
+                break
+            dst.write(compressor.compress(chunk))
+        dst.write(compressor.flush())
+
+    @staticmethod
+    def _iter_plain(path: str) -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(_READ_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    @staticmethod
+    def _iter_decompressed(path: str, codec: str) -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            if codec == 'zstd':
+                if zstandard is None:
+                    raise RuntimeError("zstandard package is required to read zstd archives")
+                reader = zstandard.ZstdDecompressor().stream_reader(f)
+                while True:
+                    chunk = reader.read(_READ_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+                return
+
+            decompressor = zlib.decompressobj()
+            while True:
+                chunk = f.read(_READ_SIZE)
+                if not chunk:
+                    break
+                data = decompressor.decompress(chunk)
+                if data:
+                    yield data
+            tail = decompressor.flush()
+            if tail:
+                yield tail
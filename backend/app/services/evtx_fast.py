@@ -0,0 +1,228 @@
+import struct
+from typing import Dict, Iterator, Optional, Tuple
+
+
+EVENT_NAMESPACE = 'http://schemas.microsoft.com/win/2004/08/events/event'
+
+# 정수형 substitution 타입 (python-evtx NODE_TYPES) -> struct 포맷
+_INT_FORMATS = {
+    0x03: '<b',  # SignedByte
+    0x04: '<B',  # UnsignedByte
+    0x05: '<h',  # SignedWord
+    0x06: '<H',  # UnsignedWord
+    0x07: '<i',  # SignedDword
+    0x08: '<I',  # UnsignedDword
+    0x09: '<q',  # SignedQword
+    0x0A: '<Q',  # UnsignedQword
+}
+_NULL_TYPE = 0x00
+
+_TOKEN_STREAM_START = 0x0F
+_TOKEN_TEMPLATE_INSTANCE = 0x0C
+
+_unpack_dword = struct.Struct('<I').unpack_from
+_unpack_decl = struct.Struct('<HBx').unpack_from
+
+# 값 위치 명세: ('const', 값) 또는 ('sub', substitution index)
+ValueSpec = Tuple[str, int]
+
+
+class EvtxFastReader:
+    """
+    EVTX 레코드에서 Level과 EventID만 바로 읽는 고속 경로
+
+    레코드를 XML 문자열로 렌더링하고 ElementTree로 다시 파싱하는 대신,
+    템플릿 구조에서 System/Level, System/EventID 값이 어느 substitution에
+    들어 있는지를 템플릿당 한 번만 계산해 캐시하고, 레코드마다 해당
+    substitution 값만 바이너리에서 직접 읽는다.
+
+    값이 None이면 지원하지 않는 구조이므로 호출 측에서 기존 XML 경로로
+    처리해야 한다.
+    """
+
+    def __init__(self):
+        # 템플릿 절대 오프셋 -> (level 명세, event_id 명세) 또는 None(미지원)
+        self._layouts: Dict[int, Optional[Tuple[ValueSpec, ValueSpec]]] = {}
+
+    def iter_chunk(self, chunk) -> Iterator[Tuple[Optional[Tuple[int, int]], object]]:
+        """
+        청크의 레코드를 순서대로 읽어 ((level, event_id) 또는 None, record) 반환
+
+        python-evtx Record 객체 생성 비용을 피하기 위해 레코드 경계를 버퍼에서
+        직접 따라가며, Record는 fallback이 필요한 레코드에 대해서만 만든다.
+        (ChunkHeader.records()와 동일한 종료 조건 사용)
+        """
+        from Evtx.Evtx import Record, InvalidRecordException
+
+        buf = chunk._buf
+        chunk_offset = chunk.offset()
+        end = chunk_offset + chunk.next_record_offset()
+        ofs = chunk_offset + 0x200
+
+        while ofs < end:
+            size = _unpack_dword(buf, ofs + 4)[0]
+            if size > 0x10000 or size == 0:
+                return
+
+            values = self.read_at(buf, ofs, chunk)
+            if values is None:
+                try:
+                    yield None, Record(buf, ofs, chunk)
+                except InvalidRecordException:
+                    return
+            else:
+                yield values, None
+            ofs += size
+
+    def read(self, record) -> Optional[Tuple[int, int]]:
+        """레코드의 (level, event_id) 반환, 고속 경로로 읽을 수 없으면 None"""
+        return self.read_at(record._buf, record.offset(), record._chunk)
+
+    def read_at(self, buf, record_offset: int, chunk) -> Optional[Tuple[int, int]]:
+        try:
+            return self._read(buf, record_offset, chunk)
+        except Exception:
+            return None
+
+    def _read(self, buf, record_offset: int, chunk) -> Optional[Tuple[int, int]]:
+        chunk_offset = chunk._offset
+
+        # Root: [StreamStart] TemplateInstance [resident Template] Substitutions
+        ofs = record_offset + 0x18
+        if buf[ofs] & 0x0F == _TOKEN_STREAM_START:
+            ofs += 4
+        if buf[ofs] & 0x0F != _TOKEN_TEMPLATE_INSTANCE:
+            return None
+
+        template_offset = _unpack_dword(buf, ofs + 6)[0]
+        subs_offset = ofs + 10
+        if template_offset > ofs - chunk_offset:
+            # 레코드 내부에 정의된(resident) 템플릿: 템플릿 헤더 0x18 + 데이터 길이만큼 건너뜀
+            data_length = _unpack_dword(buf, chunk_offset + template_offset + 0x14)[0]
+            subs_offset += 0x18 + data_length
+
+        template_key = chunk_offset + template_offset
+        if template_key in self._layouts:
+            layout = self._layouts[template_key]
+        else:
+            layout = self._build_layout(buf, template_key, chunk)
+            self._layouts[template_key] = layout
+
+        if layout is None:
+            return None
+
+        level = self._resolve(buf, subs_offset, layout[0])
+        if level is None:
+            return None
+        event_id = self._resolve(buf, subs_offset, layout[1])
+        if event_id is None:
+            return None
+        return level, event_id
+
+    @staticmethod
+    def _resolve(buf, subs_offset: int, spec: ValueSpec) -> Optional[int]:
+        kind, value = spec
+        if kind == 'const':
+            return value
+
+        sub_count = _unpack_dword(buf, subs_offset)[0]
+        if value >= sub_count:
+            return None
+
+        # 선언부(size, type) 배열 다음에 값들이 순서대로 이어진다
+        value_offset = subs_offset + 4 + sub_count * 4
+        decl_offset = subs_offset + 4
+        for _ in range(value):
+            value_offset += _unpack_decl(buf, decl_offset)[0]
+            decl_offset += 4
+
+        size, type_ = _unpack_decl(buf, decl_offset)
+        if type_ == _NULL_TYPE:
+            return 0
+
+        fmt = _INT_FORMATS.get(type_)
+        if fmt is None or struct.calcsize(fmt) != size:
+            return None
+        return struct.unpack_from(fmt, buf, value_offset)[0]
+
+    @staticmethod
+    def _build_layout(buf, template_key: int, chunk) -> Optional[Tuple[ValueSpec, ValueSpec]]:
+        """템플릿 트리를 한 번 순회하여 Level/EventID 값 위치를 계산"""
+        from Evtx import Nodes as e_nodes
+
+        try:
+            template = e_nodes.TemplateNode(buf, template_key, chunk, chunk)
+            elements = [c for c in template.children() if isinstance(c, e_nodes.OpenStartElementNode)]
+            if len(elements) != 1:
+                return None
+
+            event = elements[0]
+            # XML 경로는 이벤트 네임스페이스 기준으로 System을 찾으므로 동일 조건을 요구
+            if not _has_event_namespace(event, e_nodes):
+                return None
+
+            system = _find_element(event, 'System', e_nodes)
+            if system is None:
+                return ('const', 0), ('const', 0)
+
+            level_spec = _value_spec(_child_element(system, 'Level', e_nodes), e_nodes)
+            event_id_spec = _value_spec(_child_element(system, 'EventID', e_nodes), e_nodes)
+            if level_spec is None or event_id_spec is None:
+                return None
+            return level_spec, event_id_spec
+        except Exception:
+            return None
+
+
+def _has_event_namespace(element, e_nodes) -> bool:
+    for child in element.children():
+        if isinstance(child, e_nodes.AttributeNode) and child.attribute_name().string() == 'xmlns':
+            value = child.attribute_value()
+            return isinstance(value, e_nodes.ValueNode) and value.value().string() == EVENT_NAMESPACE
+    return False
+
+
+def _find_element(element, name: str, e_nodes):
+    """하위 트리에서 이름이 일치하는 첫 요소 탐색 (ElementTree .// 와 동일한 순서)"""
+    for child in element.children():
+        if isinstance(child, e_nodes.OpenStartElementNode):
+            if child.tag_name() == name:
+                return child
+            found = _find_element(child, name, e_nodes)
+            if found is not None:
+                return found
+    return None
+
+
+def _child_element(element, name: str, e_nodes):
+    for child in element.children():
+        if isinstance(child, e_nodes.OpenStartElementNode) and child.tag_name() == name:
+            return child
+    return None
+
+
+def _value_spec(element, e_nodes) -> Optional[ValueSpec]:
+    """요소 텍스트가 어디서 오는지 판별 (XML 경로의 int(elem.text) 결과와 일치해야 함)"""
+    if element is None:
+        return 'const', 0
+
+    structural = (
+        e_nodes.AttributeNode,
+        e_nodes.CloseStartElementNode,
+        e_nodes.CloseEmptyElementNode,
+        e_nodes.CloseElementNode,
+    )
+    content = [c for c in element.children() if not isinstance(c, structural)]
+
+    if not content:
+        return 'const', 0
+    if len(content) != 1:
+        return None
+
+    node = content[0]
+    if isinstance(node, (e_nodes.NormalSubstitutionNode, e_nodes.ConditionalSubstitutionNode)):
+        return 'sub', node.index()
+    if isinstance(node, e_nodes.ValueNode):
+        text = node.value().string()
+        return 'const', int(text) if text else 0
+    return None
@@ -1,16 +1,39 @@
+import io
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union, IO
 from datetime import datetime
 import json
 import re
+import xml.etree.ElementTree as ET
+import zipfile
+import zlib
+from app.services.evtx_fast import EvtxFastReader, EVENT_NAMESPACE
+
+
+Source = Union[str, IO[bytes]]
+
+# ZIP 멤버 스트림을 읽다가 발생하는 압축 해제/CRC 오류
+# 일부만 읽은 결과를 정상 처리로 반환하지 않도록 호출 측으로 전파한다 (파일 오류로 집계)
+_STREAM_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError, OSError)
 
 
 class FileProcessor:
     """파일 타입별 처리 클래스"""
     
     @staticmethod
-    def process_txt_performance(file_path: str) -> List[Dict]:
+    def _open_text(source: Source):
+        """파일 경로 또는 바이너리 스트림(ZIP 멤버)을 텍스트 스트림으로 열기"""
+        if isinstance(source, str):
+            return open(source, 'r', encoding='utf-8', errors='ignore')
+        return io.TextIOWrapper(source, encoding='utf-8', errors='ignore')
+    
+    @staticmethod
+    def _source_name(source: Source) -> str:
+        return source if isinstance(source, str) else getattr(source, 'name', repr(source))
+    
+    @staticmethod
+    def process_txt_performance(source: Source) -> List[Dict]:
         """
         Case 1: 성능 데이터 (.txt in disk,task)
         Key: Value 형태 파싱
@@ -18,7 +41,7 @@ class FileProcessor:
         results = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with FileProcessor._open_text(source) as f:
                 for line in f:
                     line = line.strip()
                     if not line or ':' not in line:
@@ -35,18 +58,20 @@ class FileProcessor:
                             'raw_data': None
                         })
         except Exception as e:
-            print(f"Error processing performance file {file_path}: {e}")
+            if not isinstance(source, str) and isinstance(e, _STREAM_ERRORS):
+                raise
+            print(f"Error processing performance file {FileProcessor._source_name(source)}: {e}")
         
         return results
     
     @staticmethod
-    def process_txt_process(file_path: str) -> List[Dict]:
+    def process_txt_process(source: Source) -> List[Dict]:
         """
         Case 2: 프로세스 현황 데이터 (.txt in log,process)
         전체 텍스트를 raw_data에 저장
         """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with FileProcessor._open_text(source) as f:
                 content = f.read()
             
             return [{
@@ -55,18 +80,23 @@ class FileProcessor:
                 'raw_data': content
             }]
         except Exception as e:
-            print(f"Error processing process file {file_path}: {e}")
+            if not isinstance(source, str) and isinstance(e, _STREAM_ERRORS):
+                raise
+            print(f"Error processing process file {FileProcessor._source_name(source)}: {e}")
             return []
     
     @staticmethod
-    def process_evtx(file_path: str) -> List[Dict]:
+    def process_evtx(file_path: str, fast: bool = True) -> List[Dict]:
         """
         Case 3: EVTX 로그 파일 처리
         python-evtx를 사용하여 파싱
+        
+        fast=True이면 EvtxFastReader로 Level/EventID를 바이너리에서 직접 읽고,
+        고속 경로가 지원하지 않는 레코드만 XML 렌더링 경로로 처리한다.
         """
         try:
             from Evtx.Evtx import Evtx
-            from Evtx.Views import evtx_file_xml_view
+            from Evtx.Views import evtx_record_xml_view
             
             event_stats = {
                 'level_1': {},  # Critical
@@ -75,13 +105,24 @@ class FileProcessor:
             }
             
             total_count = 0
+            fast_reader = EvtxFastReader() if fast else None
             
             with Evtx(file_path) as evtx:
-                for record_xml, record in evtx_file_xml_view(evtx.get_file_header()):
-                    # XML 파싱하여 Level과 EventID 추출
-                    level, event_id = FileProcessor._parse_evtx_record(record_xml)
+                for chunk in evtx.get_file_header().chunks():
+                    if fast_reader:
+                        records = fast_reader.iter_chunk(chunk)
+                    else:
+                        records = ((None, record) for record in chunk.records())
                     
-                    if level in [1, 2, 3]:
+                    for values, record in records:
+                        if values is None:
+                            # XML 파싱하여 Level과 EventID 추출 (fallback)
+                            values = FileProcessor._parse_evtx_record(evtx_record_xml_view(record))
+                        level, event_id = values
+                        
+                        if level not in (1, 2, 3):
+                            continue
+                        
                         level_key = f'level_{level}'
                         event_key = f'EventID_{event_id}'
                         
@@ -116,11 +157,9 @@ class FileProcessor:
     @staticmethod
     def _parse_evtx_record(record_xml: str) -> tuple:
         """EVTX 레코드 XML에서 Level과 EventID 추출"""
-        import xml.etree.ElementTree as ET
-        
         try:
             root = ET.fromstring(record_xml)
-            ns = {'evt': 'http://schemas.microsoft.com/win/2004/08/events/event'}
+            ns = {'evt': EVENT_NAMESPACE}
             
             # System 섹션에서 Level과 EventID 추출
             system = root.find('.//evt:System', ns)
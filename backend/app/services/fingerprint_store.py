@@ -0,0 +1,84 @@
+from typing import Dict, List, Set, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from app.models import IngestedMember
+from app.services.zip_parser import ZipParser, HashingStream
+
+
+# (ZIP 내부 경로, CRC-32, 압축 해제 크기)
+MemberKey = Tuple[str, int, int]
+
+_IN_CHUNK = 1000
+
+
+def member_key(file_info: Dict) -> MemberKey:
+    return file_info['file_path'], file_info['crc32'], file_info['file_size']
+
+
+class MemberFingerprintStore:
+    """
+    적재된 ZIP 멤버 지문 저장소
+
+    Central Directory의 (경로, CRC-32, 크기)로 후보를 한 번의 집합 쿼리로 찾고,
+    후보 멤버만 내용 SHA-256을 계산해 저장된 해시와 비교한다.
+    후보가 아닌 멤버는 해시 계산 없이 곧바로 신규로 처리된다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_candidates(self, parsed_files: List[Dict]) -> Dict[MemberKey, Set[str]]:
+        """(경로, CRC, 크기)가 일치하는 기존 지문의 해시 목록"""
+        keys = sorted({member_key(f) for f in parsed_files})
+        columns = (IngestedMember.file_path, IngestedMember.crc32, IngestedMember.file_size)
+
+        candidates: Dict[MemberKey, Set[str]] = {}
+        for i in range(0, len(keys), _IN_CHUNK):
+            rows = self.db.execute(
+                select(*columns, IngestedMember.content_hash)
+                .where(tuple_(*columns).in_(keys[i:i + _IN_CHUNK]))
+            )
+            for file_path, crc32, file_size, content_hash in rows:
+                candidates.setdefault((file_path, crc32, file_size), set()).add(content_hash)
+        return candidates
+
+    def filter_new(self, zip_parser: ZipParser, parsed_files: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        이미 적재된 멤버를 제외한 파일 목록과 제외된 수 반환
+
+        후보 멤버는 파싱/추출 없이 내용 해시만 계산한다 (ZIP은 한 번만 연다).
+        열거나 읽을 수 없는 멤버(CRC 오류 등)는 zip_parser.failed_members에 기록하고 파싱 대상에서도
+        제외하여, 업로드 전체를 중단하지 않고 오류로 한 번만 집계되게 한다.
+        """
+        candidates = self.find_candidates(parsed_files)
+        if not candidates:
+            return parsed_files, 0
+
+        to_verify = [f for f in parsed_files if member_key(f) in candidates]
+        duplicates = set()
+        for file_info, stream in zip_parser.iter_members(to_verify):
+            try:
+                content_hash = HashingStream(stream).hexdigest()
+            except Exception as e:
+                print(f"Error reading ZIP member {file_info['file_path']}: {e}")
+                zip_parser.failed_members.add(file_info['file_path'])
+                continue
+            if content_hash in candidates[member_key(file_info)]:
+                duplicates.add(file_info['file_path'])
+
+        new_files = [
+            f for f in parsed_files
+            if f['file_path'] not in duplicates and f['file_path'] not in zip_parser.failed_members
+        ]
+        return new_files, len(duplicates)
+
+    @staticmethod
+    def row(file_info: Dict, content_hash: str, log_id: int) -> Dict:
+        """BulkWriter로 기록할 지문 행"""
+        return {
+            'file_path': file_info['file_path'],
+            'crc32': file_info['crc32'],
+            'file_size': file_info['file_size'],
+            'content_hash': content_hash,
+            'log_id': log_id
+        }
@@ -0,0 +1,122 @@
+import threading
+from typing import Dict, List, Tuple
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from app.core.database import dialect_insert
+from app.models import Asset, System, Location, HierarchyVersion
+
+
+# 계층 구조에 영향을 주는 모델 (자산은 노드별 자산 수에 반영)
+_WATCHED_MODELS = (System, Location, Asset)
+
+# 계층 종류별 (모델, 자산 FK 컬럼)
+_HIERARCHIES = {
+    'system': (System, Asset.system_id),
+    'location': (Location, Asset.location_id),
+}
+
+VERSION_ID = 1
+
+_lock = threading.Lock()
+_cache: Dict[str, Tuple[int, List[Dict]]] = {}
+
+
+def hierarchy_version(db: Session) -> int:
+    """DB에 기록된 계층 트리 버전 (기본키 조회 1회)"""
+    return db.execute(select(HierarchyVersion.version).where(HierarchyVersion.id == VERSION_ID)).scalar() or 0
+
+
+def _bump_statement(db: Session):
+    stmt = dialect_insert(db, HierarchyVersion).values(id=VERSION_ID, version=1)
+    return stmt.on_conflict_do_update(index_elements=['id'], set_={'version': HierarchyVersion.version + 1})
+
+
+def mark_hierarchy_changed(db: Session):
+    """
+    계층 트리 캐시 무효화 (DB 버전 증가, 커밋은 호출 측에서 수행)
+
+    ORM 세션으로 변경된 System/Location/Asset은 flush 시 자동으로 증가하며,
+    Core INSERT 등 ORM을 거치지 않는 변경은 같은 트랜잭션에서 직접 호출해야 한다.
+    버전은 변경과 함께 커밋되므로 다른 프로세스의 캐시도 다음 조회에서 무효화된다.
+    """
+    db.execute(_bump_statement(db))
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_hierarchy_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _WATCHED_MODELS):
+            # flush 중에는 session.execute 대신 현재 트랜잭션의 연결로 실행
+            session.connection().execute(_bump_statement(session))
+            return
+
+
+class HierarchyService:
+    """설비/위치 계층 트리 서비스"""
+    
+    @staticmethod
+    def get_tree(db: Session, kind: str = 'system') -> List[Dict]:
+        """
+        계층 트리 조회 (프로세스 내 캐시, DB 버전이 바뀌면 재구성)
+
+        Args:
+            kind: 'system' (설비 계층) 또는 'location' (위치 계층)
+        """
+        # 버전을 트리보다 먼저 읽으므로, 구성 중에 커밋된 변경은 다음 요청에서 다시 구성된다
+        version = hierarchy_version(db)
+        cached = _cache.get(kind)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        tree = HierarchyService.build_tree(db, kind)
+        with _lock:
+            _cache[kind] = (version, tree)
+        return tree
+    
+    @staticmethod
+    def build_tree(db: Session, kind: str = 'system') -> List[Dict]:
+        """
+        계층 전체를 한 번의 쿼리로 읽어 메모리에서 O(n)으로 트리 구성
+
+        노드별 직접 소속 자산 수(asset_count)는 같은 쿼리의 LEFT JOIN 집계로 구하고,
+        하위 노드를 포함한 자산 수(total_asset_count)는 트리 구성 후 합산한다.
+        """
+        model, asset_fk = _HIERARCHIES[kind]
+
+        rows = db.execute(
+            select(model.id, model.name, model.parent_id, model.description, func.count(Asset.id))
+            .outerjoin(Asset, asset_fk == model.id)
+            .group_by(model.id)
+            .order_by(model.id)
+        ).all()
+
+        nodes = {}
+        for node_id, name, parent_id, description, asset_count in rows:
+            nodes[node_id] = {
+                "id": node_id,
+                "name": name,
+                "description": description,
+                "asset_count": asset_count,
+                "total_asset_count": asset_count,
+                "children": []
+            }
+
+        roots = []
+        for node_id, _, parent_id, _, _ in rows:
+            parent = nodes.get(parent_id)
+            if parent is None:
+                roots.append(nodes[node_id])
+            else:
+                parent["children"].append(nodes[node_id])
+
+        # 하위 자산 수 합산 (재귀 없이 후위 순회)
+        stack = [(node, False) for node in roots]
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                node["total_asset_count"] += sum(child["total_asset_count"] for child in node["children"])
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node["children"])
+
+        return roots
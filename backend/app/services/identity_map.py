@@ -0,0 +1,136 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from app.core.database import dialect_insert
+from app.models import Asset, MaintenanceLog
+from app.models.asset import AssetStatus
+from app.models.maintenance import CheckType, ResultStatus
+
+
+# (자산명, 점검일, 점검유형)
+LogKey = Tuple[str, date, CheckType]
+
+# IN 목록 하나에 넣을 최대 키 수 (바인드 파라미터 한도 대비)
+_IN_CHUNK = 1000
+
+
+def _chunks(items: List, size: int = _IN_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class IngestIdentityMap:
+    """
+    업로드 단위 자산/점검 이력 식별자 캐시
+
+    업로드에서 참조하는 자산명과 점검 이력 자연키를 집합 단위 쿼리로 한 번에
+    조회하고, 없는 행은 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 생성한다.
+    동시 업로드가 같은 행을 먼저 만든 경우(RETURNING에 없는 키)는 재조회한다.
+    이후 파일별 처리에서는 DB 왕복 없이 id를 조회한다.
+    """
+
+    def __init__(self, db: Session, worker: str = None):
+        self.db = db
+        self.worker = worker
+        self.asset_ids: Dict[str, int] = {}
+        self.log_ids: Dict[Tuple[int, date, CheckType], int] = {}
+        self.assets_found = 0
+        self.assets_created = 0
+        self.logs_found = 0
+        self.logs_created = 0
+        self.created_logs: List[Tuple[int, date, CheckType]] = []
+
+    def preload(self, log_keys: Iterable[LogKey]):
+        """참조되는 자산과 점검 이력을 조회/생성하여 캐시"""
+        log_keys = set(log_keys)
+        self._load_assets({name for name, _, _ in log_keys})
+        self._load_logs({
+            (self.asset_ids[name], check_date, check_type)
+            for name, check_date, check_type in log_keys
+        })
+
+    def asset_id(self, asset_name: str) -> int:
+        return self.asset_ids[asset_name]
+
+    def log_id(self, asset_name: str, check_date: date, check_type: CheckType) -> Optional[int]:
+        return self.log_ids.get((self.asset_ids[asset_name], check_date, check_type))
+
+    def _load_assets(self, names: Set[str]):
+        names = sorted(names - self.asset_ids.keys())
+        if not names:
+            return
+
+        found = self._select_assets(names)
+        self.assets_found += len(found)
+
+        missing = [name for name in names if name not in found]
+        if missing:
+            for chunk in _chunks(missing):
+                stmt = dialect_insert(self.db, Asset).values([
+                    {'name': name, 'status': AssetStatus.OPERATIONAL} for name in chunk
+                ]).on_conflict_do_nothing(index_elements=['name']).returning(Asset.id, Asset.name)
+                created = {name: asset_id for asset_id, name in self.db.execute(stmt)}
+                self.assets_created += len(created)
+                found.update(created)
+
+            # 다른 업로드가 먼저 생성한 자산
+            raced = [name for name in missing if name not in found]
+            if raced:
+                found.update(self._select_assets(raced))
+
+        self.asset_ids.update(found)
+
+    def _select_assets(self, names: List[str]) -> Dict[str, int]:
+        found = {}
+        for chunk in _chunks(names):
+            rows = self.db.execute(select(Asset.id, Asset.name).where(Asset.name.in_(chunk)))
+            found.update({name: asset_id for asset_id, name in rows})
+        return found
+
+    def _load_logs(self, keys: Set[Tuple[int, date, CheckType]]):
+        keys = sorted(keys - self.log_ids.keys(), key=lambda k: (k[0], k[1], k[2].value))
+        if not keys:
+            return
+
+        found = self._select_logs(keys)
+        self.logs_found += len(found)
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            for chunk in _chunks(missing):
+                stmt = dialect_insert(self.db, MaintenanceLog).values([
+                    {
+                        'asset_id': asset_id,
+                        'check_date': check_date,
+                        'check_type': check_type,
+                        'worker': self.worker,
+                        'result_status': ResultStatus.PASS
+                    }
+                    for asset_id, check_date, check_type in chunk
+                ]).on_conflict_do_nothing(
+                    index_elements=['asset_id', 'check_date', 'check_type']
+                ).returning(
+                    MaintenanceLog.id, MaintenanceLog.asset_id,
+                    MaintenanceLog.check_date, MaintenanceLog.check_type
+                )
+                created = {(a, d, t): log_id for log_id, a, d, t in self.db.execute(stmt)}
+                self.logs_created += len(created)
+                self.created_logs.extend(created)
+                found.update(created)
+
+            raced = [key for key in missing if key not in found]
+            if raced:
+                found.update(self._select_logs(raced))
+
+        self.log_ids.update(found)
+
+    def _select_logs(self, keys: List[Tuple[int, date, CheckType]]) -> Dict[Tuple[int, date, CheckType], int]:
+        found = {}
+        columns = (MaintenanceLog.asset_id, MaintenanceLog.check_date, MaintenanceLog.check_type)
+        for chunk in _chunks(keys):
+            rows = self.db.execute(
+                select(MaintenanceLog.id, *columns).where(tuple_(*columns).in_(chunk))
+            )
+            found.update({(a, d, t): log_id for log_id, a, d, t in rows})
+        return found
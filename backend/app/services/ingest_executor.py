@@ -0,0 +1,33 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.upload_service import UploadService
+
+# 업로드 처리 전용 스레드 풀 (동시 처리 수 제한, 초과 요청은 대기열에서 순서대로 처리)
+# Starlette 기본 스레드 풀과 분리하여 긴 업로드가 동기 엔드포인트(대시보드 등)의 스레드를 점유하지 않게 한다.
+_executor = ThreadPoolExecutor(max_workers=settings.INGEST_CONCURRENCY, thread_name_prefix="ingest")
+
+
+def ingest_zip(zip_path: str, worker: str = None, progress: Optional[Callable[[Dict], None]] = None,
+               before_commit: Optional[Callable[[Session], None]] = None) -> Dict:
+    """ZIP 1건 처리 - 호출 스레드/프로세스 전용 세션 사용 (요청 세션과 분리)"""
+    db = SessionLocal()
+    try:
+        return UploadService(db).process_upload(zip_path, worker, progress, before_commit)
+    finally:
+        db.close()
+
+
+async def run_ingest(zip_path: str, worker: str = None,
+                     progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """ZIP 파싱/DB 적재를 이벤트 루프 밖에서 실행하고 결과를 기다림"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, ingest_zip, zip_path, worker, progress)
+
+
+def shutdown_ingest_executor():
+    """진행 중인 업로드가 끝날 때까지 대기 후 종료"""
+    _executor.shutdown(wait=True)
@@ -0,0 +1,303 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.jobs import IngestJob, JobStatus
+
+
+class JobNotFound(Exception):
+    """존재하지 않는 작업"""
+
+
+class JobStateError(Exception):
+    """현재 상태에서 허용되지 않는 요청 (처리 중인 작업 삭제 등)"""
+
+
+class LeaseLostError(Exception):
+    """임대가 만료되어 다른 워커가 회수한 작업 (적재 트랜잭션을 커밋하지 않고 버림)"""
+
+
+def _job_to_dict(job: IngestJob) -> Dict:
+    return {
+        'id': job.id,
+        'status': job.status.value,
+        'file_path': job.file_path,
+        'filename': job.filename,
+        'file_size': job.file_size,
+        'sha256': job.sha256,
+        'worker': job.worker,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'available_at': job.available_at,
+        'locked_by': job.locked_by,
+        'lease_expires_at': job.lease_expires_at,
+        'progress': job.progress,
+        'stats': job.stats,
+        'error': job.error,
+        'created_at': job.created_at,
+        'started_at': job.started_at,
+        'finished_at': job.finished_at
+    }
+
+
+class IngestQueue:
+    """
+    ZIP 적재 작업 대기열 (ingest_jobs 테이블)
+
+    업로드 요청은 수신 파일을 UPLOAD_DIR/queue/로 옮기고 작업만 등록한다.
+    워커(python -m app.cli ingest-worker)는 여러 프로세스/호스트에서 동시에 실행할 수 있으며,
+    SELECT ... FOR UPDATE SKIP LOCKED로 서로 다른 작업을 선점한다. 처리 중에는 하트비트로
+    임대(lease)를 연장하고, 워커가 죽어 임대가 만료된 작업은 다른 워커가 다시 대기열로 돌린다.
+
+    시각은 모두 DB 서버 시각 기준이므로 호스트 간 시계 차이의 영향을 받지 않는다.
+    여러 호스트에서 워커를 실행하려면 UPLOAD_DIR/queue가 공유 스토리지여야 한다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def queue_dir() -> str:
+        return os.path.join(settings.UPLOAD_DIR, "queue")
+
+    def _now(self) -> datetime:
+        """DB 서버 현재 시각 (timestamp without time zone 컬럼과 비교하도록 naive로 변환)"""
+        now = self.db.execute(select(func.now())).scalar()
+        return now.replace(tzinfo=None)
+
+    def enqueue(self, source_path: str, filename: str = None, file_size: int = None,
+                sha256: str = None, worker: str = None) -> Dict:
+        """
+        수신 완료된 ZIP을 대기열 디렉토리로 옮기고 작업 등록
+
+        Returns:
+            Dict: 등록된 작업
+        """
+        os.makedirs(self.queue_dir(), exist_ok=True)
+        file_path = os.path.join(self.queue_dir(), f"{uuid.uuid4().hex}.zip")
+        os.replace(source_path, file_path)
+
+        try:
+            job = IngestJob(
+                status=JobStatus.QUEUED,
+                file_path=file_path,
+                filename=filename,
+                file_size=file_size,
+                sha256=sha256,
+                worker=worker,
+                attempts=0,
+                max_attempts=settings.JOB_MAX_ATTEMPTS,
+                available_at=self._now()
+            )
+            self.db.add(job)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            os.remove(file_path)
+            raise
+        return _job_to_dict(job)
+
+    def claim(self, owner: str) -> Optional[Dict]:
+        """
+        처리할 작업 1건 선점 (없으면 None)
+
+        다른 워커가 잠근 행은 건너뛰므로 워커 수만큼 서로 다른 작업이 동시에 처리된다.
+        UPDATE 조건에 상태/시도 횟수를 다시 확인하여 행 잠금이 없는 SQLite에서도 중복 선점을 막는다.
+        """
+        now = self._now()
+        row = self.db.execute(
+            select(IngestJob.id, IngestJob.attempts)
+            .where(IngestJob.status == JobStatus.QUEUED, IngestJob.available_at <= now)
+            .order_by(IngestJob.available_at, IngestJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).first()
+        if row is None:
+            self.db.rollback()
+            return None
+
+        result = self.db.execute(
+            update(IngestJob)
+            .where(IngestJob.id == row.id, IngestJob.status == JobStatus.QUEUED,
+                   IngestJob.attempts == row.attempts)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=row.attempts + 1,
+                locked_by=owner,
+                lease_expires_at=now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                started_at=now,
+                progress=None
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        if result.rowcount != 1:
+            return None
+        return self.get(row.id)
+
+    def _update_owned(self, job_id: int, owner: str, **values) -> bool:
+        """owner가 임대 중인 작업만 갱신 (임대가 만료되어 다른 워커로 넘어간 경우 False)"""
+        result = self.db.execute(
+            update(IngestJob)
+            .where(IngestJob.id == job_id, IngestJob.locked_by == owner,
+                   IngestJob.status == JobStatus.RUNNING)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def heartbeat(self, job_id: int, owner: str, progress: Dict = None) -> bool:
+        """임대 연장 (마지막 진행 이벤트도 함께 기록)"""
+        values = {'lease_expires_at': self._now() + timedelta(seconds=settings.JOB_LEASE_SECONDS)}
+        if progress is not None:
+            values['progress'] = progress
+        return self._update_owned(job_id, owner, **values)
+
+    def hold_lease(self, job_id: int, owner: str):
+        """
+        적재 트랜잭션 안에서 임대를 연장하고 작업 행을 잠금 (커밋 직전 호출, 커밋은 호출 측에서 수행)
+
+        행 잠금은 커밋까지 유지되므로 그 사이 다른 워커가 임대 만료로 회수할 수 없고,
+        이미 회수된 작업이면 LeaseLostError로 적재 결과를 커밋하지 않게 한다.
+        """
+        result = self.db.execute(
+            update(IngestJob)
+            .where(IngestJob.id == job_id, IngestJob.locked_by == owner,
+                   IngestJob.status == JobStatus.RUNNING)
+            .values(lease_expires_at=self._now() + timedelta(seconds=settings.JOB_LEASE_SECONDS))
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise LeaseLostError(f"Lost lease on ingest job {job_id}")
+
+    def complete(self, job_id: int, owner: str, stats: Dict) -> bool:
+        """처리 완료 기록 후 대기열 파일 삭제"""
+        job = self.db.get(IngestJob, job_id)
+        file_path = job.file_path if job else None
+        done = self._update_owned(
+            job_id, owner,
+            status=JobStatus.SUCCEEDED,
+            stats=stats,
+            error=None,
+            locked_by=None,
+            lease_expires_at=None,
+            finished_at=self._now()
+        )
+        if done and file_path and os.path.exists(file_path):
+            os.remove(file_path)
+        return done
+
+    def fail(self, job_id: int, owner: str, error: str, retry: bool = True) -> Optional[str]:
+        """
+        처리 실패 기록
+
+        시도 횟수가 남아 있으면 지수 backoff 후 다시 대기열로, 아니면 failed로 둔다
+        (파일은 retry 요청에 대비해 남겨 둠).
+
+        Returns:
+            Optional[str]: 변경된 상태 (임대를 잃었으면 None)
+        """
+        job = self.db.get(IngestJob, job_id)
+        if job is None:
+            return None
+        now = self._now()
+        if retry and job.attempts < job.max_attempts:
+            delay = min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1), settings.JOB_RETRY_MAX_SECONDS)
+            values = {'status': JobStatus.QUEUED, 'available_at': now + timedelta(seconds=delay)}
+        else:
+            values = {'status': JobStatus.FAILED, 'finished_at': now}
+
+        done = self._update_owned(job_id, owner, error=error, locked_by=None, lease_expires_at=None, **values)
+        return values['status'].value if done else None
+
+    def recover_expired(self) -> int:
+        """
+        임대가 만료된 작업(워커 프로세스/호스트 중단) 회수
+
+        시도 횟수가 남은 작업은 바로 대기열로, 소진된 작업은 failed로 바꾼다.
+        여러 워커가 동시에 실행해도 행 단위 UPDATE 조건으로 한 번만 반영된다.
+        """
+        now = self._now()
+        expired = (IngestJob.status == JobStatus.RUNNING, IngestJob.lease_expires_at < now)
+        released = {'locked_by': None, 'lease_expires_at': None}
+
+        exhausted = self.db.execute(
+            update(IngestJob)
+            .where(*expired, IngestJob.attempts >= IngestJob.max_attempts)
+            .values(status=JobStatus.FAILED, finished_at=now,
+                    error="Lease expired (worker stopped) and no attempts left", **released)
+            .execution_options(synchronize_session=False)
+        )
+        requeued = self.db.execute(
+            update(IngestJob)
+            .where(*expired)
+            .values(status=JobStatus.QUEUED, available_at=now,
+                    error="Lease expired (worker stopped), requeued", **released)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return exhausted.rowcount + requeued.rowcount
+
+    def get(self, job_id: int) -> Dict:
+        job = self.db.get(IngestJob, job_id)
+        if job is None:
+            raise JobNotFound(f"Job not found: {job_id}")
+        return _job_to_dict(job)
+
+    def list(self, status: Optional[JobStatus] = None, before_id: Optional[int] = None,
+             limit: int = 100) -> List[Dict]:
+        """작업 목록 (최신순)"""
+        query = select(IngestJob).order_by(IngestJob.id.desc()).limit(limit)
+        if status is not None:
+            query = query.where(IngestJob.status == status)
+        if before_id is not None:
+            query = query.where(IngestJob.id < before_id)
+        return [_job_to_dict(job) for job in self.db.execute(query).scalars()]
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = self.db.execute(
+            select(IngestJob.status, func.count()).group_by(IngestJob.status)
+        ).all()
+        counts = {status.value: 0 for status in JobStatus}
+        counts.update({status.value: count for status, count in rows})
+        return counts
+
+    def retry(self, job_id: int) -> Dict:
+        """실패한 작업을 시도 횟수를 초기화하여 다시 대기열로"""
+        job = self.db.get(IngestJob, job_id)
+        if job is None:
+            raise JobNotFound(f"Job not found: {job_id}")
+        if job.status != JobStatus.FAILED:
+            raise JobStateError(f"Only failed jobs can be retried (status: {job.status.value})")
+        if not os.path.exists(job.file_path):
+            raise JobStateError("Queued file no longer exists")
+
+        job.status = JobStatus.QUEUED
+        job.attempts = 0
+        job.available_at = self._now()
+        job.finished_at = None
+        self.db.commit()
+        return _job_to_dict(job)
+
+    def delete(self, job_id: int):
+        """대기/실패/완료 작업 삭제 (대기열 파일 포함) - 처리 중인 작업은 삭제 불가"""
+        job = self.db.get(IngestJob, job_id)
+        if job is None:
+            raise JobNotFound(f"Job not found: {job_id}")
+        file_path = job.file_path
+
+        # 삭제 중 워커가 선점하지 않도록 상태 조건으로 삭제
+        result = self.db.execute(
+            IngestJob.__table__.delete()
+            .where(IngestJob.id == job_id, IngestJob.status != JobStatus.RUNNING)
+        )
+        self.db.commit()
+        if result.rowcount != 1:
+            raise JobStateError("Running jobs cannot be deleted")
+        if os.path.exists(file_path):
+            os.remove(file_path)
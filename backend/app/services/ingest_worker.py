@@ -0,0 +1,196 @@
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import zipfile
+from typing import Dict, Optional
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.services.ingest_executor import ingest_zip
+from app.services.ingest_queue import IngestQueue, LeaseLostError
+
+# 하트비트에 함께 기록하는 진행 이벤트 종류 (파일 단위 이벤트는 기록하지 않음)
+_PROGRESS_EVENTS = ('started', 'progress')
+
+
+def default_worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _LeaseKeeper(threading.Thread):
+    """처리 중인 작업의 임대 연장 (JOB_LEASE_SECONDS의 1/3 주기) 및 진행률 기록"""
+
+    def __init__(self, job_id: int, owner: str):
+        super().__init__(name=f"lease-{job_id}", daemon=True)
+        self.job_id = job_id
+        self.owner = owner
+        self.latest: Optional[Dict] = None
+        self.lost = False
+        self._done = threading.Event()
+
+    def on_progress(self, event: Dict):
+        """
+        UploadService 진행 콜백 - 마지막 이벤트만 보관했다가 하트비트 때 기록
+
+        임대를 잃었으면 LeaseLostError로 적재를 중단시켜 트랜잭션을 롤백한다
+        (다른 워커가 같은 ZIP을 다시 처리하므로 이 워커의 결과는 커밋하지 않음).
+        """
+        if self.lost:
+            raise LeaseLostError(f"Lost lease on ingest job {self.job_id}")
+        if event.get('event') in _PROGRESS_EVENTS:
+            self.latest = event
+
+    def run(self):
+        interval = max(settings.JOB_LEASE_SECONDS / 3, 1)
+        while not self._done.wait(interval):
+            db = SessionLocal()
+            try:
+                if not IngestQueue(db).heartbeat(self.job_id, self.owner, self.latest):
+                    # 임대 만료 후 다른 워커가 회수한 경우 - 다음 진행 콜백에서 적재를 중단
+                    print(f"Lost lease on ingest job {self.job_id}")
+                    self.lost = True
+                    return
+            except Exception as e:
+                print(f"Error renewing lease on ingest job {self.job_id}: {e}")
+            finally:
+                db.close()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+class IngestWorker:
+    """
+    ingest_jobs 대기열 처리 루프
+
+    작업을 1건씩 선점하여 UploadService로 처리하고 결과를 기록한다.
+    stop() 이후에는 처리 중인 작업까지만 끝내고 종료한다.
+    """
+
+    def __init__(self, name: str = None, poll_interval: float = None):
+        self.name = name or default_worker_name()
+        self.poll_interval = poll_interval if poll_interval is not None else settings.JOB_POLL_SECONDS
+        self._stopping = threading.Event()
+
+    def stop(self, *_):
+        self._stopping.set()
+
+    def run(self, once: bool = False) -> int:
+        """
+        작업 처리 루프
+
+        Args:
+            once: True이면 처리 가능한 작업이 없을 때 종료 (대기열 비우기)
+
+        Returns:
+            int: 처리한 작업 수
+        """
+        handled = 0
+        while not self._stopping.is_set():
+            db = SessionLocal()
+            try:
+                queue = IngestQueue(db)
+                recovered = queue.recover_expired()
+                if recovered:
+                    print(f"[{self.name}] recovered {recovered} job(s) with expired lease", flush=True)
+                job = queue.claim(self.name)
+            except Exception as e:
+                print(f"[{self.name}] Error claiming ingest job: {e}", flush=True)
+                job = None
+            finally:
+                db.close()
+
+            if job is None:
+                if once:
+                    break
+                self._stopping.wait(self.poll_interval)
+                continue
+
+            self.process(job)
+            handled += 1
+        return handled
+
+    def process(self, job: Dict):
+        print(f"[{self.name}] job {job['id']} started (attempt {job['attempts']}/{job['max_attempts']}) "
+              f"{job['filename']}", flush=True)
+        keeper = _LeaseKeeper(job['id'], self.name)
+        keeper.start()
+        stats = error = None
+        retry = True
+        try:
+            # 커밋 직전 같은 트랜잭션에서 임대를 다시 확인하고 행을 잠가 커밋까지 회수되지 않게 함
+            stats = ingest_zip(job['file_path'], job['worker'], keeper.on_progress,
+                               lambda db: IngestQueue(db).hold_lease(job['id'], self.name))
+        except LeaseLostError as e:
+            # 적재는 롤백됨 - 작업은 이미 다른 워커 소유이므로 결과를 기록하지 않음
+            print(f"[{self.name}] job {job['id']} abandoned: {e}", flush=True)
+            return
+        except (FileNotFoundError, zipfile.BadZipFile) as e:
+            # 대기열 파일이 없거나 손상된 경우 재시도해도 같은 결과
+            error, retry = str(e), False
+        except Exception as e:
+            error = str(e)
+        finally:
+            keeper.stop()
+
+        db = SessionLocal()
+        try:
+            queue = IngestQueue(db)
+            if error is None:
+                if queue.complete(job['id'], self.name, stats):
+                    print(f"[{self.name}] job {job['id']} succeeded: files={stats['total_files']} "
+                          f"processed={stats['processed']} errors={stats['errors']}", flush=True)
+                return
+            status = queue.fail(job['id'], self.name, error, retry)
+            print(f"[{self.name}] job {job['id']} failed ({status or 'lease lost'}): {error}", flush=True)
+        except Exception as e:
+            print(f"[{self.name}] Error recording result of ingest job {job['id']}: {e}", flush=True)
+        finally:
+            db.close()
+
+
+def _worker_process(once: bool, poll_interval: float):
+    # fork로 복제된 커넥션 풀은 부모와 공유되므로 버리고 새로 연결
+    engine.dispose(close=False)
+    worker = IngestWorker(poll_interval=poll_interval)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run(once)
+
+
+def run_workers(processes: int = 1, once: bool = False, poll_interval: float = None) -> int:
+    """
+    워커 프로세스 실행 (SIGTERM/Ctrl+C: 처리 중인 작업을 끝낸 뒤 종료)
+
+    processes가 1이면 현재 프로세스에서 실행한다. 여러 호스트에서 각각 실행해도 된다.
+
+    Returns:
+        int: 처리한 작업 수 (processes가 1일 때만 집계, 그 외 0)
+    """
+    if processes <= 1:
+        worker = IngestWorker(poll_interval=poll_interval)
+        signal.signal(signal.SIGTERM, worker.stop)
+        signal.signal(signal.SIGINT, worker.stop)
+        return worker.run(once)
+
+    children = [
+        multiprocessing.Process(target=_worker_process, args=(once, poll_interval), name=f"ingest-worker-{n}")
+        for n in range(processes)
+    ]
+    for child in children:
+        child.start()
+
+    def forward(signum, _frame):
+        # Ctrl+C는 프로세스 그룹 전체에 전달되므로 SIGTERM만 자식에게 전달
+        if signum == signal.SIGTERM:
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    for child in children:
+        child.join()
+    return 0
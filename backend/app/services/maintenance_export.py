@@ -0,0 +1,126 @@
+import csv
+import io
+from datetime import date
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import select, func
+from app.core.database import SessionLocal
+from app.models import MaintenanceLog, MaintenanceDetail, LogFile, Asset, System, Location
+from app.services.xlsx_stream import stream_xlsx
+
+# DB 커서로 한 번에 가져오는 행 수 / CSV 출력 버퍼 단위 행 수
+EXPORT_FETCH_SIZE = 2000
+CSV_FLUSH_ROWS = 1000
+
+EXPORT_COLUMNS = (
+    'log_id', 'check_date', 'check_type', 'result_status', 'worker',
+    'asset_id', 'asset_tag', 'asset_name', 'system', 'location',
+    'detail_id', 'item_name', 'value', 'evidence_files'
+)
+
+
+class MaintenanceExport:
+    """
+    점검 이력 전체 추출 (점검 상세 1건 = 1행, 상세가 없는 이력도 1행)
+
+    자산/설비/위치 이름과 증빙 파일 목록은 하나의 JOIN 쿼리로 가져오고, 서버 측 커서(yield_per)로
+    읽은 행을 바로 CSV/XLSX로 직렬화하므로 행 수와 관계없이 메모리 사용량이 일정하다.
+    raw_data는 포함하지 않는다 (detail_id로 /api/maintenance/details/{id}/raw 조회).
+    """
+
+    def __init__(self, asset_ids: Optional[List[int]] = None, start_date: Optional[date] = None,
+                 end_date: Optional[date] = None, check_type=None):
+        self.asset_ids = asset_ids
+        self.start_date = start_date
+        self.end_date = end_date
+        self.check_type = check_type
+
+    def query(self):
+        # 이력별 증빙 파일 경로 (상세 행마다 조회하지 않도록 log_id 단위로 한 번 집계)
+        files = (
+            select(LogFile.log_id, func.aggregate_strings(LogFile.file_path, '\n').label('paths'))
+            .group_by(LogFile.log_id)
+            .subquery()
+        )
+        query = (
+            select(
+                MaintenanceLog.id.label('log_id'),
+                MaintenanceLog.check_date,
+                MaintenanceLog.check_type,
+                MaintenanceLog.result_status,
+                MaintenanceLog.worker,
+                Asset.id.label('asset_id'),
+                Asset.asset_tag,
+                Asset.name.label('asset_name'),
+                System.name.label('system'),
+                Location.name.label('location'),
+                MaintenanceDetail.id.label('detail_id'),
+                MaintenanceDetail.item_name,
+                MaintenanceDetail.value,
+                files.c.paths
+            )
+            .join(Asset, Asset.id == MaintenanceLog.asset_id)
+            .outerjoin(System, System.id == Asset.system_id)
+            .outerjoin(Location, Location.id == Asset.location_id)
+            .outerjoin(MaintenanceDetail, MaintenanceDetail.log_id == MaintenanceLog.id)
+            .outerjoin(files, files.c.log_id == MaintenanceLog.id)
+        )
+
+        if self.asset_ids:
+            query = query.where(MaintenanceLog.asset_id.in_(self.asset_ids))
+        if self.start_date:
+            query = query.where(MaintenanceLog.check_date >= self.start_date)
+        if self.end_date:
+            query = query.where(MaintenanceLog.check_date <= self.end_date)
+        if self.check_type:
+            query = query.where(MaintenanceLog.check_type == self.check_type)
+
+        return query.order_by(MaintenanceLog.check_date, MaintenanceLog.id, MaintenanceDetail.id)
+
+    def rows(self) -> Iterator[Tuple]:
+        """내보낼 행 (응답 수명 동안 별도 세션 사용)"""
+        db = SessionLocal()
+        try:
+            result = db.execute(self.query().execution_options(yield_per=EXPORT_FETCH_SIZE))
+            last_paths = evidence = None
+            for row in result:
+                # 같은 이력의 상세 행은 연속으로 나오므로 직전 값만 재사용
+                if row.paths != last_paths:
+                    last_paths = row.paths
+                    evidence = "; ".join(
+                        path.rsplit('/', 1)[-1] for path in sorted(row.paths.split('\n'))
+                    ) if row.paths else None
+                yield (
+                    row.log_id,
+                    row.check_date.isoformat(),
+                    row.check_type.value,
+                    row.result_status.value if row.result_status else None,
+                    row.worker,
+                    row.asset_id,
+                    row.asset_tag,
+                    row.asset_name,
+                    row.system,
+                    row.location,
+                    row.detail_id,
+                    row.item_name,
+                    row.value,
+                    evidence
+                )
+        finally:
+            db.close()
+
+    def csv(self) -> Iterator[bytes]:
+        """UTF-8(BOM) CSV - Excel에서 한글이 깨지지 않도록 BOM 포함"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write('\ufeff')
+        writer.writerow(EXPORT_COLUMNS)
+        for count, values in enumerate(self.rows(), start=1):
+            writer.writerow(values)
+            if count % CSV_FLUSH_ROWS == 0:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode('utf-8')
+
+    def xlsx(self) -> Iterator[bytes]:
+        return stream_xlsx(EXPORT_COLUMNS, self.rows(), sheet_name="Maintenance")
@@ -0,0 +1,101 @@
+import re
+import threading
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+# 크기 단위 -> GB 배율
+_SIZE_UNITS = {
+    'B': 1 / 1024 ** 3,
+    'KB': 1 / 1024 ** 2,
+    'MB': 1 / 1024,
+    'GB': 1.0,
+    'TB': 1024.0,
+}
+
+_NUMBER_UNIT = re.compile(r'^\s*(-?\d[\d,]*(?:\.\d+)?)\s*([A-Za-z%/]*)\s*$')
+
+
+class MetricNormalizer:
+    """성능 데이터 'Key: Value' 값을 (수치, 단위)로 정규화"""
+
+    @staticmethod
+    def parse(value: Optional[str]) -> Optional[Tuple[float, Optional[str]]]:
+        """
+        "45%" -> (45.0, '%'), "1,024 MB" -> (1.0, 'GB'), "2400MHz" -> (2400.0, 'MHz')
+
+        Returns:
+            Optional[Tuple[float, Optional[str]]]: 수치가 아니면 None
+        """
+        if not value:
+            return None
+
+        match = _NUMBER_UNIT.match(value)
+        if not match:
+            return None
+
+        number = float(match.group(1).replace(',', ''))
+        unit = match.group(2) or None
+
+        if unit and unit.upper() in _SIZE_UNITS:
+            return number * _SIZE_UNITS[unit.upper()], 'GB'
+        return number, unit
+
+    @staticmethod
+    def rows(details: List[Dict], asset_id: int, metric_date: date, log_id: int,
+             source: Optional[str] = None) -> List[Dict]:
+        """상세 데이터 중 수치로 해석되는 항목을 performance_metrics 행으로 변환 (source: 멤버 파일명)"""
+        rows = []
+        for detail in details:
+            parsed = MetricNormalizer.parse(detail.get('value'))
+            if parsed is None:
+                continue
+            value, unit = parsed
+            rows.append({
+                'asset_id': asset_id,
+                'metric': detail['item_name'],
+                'metric_date': metric_date,
+                'value': value,
+                'unit': unit,
+                'log_id': log_id,
+                'source': source
+            })
+        return rows
+
+
+class MetricPartitions:
+    """
+    performance_metrics 월별 파티션 관리 (PostgreSQL)
+
+    적재 대상 월의 파티션을 업로드 트랜잭션과 별도의 짧은 트랜잭션으로 미리 생성한다.
+    (파티션 생성은 부모 테이블을 잠그므로 긴 업로드 트랜잭션 안에서 수행하지 않는다)
+    """
+
+    _lock = threading.Lock()
+    _known: Set[Tuple[int, int]] = set()
+
+    @staticmethod
+    def partition_name(year: int, month: int) -> str:
+        return f"performance_metrics_y{year:04d}m{month:02d}"
+
+    @staticmethod
+    def ensure(engine: Engine, dates: Iterable[date]):
+        if engine.dialect.name != 'postgresql':
+            return
+
+        months = {(d.year, d.month) for d in dates} - MetricPartitions._known
+        if not months:
+            return
+
+        with MetricPartitions._lock:
+            with engine.begin() as conn:
+                for year, month in sorted(months):
+                    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+                    conn.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {MetricPartitions.partition_name(year, month)} "
+                        f"PARTITION OF performance_metrics "
+                        f"FOR VALUES FROM ('{year:04d}-{month:02d}-01') TO ('{next_year:04d}-{next_month:02d}-01')"
+                    ))
+            MetricPartitions._known.update(months)
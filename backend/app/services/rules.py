@@ -0,0 +1,231 @@
+import json
+import operator
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import select, insert, delete, update, exists, func, literal, and_, or_, true
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import MaintenanceLog, PerformanceMetric, EventCount, RuleHit
+from app.models.maintenance import ResultStatus
+
+# 규칙 형식
+#   threshold: 지표값 비교          {"metric": LIKE 패턴, "unit": 단위(선택), "op", "value"}
+#   delta:     직전 측정값과의 차이 {"metric", "unit"(선택), "op", "value"} - 같은 자산/지표의 이전 점검일 대비 |변화량|
+#   event:     EVTX 이벤트 건수     {"level", "channel"(선택), "event_ids"(선택), "op", "value"} - 점검 이력별 합계
+DEFAULT_RULES = [
+    {"name": "evtx_critical", "type": "event", "level": 1, "op": ">", "value": 0,
+     "description": "Level 1(Critical) 이벤트 발생"},
+    {"name": "disk_usage_high", "type": "threshold", "metric": "Disk %", "unit": "%", "op": ">", "value": 90,
+     "description": "디스크 사용률 90% 초과"},
+    {"name": "process_count_delta", "type": "delta", "metric": "Process List", "op": ">", "value": 50,
+     "description": "프로세스 수가 직전 점검 대비 50개 넘게 변화"},
+]
+
+_OPERATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+_RULE_TYPES = ('threshold', 'delta', 'event')
+
+
+def load_rules(path: Optional[str] = None) -> List[Dict]:
+    """RULES_FILE(JSON 배열)의 규칙 목록, 없으면 DEFAULT_RULES - 형식이 잘못되면 ValueError"""
+    path = path or settings.RULES_FILE
+    if not path:
+        return DEFAULT_RULES
+    with open(path, encoding='utf-8') as f:
+        rules = json.load(f)
+
+    names = set()
+    for rule in rules:
+        if rule.get('type') not in _RULE_TYPES:
+            raise ValueError(f"Unknown rule type: {rule.get('type')} ({rule.get('name')})")
+        if rule.get('op') not in _OPERATORS:
+            raise ValueError(f"Unknown operator: {rule.get('op')} ({rule.get('name')})")
+        if not rule.get('name') or rule['name'] in names:
+            raise ValueError(f"Rule name missing or duplicated: {rule.get('name')}")
+        if rule['type'] != 'event' and not rule.get('metric'):
+            raise ValueError(f"Rule {rule['name']} requires 'metric'")
+        names.add(rule['name'])
+    return rules
+
+
+class RuleEngine:
+    """
+    점검 결과 판정 규칙 엔진
+
+    규칙마다 INSERT ... SELECT 한 문장으로 평가 범위(점검 이력 id 목록 또는 점검일 구간)의
+    performance_metrics / event_counts 전체를 한 번에 비교하여 rule_hits에 기록하고,
+    적중 기록 유무로 maintenance_logs.result_status(Fail/Pass)를 한 번에 갱신한다.
+    행 단위 Python 비교가 없으므로 평가 시간은 규칙 수에만 비례한다.
+    커밋은 호출 측에서 수행한다.
+    """
+
+    def __init__(self, rules: Optional[List[Dict]] = None):
+        self.rules = rules if rules is not None else load_rules()
+
+    def evaluate(self, db: Session, log_ids: Optional[Iterable[int]] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict:
+        """
+        평가 범위의 기존 적중 기록을 지우고 다시 평가
+
+        log_ids로 평가할 때는 delta 규칙의 비교 대상이 바뀌는 다음 점검 이력
+        (같은 자산/지표에서 바로 뒤 점검일, 과거 날짜 자료를 나중에 적재한 경우)도 함께 평가한다.
+
+        Args:
+            log_ids: 업로드에서 지표/이벤트가 기록된 점검 이력 (지정 시 날짜 구간은 무시)
+            start_date, end_date: 점검일 구간 (둘 다 없으면 전체 이력)
+
+        Returns:
+            Dict: {'hits': 규칙별 적중 수, 'failed': 범위 안의 Fail 이력 수,
+                   'changed': 판정이 바뀐 이력의 (이력 id, 자산 id, 점검일, 새 판정) 목록}
+        """
+        if log_ids is not None:
+            log_ids = set(log_ids)
+            if not log_ids:
+                return {'hits': {}, 'failed': 0, 'changed': []}
+            log_ids = sorted(log_ids | self._delta_followers(db, log_ids))
+
+        db.execute(delete(RuleHit).where(self._scope(RuleHit.log_id, RuleHit.check_date, log_ids, start_date, end_date)))
+
+        hits = {}
+        for rule in self.rules:
+            source = getattr(self, f"_{rule['type']}_hits")(rule, log_ids, start_date, end_date)
+            result = db.execute(insert(RuleHit).from_select(
+                ['log_id', 'rule', 'subject', 'asset_id', 'check_date', 'value', 'threshold'], source
+            ))
+            hits[rule['name']] = result.rowcount
+
+        # 판정이 실제로 바뀌는 이력만 갱신하고 반환 (대시보드 경고 자산 갱신 범위)
+        scope = self._scope(MaintenanceLog.id, MaintenanceLog.check_date, log_ids, start_date, end_date)
+        has_hit = exists().where(RuleHit.log_id == MaintenanceLog.id)
+        changed = []
+        for status, condition in ((ResultStatus.FAIL, has_hit), (ResultStatus.PASS, ~has_hit)):
+            rows = db.execute(
+                update(MaintenanceLog)
+                .where(scope, condition,
+                       or_(MaintenanceLog.result_status.is_(None), MaintenanceLog.result_status != status))
+                .values(result_status=status)
+                .returning(MaintenanceLog.id, MaintenanceLog.asset_id, MaintenanceLog.check_date)
+                .execution_options(synchronize_session=False)
+            )
+            changed.extend((log_id, asset_id, check_date, status) for log_id, asset_id, check_date in rows)
+
+        failed = db.execute(
+            select(func.count(MaintenanceLog.id)).where(scope, MaintenanceLog.result_status == ResultStatus.FAIL)
+        ).scalar()
+        return {'hits': hits, 'failed': failed, 'changed': changed}
+
+    def _delta_followers(self, db: Session, log_ids: Set[int]) -> Set[int]:
+        """delta 규칙 지표에서 log_ids 각 이력의 바로 다음 점검 이력 (직전 값이 바뀌므로 재평가 대상)"""
+        delta_rules = [rule for rule in self.rules if rule['type'] == 'delta']
+        if not delta_rules:
+            return set()
+
+        ordered = select(
+            PerformanceMetric.log_id,
+            func.lead(PerformanceMetric.log_id).over(
+                partition_by=(PerformanceMetric.asset_id, PerformanceMetric.metric),
+                order_by=PerformanceMetric.metric_date
+            ).label('next_log_id')
+        ).where(
+            or_(*(and_(*self._metric_filter(rule)) for rule in delta_rules)),
+            PerformanceMetric.asset_id.in_(select(MaintenanceLog.asset_id).where(MaintenanceLog.id.in_(log_ids)))
+        ).subquery()
+
+        followers = db.execute(
+            select(ordered.c.next_log_id).where(ordered.c.log_id.in_(log_ids), ordered.c.next_log_id.isnot(None))
+        ).scalars()
+        return set(followers) - log_ids
+
+    @staticmethod
+    def _scope(log_column, date_column, log_ids, start_date, end_date):
+        if log_ids is not None:
+            return log_column.in_(log_ids)
+        conditions = []
+        if start_date:
+            conditions.append(date_column >= start_date)
+        if end_date:
+            conditions.append(date_column <= end_date)
+        return and_(true(), *conditions)
+
+    @staticmethod
+    def _metric_filter(rule: Dict):
+        conditions = [PerformanceMetric.metric.like(rule['metric'])]
+        if rule.get('unit'):
+            conditions.append(PerformanceMetric.unit == rule['unit'])
+        return conditions
+
+    def _threshold_hits(self, rule, log_ids, start_date, end_date):
+        compare = _OPERATORS[rule['op']]
+        return select(
+            PerformanceMetric.log_id,
+            literal(rule['name']),
+            PerformanceMetric.metric,
+            PerformanceMetric.asset_id,
+            PerformanceMetric.metric_date,
+            PerformanceMetric.value,
+            literal(float(rule['value']))
+        ).where(
+            *self._metric_filter(rule),
+            compare(PerformanceMetric.value, rule['value']),
+            PerformanceMetric.log_id.isnot(None),
+            self._scope(PerformanceMetric.log_id, PerformanceMetric.metric_date, log_ids, start_date, end_date)
+        )
+
+    def _delta_hits(self, rule, log_ids, start_date, end_date):
+        compare = _OPERATORS[rule['op']]
+        # 직전 값은 평가 범위 밖(이전 점검일)에서 올 수 있으므로 같은 자산의 이력 전체에서 계산
+        history = select(
+            PerformanceMetric.log_id,
+            PerformanceMetric.asset_id,
+            PerformanceMetric.metric,
+            PerformanceMetric.metric_date,
+            (PerformanceMetric.value - func.lag(PerformanceMetric.value).over(
+                partition_by=(PerformanceMetric.asset_id, PerformanceMetric.metric),
+                order_by=PerformanceMetric.metric_date
+            )).label('delta')
+        ).where(*self._metric_filter(rule))
+        if log_ids is not None:
+            history = history.where(PerformanceMetric.asset_id.in_(
+                select(MaintenanceLog.asset_id).where(MaintenanceLog.id.in_(log_ids))
+            ))
+        elif end_date:
+            history = history.where(PerformanceMetric.metric_date <= end_date)
+        history = history.subquery()
+
+        change = func.abs(history.c.delta)
+        return select(
+            history.c.log_id,
+            literal(rule['name']),
+            history.c.metric,
+            history.c.asset_id,
+            history.c.metric_date,
+            change,
+            literal(float(rule['value']))
+        ).where(
+            history.c.delta.isnot(None),
+            history.c.log_id.isnot(None),
+            compare(change, rule['value']),
+            self._scope(history.c.log_id, history.c.metric_date, log_ids, start_date, end_date)
+        )
+
+    def _event_hits(self, rule, log_ids, start_date, end_date):
+        compare = _OPERATORS[rule['op']]
+        total = func.sum(EventCount.count)
+        query = select(
+            EventCount.log_id,
+            literal(rule['name']),
+            literal(f"level_{rule['level']}"),
+            EventCount.asset_id,
+            EventCount.event_date,
+            total,
+            literal(float(rule['value']))
+        ).where(
+            EventCount.level == rule['level'],
+            self._scope(EventCount.log_id, EventCount.event_date, log_ids, start_date, end_date)
+        )
+        if rule.get('channel'):
+            query = query.where(EventCount.channel == rule['channel'])
+        if rule.get('event_ids'):
+            query = query.where(EventCount.event_id.in_(rule['event_ids']))
+        return query.group_by(EventCount.log_id, EventCount.asset_id, EventCount.event_date).having(
+            compare(total, rule['value'])
+        )
@@ -0,0 +1,103 @@
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import AsyncIterator, Dict, Optional
+
+# 채널별로 보관하는 최근 이벤트 수 (늦게 구독한 클라이언트에 재전송)
+HISTORY_SIZE = 500
+# 완료된 채널 보관 시간 (초)
+FINISHED_TTL = 600
+# 이벤트가 없을 때 연결 유지용 heartbeat 간격 (초)
+HEARTBEAT_INTERVAL = 15
+TERMINAL_EVENTS = ('completed', 'failed')
+
+_channels: Dict[str, "UploadProgress"] = {}
+
+
+class UploadProgress:
+    """
+    업로드 1건의 진행 이벤트 채널 (프로세스 내 브로커)
+
+    publish는 업로드를 처리하는 워커 스레드에서 호출되고, 구독(stream)은 이벤트 루프에서
+    asyncio.Queue로 받는다. 상태가 프로세스 메모리에 있으므로 업로드를 받은 uvicorn 워커에서만 구독할 수 있다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.upload_id = uuid.uuid4().hex
+        self.loop = loop
+        self.events = deque(maxlen=HISTORY_SIZE)
+        self.subscribers = set()
+        self.seq = 0
+        self.finished_at: Optional[float] = None
+        self.snapshot = {'upload_id': self.upload_id, 'status': 'queued', 'progress': None}
+
+    def publish(self, event: Dict):
+        """어느 스레드에서든 호출 가능"""
+        self.loop.call_soon_threadsafe(self._publish, event)
+
+    def _publish(self, event: Dict):
+        self.seq += 1
+        event = dict(event, seq=self.seq)
+        self.events.append(event)
+
+        kind = event['event']
+        if kind == 'started':
+            self.snapshot['status'] = 'processing'
+            self.snapshot['total_files'] = event.get('total_files')
+        elif kind == 'progress':
+            self.snapshot['progress'] = {key: value for key, value in event.items() if key not in ('event', 'seq')}
+        elif kind == 'completed':
+            self.snapshot['status'] = 'completed'
+            self.snapshot['stats'] = event.get('stats')
+        elif kind == 'failed':
+            self.snapshot['status'] = 'failed'
+            self.snapshot['error'] = event.get('error')
+
+        if kind in TERMINAL_EVENTS:
+            self.finished_at = time.monotonic()
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+
+    async def stream(self) -> AsyncIterator[Optional[Dict]]:
+        """
+        지금까지의 이벤트를 재전송한 뒤 새 이벤트를 완료 시까지 전달
+
+        HEARTBEAT_INTERVAL 동안 이벤트가 없으면 None을 내보낸다 (연결 유지용).
+        """
+        queue = asyncio.Queue()
+        # 재전송 목록 복사와 구독 등록 사이에 await가 없으므로 이벤트가 누락/중복되지 않음
+        replay = list(self.events)
+        self.subscribers.add(queue)
+        try:
+            for event in replay:
+                yield event
+            if self.finished_at is not None:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield event
+                if event['event'] in TERMINAL_EVENTS:
+                    return
+        finally:
+            self.subscribers.discard(queue)
+
+
+def create_channel() -> UploadProgress:
+    """새 진행 채널 생성 (완료 후 FINISHED_TTL이 지난 채널은 정리) - 이벤트 루프에서 호출"""
+    now = time.monotonic()
+    for upload_id in [key for key, channel in _channels.items()
+                      if channel.finished_at is not None and now - channel.finished_at > FINISHED_TTL]:
+        del _channels[upload_id]
+
+    channel = UploadProgress(asyncio.get_running_loop())
+    _channels[channel.upload_id] = channel
+    return channel
+
+
+def get_channel(upload_id: str) -> Optional[UploadProgress]:
+    return _channels.get(upload_id)
@@ -0,0 +1,157 @@
+import os
+import hashlib
+import tempfile
+import zipfile
+from typing import Dict
+import aiofiles
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from multipart.multipart import MultipartParser, parse_options_header
+from app.core.config import settings
+
+# 파일 파트 외 multipart 오버헤드(경계, 파트 헤더, 기타 필드)로 허용하는 크기
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """업로드 크기 제한 초과"""
+
+
+class InvalidZipError(Exception):
+    """ZIP 구조(Central Directory) 검증 실패"""
+
+
+class MultipartUploadError(Exception):
+    """multipart/form-data 본문 형식 오류 (file 파트 없음 등)"""
+
+
+async def receive_upload(request: Request, dest_dir: str, field_name: str = "file") -> Dict:
+    """
+    multipart/form-data 요청 본문을 수신하면서 file 파트만 임시 파일에 저장
+
+    UploadFile은 핸들러 실행 전에 Starlette가 본문 전체를 임시 파일로 받아 두므로
+    크기 제한이 수신 도중에 적용되지 않는다. 여기서는 request.stream()을 직접
+    스트리밍 multipart 파서에 넣어, Content-Length(있는 경우)와 수신 중 누적 크기가
+    MAX_UPLOAD_SIZE를 넘는 즉시 중단하고 기록한 임시 파일을 삭제한다 (파일명이 .zip이 아니면 헤더 단계에서 중단).
+    SHA-256 해시를 함께 계산하고, 저장 후 ZIP Central Directory를 검증한다.
+
+    Returns:
+        Dict: {'path': 저장 경로, 'filename': 업로드 파일명, 'size': 바이트 수, 'sha256': 해시}
+    """
+    limit = settings.MAX_UPLOAD_SIZE
+    content_length = request.headers.get('content-length')
+    if content_length and content_length.isdigit() and int(content_length) > limit + _MULTIPART_OVERHEAD:
+        raise UploadTooLargeError("File size exceeds maximum limit")
+
+    content_type, options = parse_options_header(request.headers.get('content-type', ''))
+    boundary = options.get(b'boundary')
+    if content_type != b'multipart/form-data' or not boundary:
+        raise MultipartUploadError("multipart/form-data body with a boundary is required")
+
+    os.makedirs(dest_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix="upload_", suffix=".zip", dir=dest_dir)
+    os.close(fd)
+
+    # 파서 콜백은 동기 함수이므로 파일 파트 데이터를 모아 두었다가 청크마다 비동기로 기록
+    state = {'header_field': b'', 'headers': {}, 'in_file': False, 'found': False, 'filename': None}
+    pending = bytearray()
+
+    def on_part_begin():
+        state['headers'] = {}
+
+    def on_header_field(data, start, end):
+        state['header_field'] += data[start:end]
+
+    def on_header_value(data, start, end):
+        field = state['header_field'].lower()
+        state['headers'][field] = state['headers'].get(field, b'') + data[start:end]
+
+    def on_header_end():
+        state['header_field'] = b''
+
+    def on_headers_finished():
+        _, disposition = parse_options_header(state['headers'].get(b'content-disposition', b''))
+        name = disposition.get(b'name', b'').decode('utf-8', 'replace')
+        state['in_file'] = name == field_name and not state['found']
+        if state['in_file']:
+            state['found'] = True
+            filename = disposition.get(b'filename')
+            state['filename'] = filename.decode('utf-8', 'replace') if filename is not None else ''
+            # 파트 헤더 단계에서 확장자를 확인하여 본문을 받기 전에 중단
+            if not state['filename'].lower().endswith('.zip'):
+                raise InvalidZipError("Only ZIP files are allowed")
+
+    def on_part_data(data, start, end):
+        if state['in_file']:
+            pending.extend(data[start:end])
+
+    def on_part_end():
+        state['in_file'] = False
+
+    parser = MultipartParser(boundary, {
+        'on_part_begin': on_part_begin,
+        'on_header_field': on_header_field,
+        'on_header_value': on_header_value,
+        'on_header_end': on_header_end,
+        'on_headers_finished': on_headers_finished,
+        'on_part_data': on_part_data,
+        'on_part_end': on_part_end,
+    })
+
+    hasher = hashlib.sha256()
+    size = 0
+    body_size = 0
+
+    try:
+        async with aiofiles.open(temp_path, 'wb') as f:
+            async for chunk in request.stream():
+                body_size += len(chunk)
+                if body_size > limit + _MULTIPART_OVERHEAD:
+                    raise UploadTooLargeError("File size exceeds maximum limit")
+                parser.write(chunk)
+                if not pending:
+                    continue
+
+                size += len(pending)
+                if size > limit:
+                    raise UploadTooLargeError("File size exceeds maximum limit")
+                hasher.update(pending)
+                await f.write(bytes(pending))
+                pending.clear()
+            parser.finalize()
+
+        if not state['found']:
+            raise MultipartUploadError(f"Missing form field: {field_name}")
+
+        # Central Directory 검증은 동기 파일 I/O이므로 스레드 풀에서 실행
+        await run_in_threadpool(validate_zip, temp_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return {
+        'path': temp_path,
+        'filename': state['filename'],
+        'size': size,
+        'sha256': hasher.hexdigest()
+    }
+
+
+def validate_zip(zip_path: str) -> int:
+    """
+    ZIP Central Directory 검증 (본문 데이터는 읽지 않음)
+
+    Returns:
+        int: Central Directory에 등록된 멤버 수
+    """
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = zip_ref.infolist()
+    except (zipfile.BadZipFile, OSError) as e:
+        raise InvalidZipError(f"Invalid ZIP archive: {e}")
+
+    if not members:
+        raise InvalidZipError("ZIP archive is empty")
+
+    return len(members)
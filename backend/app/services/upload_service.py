@@ -1,14 +1,114 @@
+import io
 import os
 import shutil
+import tempfile
+import time
+import zipfile
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, List, Dict, IO, Iterator, Tuple, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from app.models import Asset, MaintenanceLog, MaintenanceDetail, LogFile
-from app.models.maintenance import CheckType, ResultStatus
-from app.services.zip_parser import ZipParser
+from app.models import (
+    MaintenanceLog, MaintenanceDetail, LogFile, IngestedMember, PerformanceMetric, Blob, EventCount
+)
+from app.models.maintenance import CheckType
+from app.services.zip_parser import ZipParser, HashingStream
 from app.services.file_processor import FileProcessor
+from app.services.bulk_writer import BulkWriter
+from app.services.identity_map import IngestIdentityMap, LogKey
+from app.services.fingerprint_store import MemberFingerprintStore
+from app.services.hierarchy import mark_hierarchy_changed
+from app.services.dashboard_stats import DashboardStatsService
+from app.services.metrics import MetricNormalizer, MetricPartitions
+from app.services.blob_store import BlobStore
+from app.services.evtx_archive import EvtxArchive
+from app.services.event_counts import EventCountService
+from app.services.rules import RuleEngine
 from app.core.config import settings
+from app.core.instrumentation import (
+    StageTimer, INGEST_UPLOADS, INGEST_FILES, INGEST_FILE_ERRORS,
+    INGEST_FILE_BYTES_PER_SECOND, INGEST_FILE_RECORDS_PER_SECOND
+)
+
+
+# 진행률(progress) 이벤트 최소 간격 (초)
+PROGRESS_INTERVAL = 0.5
+
+
+def file_kind(file_info: Dict) -> str:
+    """지표 라벨용 파일 종류 (FileProcessor 처리 함수 단위)"""
+    if file_info['extension'] == 'evtx':
+        return 'evtx'
+    if file_info['extension'] == 'txt':
+        return 'txt_performance' if file_info['work_type'] == 'disk,task' else 'txt_process'
+    return 'other'
+
+
+def _record_count(kind: str, details: List[Dict]) -> int:
+    """파싱한 레코드 수 (성능: 항목 수, 프로세스: 라인 수, EVTX: Level 1~3 이벤트 수)"""
+    if kind in ('txt_process', 'evtx'):
+        return sum(int(detail.get('value') or 0) for detail in details)
+    return len(details)
+
+
+def parse_member(file_info: Dict, stream: IO[bytes], extract_dir: str) -> Dict:
+    """
+    ZIP 멤버 하나를 파싱 (DB 접근 없음 - 프로세스 풀에서 실행 가능)
+
+    Returns:
+        Dict: {'details': 상세 데이터 리스트, 'extracted_path': 디스크에 기록된 경로 또는 None,
+               'content_hash': 멤버 내용 SHA-256, 'records': 파싱한 레코드 수,
+               'timings': {'extract': 디스크 기록 시간, 'parse': 파싱 시간}}
+    """
+    extracted_path = None
+    extract_seconds = 0.0
+    # 파싱을 위해 읽는 바이트로 중복 판별용 내용 해시를 함께 계산
+    hashing = HashingStream(stream)
+    kind = file_kind(file_info)
+    
+    start = time.perf_counter()
+    if kind == 'txt_performance':
+        # 텍스트는 스트림에서 직접 파싱 (압축 해제 시간이 파싱 시간에 포함됨)
+        details = FileProcessor.process_txt_performance(io.BufferedReader(hashing))
+    elif kind == 'txt_process':
+        details = FileProcessor.process_txt_process(io.BufferedReader(hashing))
+    elif kind == 'evtx':
+        # EVTX는 아카이브 보관 대상이므로 디스크에 기록 후 파싱
+        extracted_path = ZipParser.spill_member(hashing, file_info['file_path'], extract_dir)
+        extract_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        details = FileProcessor.process_evtx(extracted_path)
+    else:
+        details = []
+    content_hash = hashing.hexdigest()
+    
+    return {
+        'details': details,
+        'extracted_path': extracted_path,
+        'content_hash': content_hash,
+        'records': _record_count(kind, details),
+        'timings': {'extract': extract_seconds, 'parse': time.perf_counter() - start}
+    }
+
+
+# 프로세스 풀 워커별로 한 번만 여는 ZIP 핸들
+_worker_zip: Optional[zipfile.ZipFile] = None
+
+
+def _init_parse_worker(zip_path: str):
+    global _worker_zip
+    _worker_zip = zipfile.ZipFile(zip_path, 'r')
+
+
+def _parse_in_worker(file_info: Dict, extract_dir: str) -> Dict:
+    """워커 프로세스용 파싱 함수 (예외는 결과로 돌려 파일별 오류 집계를 유지)"""
+    try:
+        with _worker_zip.open(file_info['file_path']) as stream:
+            return parse_member(file_info, stream, extract_dir)
+    except Exception as e:
+        return {'error': str(e)}
 
 
 class UploadService:
@@ -18,43 +118,172 @@ class UploadService:
         self.db = db
         self.zip_parser = None
         self.file_processor = FileProcessor()
+        self.writer = None
+        self.identity = None
+        self.blob_store = None
+        self.archive = EvtxArchive()
+        self.archive_objects = {}
+        self.archive_refs = {}
+        self.rule_logs = set()
+        self.metric_sources = {}
+        self.timer = None
+        self.progress = None
+        self._progress_state = {}
     
-    def process_upload(self, zip_path: str, worker: str = None) -> Dict:
+    def process_upload(self, zip_path: str, worker: str = None,
+                       progress: Optional[Callable[[Dict], None]] = None,
+                       before_commit: Optional[Callable[[Session], None]] = None) -> Dict:
         """
         ZIP 파일 업로드 및 처리
         
         Args:
             zip_path: 업로드된 ZIP 파일 경로
             worker: 작업자명 (선택)
+            progress: 진행 이벤트 콜백 (선택) - 처리 스레드에서 호출됨
+                {'event': 'started', 'total_files', 'skipped_duplicates', 'total_bytes'}
+                {'event': 'file', 'path', 'status': 'processed'|'error'|'write_error', 'rows', 'error'}
+                {'event': 'progress', 'done', 'total', 'processed', 'errors', 'rows_written',
+                 'bytes_done', 'elapsed', 'files_per_sec', 'mb_per_sec'}  (최대 PROGRESS_INTERVAL마다)
+                콜백에서 예외가 발생하면 업로드 트랜잭션을 롤백하고 예외를 다시 발생시킨다.
+            before_commit: 커밋 직전에 같은 세션으로 호출 (선택) - 예외 시 롤백 (작업 대기열 임대 확인 등)
         
         Returns:
             Dict: 처리 결과 통계
         """
+        self.timer = StageTimer()
+        self.progress = progress
         self.zip_parser = ZipParser(zip_path)
-        parsed_files = self.zip_parser.parse()
+        with self.timer.stage('zip_parse'):
+            parsed_files = self.zip_parser.parse()
         
-        # 임시 추출 디렉토리
-        extract_dir = os.path.join(settings.UPLOAD_DIR, f"extract_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        os.makedirs(extract_dir, exist_ok=True)
+        # 임시 추출 디렉토리 (동시에 처리되는 업로드끼리 겹치지 않도록 업로드마다 고유 이름)
+        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+        extract_dir = tempfile.mkdtemp(prefix=f"extract_{datetime.now().strftime('%Y%m%d_%H%M%S')}_",
+                                       dir=settings.UPLOAD_DIR)
         
         stats = {
             'total_files': len(parsed_files),
             'processed': 0,
             'errors': 0,
+            'skipped_duplicates': 0,
             'assets_found': 0,
             'assets_created': 0,
             'logs_created': 0
         }
         
+        self.blob_store = BlobStore()
+        
+        # 상세 행은 배치 INSERT로 모으고 업로드 전체를 하나의 트랜잭션으로 커밋
+        self.writer = BulkWriter(
+            self.db, settings.INGEST_BATCH_SIZE,
+            ignore_conflicts=[Blob, IngestedMember],
+            upserts={
+                # 같은 날 여러 파일의 동일 항목은 ZIP 순서상 마지막 값 (source에 파일명 기록)
+                PerformanceMetric: ['asset_id', 'metric', 'metric_date'],
+                EventCount: ['log_id', 'channel', 'level', 'event_id']
+            },
+            # 같은 점검 이력/채널로 모이는 EVTX 파일이 여럿이면 건수를 합산
+            accumulate={EventCount: ['count']},
+            on_flush=self.blob_store.release
+        )
+        self.identity = IngestIdentityMap(self.db, worker)
+        self.archive_objects = {}
+        self.archive_refs = {}
+        self.rule_logs = set()
+        self.metric_sources = {}
+        
         try:
-            # 파일별 처리
-            for file_info in parsed_files:
+            # 이미 적재된 멤버(경로/CRC/크기/내용 해시 일치)는 파싱 전에 제외
+            with self.timer.stage('dedup'):
+                parsed_files, stats['skipped_duplicates'] = MemberFingerprintStore(self.db).filter_new(
+                    self.zip_parser, parsed_files
+                )
+            
+            preload_keys = self._preload_keys(parsed_files)
+            
+            with self.timer.stage('preload'):
+                # 성능 지표 월별 파티션 준비 (별도 트랜잭션 - 이 업로드가 행을 잠그기 전에 수행)
+                MetricPartitions.ensure(
+                    self.db.get_bind(),
+                    [check_date for _, check_date, check_type in preload_keys
+                     if check_type in (CheckType.DISK, CheckType.PROCESS)]
+                )
+                
+                # 참조되는 자산/점검 이력을 집합 단위로 한 번에 조회/생성
+                self.identity.preload(preload_keys)
+            stats['assets_found'] = self.identity.assets_found
+            stats['assets_created'] = self.identity.assets_created
+            stats['logs_created'] = self.identity.logs_created
+            
+            self._start_progress(parsed_files, stats)
+            
+            if settings.INGEST_WORKERS > 1 and len(parsed_files) > 1:
+                parsed_results = self._parse_parallel(zip_path, parsed_files, extract_dir)
+            else:
+                parsed_results = self._parse_sequential(parsed_files, extract_dir)
+            
+            # 단일 writer: 파싱 결과를 ZIP 순서대로 DB에 반영
+            for file_info, parsed in parsed_results:
                 try:
-                    self._process_file(file_info, extract_dir, worker)
+                    if 'error' in parsed:
+                        raise RuntimeError(parsed['error'])
+                    self._record_parse(file_info, parsed)
+                    rows = self._apply_file(file_info, parsed)
                     stats['processed'] += 1
                 except Exception as e:
                     print(f"Error processing file {file_info['file_path']}: {e}")
+                    INGEST_FILE_ERRORS.inc(stage='parse')
                     stats['errors'] += 1
+                    self._file_progress(file_info, 'error', stats, error=str(e))
+                    continue
+                
+                with self.timer.stage('db_write'):
+                    failed = self.writer.add(file_info['file_path'], rows)
+                self._count_write_failures(failed, stats)
+                self._file_progress(file_info, 'processed', stats, rows=sum(len(v) for v in rows.values()))
+            
+            with self.timer.stage('db_write'):
+                failed = self.writer.flush()
+            self._count_write_failures(failed, stats)
+            self._emit_progress(stats, force=True)
+            
+            with self.timer.stage('rules'):
+                # 지표/이벤트가 기록된 점검 이력을 판정 규칙으로 한 번에 평가 (result_status 갱신)
+                evaluation = RuleEngine().evaluate(self.db, self.rule_logs)
+                stats['rule_hits'] = evaluation['hits']
+                warning_days = {check_date for _, _, check_date, _ in evaluation['changed']}
+            
+            with self.timer.stage('finalize'):
+                # 기록에 성공한 LogFile만 아카이브 객체 참조 수에 반영
+                EvtxArchive.add_refs(self.db, self.archive_objects, Counter(self.archive_refs.values()))
+                
+                # 대시보드 요약에 이번 업로드 증분 반영 (같은 트랜잭션으로 커밋)
+                DashboardStatsService.apply_ingest(
+                    self.db,
+                    self.identity.assets_created,
+                    [(asset_id, check_date) for asset_id, check_date, _ in self.identity.created_logs],
+                    warning_days
+                )
+                
+                # 자산은 Core INSERT로 생성되므로 계층 트리 버전을 같은 트랜잭션에서 직접 증가
+                if self.identity.assets_created:
+                    mark_hierarchy_changed(self.db)
+            
+            with self.timer.stage('commit'):
+                if before_commit:
+                    before_commit(self.db)
+                self.db.commit()
+            
+            stats['errors'] += len(self.zip_parser.failed_members)
+            stats['rows_inserted'] = self.writer.rows_inserted
+            stats['rows_per_sec'] = self.writer.throughput()
+            stats['timings'] = self.timer.breakdown()
+            INGEST_UPLOADS.inc(status='success')
+        
+        except Exception:
+            self.db.rollback()
+            INGEST_UPLOADS.inc(status='error')
+            raise
         
         finally:
             # 임시 디렉토리 정리
@@ -63,26 +292,136 @@ class UploadService:
         
         return stats
     
-    def _process_file(self, file_info: Dict, extract_dir: str, worker: str = None):
-        """개별 파일 처리"""
-        # Step 1: 자산 찾기 또는 생성
-        asset = self.db.query(Asset).filter(Asset.name == file_info['asset_name']).first()
-        
-        if not asset:
-            # 자산이 없으면 생성 (기본값)
-            from app.models.asset import AssetStatus
-            asset = Asset(
-                name=file_info['asset_name'],
-                status=AssetStatus.OPERATIONAL
-            )
-            self.db.add(asset)
-            self.db.flush()
-        
-        # Step 2: 날짜 파싱
+    def _parse_sequential(self, parsed_files: List[Dict], extract_dir: str) -> Iterator[Tuple[Dict, Dict]]:
+        """ZIP을 한 번 열고 현재 프로세스에서 순차 파싱"""
+        for file_info, stream in self.zip_parser.iter_members(parsed_files):
+            try:
+                yield file_info, parse_member(file_info, stream, extract_dir)
+            except Exception as e:
+                yield file_info, {'error': str(e)}
+    
+    def _parse_parallel(self, zip_path: str, parsed_files: List[Dict], extract_dir: str) -> Iterator[Tuple[Dict, Dict]]:
+        """
+        프로세스 풀로 파싱을 분산하고 결과는 제출 순서대로 반환
+
+        진행 중인 작업 수를 워커 수의 배수로 제한하여
+        writer가 느릴 때 파싱 결과가 메모리에 쌓이지 않도록 한다.
+        """
+        max_in_flight = settings.INGEST_WORKERS * 4
+        pending = deque()
+        files = iter(parsed_files)
+        
+        with ProcessPoolExecutor(
+            max_workers=settings.INGEST_WORKERS,
+            initializer=_init_parse_worker,
+            initargs=(zip_path,)
+        ) as executor:
+            for file_info in files:
+                pending.append((file_info, executor.submit(_parse_in_worker, file_info, extract_dir)))
+                if len(pending) >= max_in_flight:
+                    break
+            
+            while pending:
+                file_info, future = pending.popleft()
+                try:
+                    parsed = future.result()
+                except Exception as e:
+                    parsed = {'error': str(e)}
+                
+                next_info = next(files, None)
+                if next_info is not None:
+                    pending.append((next_info, executor.submit(_parse_in_worker, next_info, extract_dir)))
+                
+                yield file_info, parsed
+    
+    def _check_metric_overrides(self, file_info: Dict, metric_rows: List[Dict]):
+        """이번 업로드에서 다른 파일이 기록한 같은 (자산, 지표, 점검일) 값을 덮어쓰면 경고 출력"""
+        for row in metric_rows:
+            key = (row['asset_id'], row['metric'], row['metric_date'])
+            previous = self.metric_sources.get(key)
+            if previous and previous[0] != file_info['file_path'] and previous[1] != row['value']:
+                print(f"Warning: metric {row['metric']} ({row['metric_date']}) from {previous[0]} "
+                      f"overridden by {file_info['file_path']}")
+            self.metric_sources[key] = (file_info['file_path'], row['value'])
+    
+    def _record_parse(self, file_info: Dict, parsed: Dict):
+        """멤버 파싱 시간을 단계별 시간과 파일 종류별 처리율 지표에 반영"""
+        timings = parsed['timings']
+        kind = file_kind(file_info)
+        for stage, seconds in timings.items():
+            if seconds:
+                self.timer.add(stage, seconds)
+        
+        INGEST_FILES.inc(file_type=kind)
+        elapsed = timings['extract'] + timings['parse']
+        if elapsed > 0:
+            INGEST_FILE_BYTES_PER_SECOND.observe(file_info.get('file_size', 0) / elapsed, file_type=kind)
+            INGEST_FILE_RECORDS_PER_SECOND.observe(parsed['records'] / elapsed, file_type=kind)
+    
+    def _start_progress(self, parsed_files: List[Dict], stats: Dict):
+        total_bytes = sum(file_info.get('file_size', 0) for file_info in parsed_files)
+        self._progress_state = {'total': len(parsed_files), 'done': 0, 'bytes_done': 0, 'last_emit': 0.0}
+        if self.progress:
+            self.progress({
+                'event': 'started',
+                'total_files': len(parsed_files),
+                'skipped_duplicates': stats['skipped_duplicates'],
+                'total_bytes': total_bytes
+            })
+    
+    def _file_progress(self, file_info: Dict, status: str, stats: Dict, rows: int = 0, error: str = None):
+        """파일 1건 처리 완료 이벤트 및 (주기적) 진행률 이벤트"""
+        self._progress_state['done'] += 1
+        self._progress_state['bytes_done'] += file_info.get('file_size', 0)
+        if not self.progress:
+            return
+        event = {'event': 'file', 'path': file_info['file_path'], 'status': status, 'rows': rows}
+        if error:
+            event['error'] = error
+        self.progress(event)
+        self._emit_progress(stats)
+    
+    def _emit_progress(self, stats: Dict, force: bool = False):
+        if not self.progress:
+            return
+        now = time.perf_counter()
+        state = self._progress_state
+        if not force and now - state['last_emit'] < PROGRESS_INTERVAL:
+            return
+        state['last_emit'] = now
+        elapsed = self.timer.elapsed()
+        self.progress({
+            'event': 'progress',
+            'done': state['done'],
+            'total': state['total'],
+            'processed': stats['processed'],
+            'errors': stats['errors'],
+            'rows_written': self.writer.rows_inserted,
+            'bytes_done': state['bytes_done'],
+            'elapsed': round(elapsed, 2),
+            'files_per_sec': round(state['done'] / elapsed, 1) if elapsed else 0.0,
+            'mb_per_sec': round(state['bytes_done'] / 1024 / 1024 / elapsed, 2) if elapsed else 0.0
+        })
+    
+    def _count_write_failures(self, failed: List[Tuple[str, Exception]], stats: Dict):
+        """배치 기록에 실패한 파일을 처리 완료에서 오류로 옮겨 집계"""
+        for file_path, error in failed:
+            print(f"Error writing rows for file {file_path}: {error}")
+            INGEST_FILE_ERRORS.inc(stage='write')
+            if self.progress:
+                self.progress({'event': 'file', 'path': file_path, 'status': 'write_error', 'error': str(error)})
+            self.archive_refs.pop(file_path, None)
+            stats['processed'] -= 1
+            stats['errors'] += 1
+    
+    @staticmethod
+    def _log_key(file_info: Dict) -> LogKey:
+        """파일 정보에서 점검 이력 자연키 (자산명, 점검일, 점검유형) 계산"""
+        # 날짜 파싱
         date_str = file_info['date']
         check_date = datetime.strptime(f"20{date_str}", "%Y%m%d").date()
         
-        # Step 3: 점검 유형 결정
+        # 점검 유형 결정
         if file_info['work_type'] == 'disk,task':
             check_type = CheckType.DISK
         elif file_info['work_type'] == 'log,process':
@@ -90,76 +429,87 @@ class UploadService:
         else:
             check_type = CheckType.OTHER
         
-        # Step 4: MaintenanceLog 생성 또는 찾기
-        log = self.db.query(MaintenanceLog).filter(
-            MaintenanceLog.asset_id == asset.id,
-            MaintenanceLog.check_date == check_date,
-            MaintenanceLog.check_type == check_type
-        ).first()
-        
-        if not log:
-            log = MaintenanceLog(
-                asset_id=asset.id,
-                check_date=check_date,
-                check_type=check_type,
-                worker=worker,
-                result_status=ResultStatus.PASS
-            )
-            self.db.add(log)
-            self.db.flush()
-        
-        # Step 5: 파일 추출 및 처리
-        extracted_path = self.zip_parser.extract_file(file_info['file_path'], extract_dir)
-        
-        # 파일 타입별 처리
-        if file_info['extension'] == 'txt':
-            if file_info['work_type'] == 'disk,task':
-                details = self.file_processor.process_txt_performance(extracted_path)
-            else:
-                details = self.file_processor.process_txt_process(extracted_path)
-        elif file_info['extension'] == 'evtx':
-            details = self.file_processor.process_evtx(extracted_path)
-            
-            # Level 1 이벤트가 있으면 Fail 처리
-            if details and details[0].get('raw_data'):
-                event_stats = details[0]['raw_data']
-                if event_stats.get('level_1') and sum(event_stats['level_1'].values()) > 0:
-                    log.result_status = ResultStatus.FAIL
-            
-            # EVTX 파일은 아카이브로 이동
-            archive_path = self._archive_file(extracted_path, file_info)
-            log_file = LogFile(
-                log_id=log.id,
-                file_path=archive_path,
-                file_type='evtx'
-            )
-            self.db.add(log_file)
-        else:
-            details = []
-        
-        # Step 6: MaintenanceDetail 저장
-        for detail_data in details:
-            detail = MaintenanceDetail(
-                log_id=log.id,
-                item_name=detail_data['item_name'],
-                value=detail_data.get('value'),
-                raw_data=detail_data.get('raw_data')
-            )
-            self.db.add(detail)
-        
-        self.db.commit()
+        return file_info['asset_name'], check_date, check_type
+    
+    def _preload_keys(self, parsed_files: List[Dict]) -> List[LogKey]:
+        """선조회 대상 키 (날짜가 잘못된 파일은 제외 - 개별 처리 단계에서 오류 집계)"""
+        keys = []
+        for file_info in parsed_files:
+            try:
+                keys.append(self._log_key(file_info))
+            except ValueError:
+                continue
+        return keys
     
-    def _archive_file(self, file_path: str, file_info: Dict) -> str:
-        """파일을 아카이브 디렉토리로 이동"""
-        os.makedirs(settings.ARCHIVE_DIR, exist_ok=True)
+    def _apply_file(self, file_info: Dict, parsed: Dict) -> Dict[type, List[Dict]]:
+        """
+        개별 파일 파싱 결과를 DB 기록용 행으로 변환
         
-        # 아카이브 경로: archive/asset_name/date_filename
-        archive_subdir = os.path.join(settings.ARCHIVE_DIR, file_info['asset_name'])
-        os.makedirs(archive_subdir, exist_ok=True)
+        자산/점검 이력 id는 선조회된 identity map에서 가져오므로 DB 왕복이 없다.
+        상세/증빙 파일/멤버 지문 행을 BulkWriter로 넘길 {모델: 행 목록} 형태로 반환한다.
+        지문은 상세 행과 같은 배치로 기록되므로 기록에 실패한 파일은 다음 업로드에서 다시 처리된다.
+        """
+        # Step 1~4: 자산 및 점검 이력 식별
+        asset_name, check_date, check_type = self._log_key(file_info)
+        log_id = self.identity.log_id(asset_name, check_date, check_type)
+        if log_id is None:
+            raise RuntimeError(f"Maintenance log not resolved for {file_info['file_path']}")
         
-        archive_filename = f"{file_info['date']}_{file_info['filename']}"
-        archive_path = os.path.join(archive_subdir, archive_filename)
+        # Step 5: 파일 타입별 후처리
+        details = parsed['details']
+        log_files = []
+        event_rows = []
         
-        shutil.move(file_path, archive_path)
-        return archive_path
-
+        if file_info['extension'] == 'evtx':
+            # Level/EventID별 집계는 조회용 정규화 테이블에도 기록
+            for detail_data in details:
+                event_rows.extend(EventCountService.rows(
+                    detail_data, self.identity.asset_id(asset_name), check_date, log_id
+                ))
+            
+            # EVTX 파일은 내용 주소 기반 아카이브에 압축 저장 (같은 내용은 한 번만 기록)
+            with self.timer.stage('archive'):
+                archive_object = self.archive.store(parsed['extracted_path'], parsed['content_hash'])
+            self.archive_objects[archive_object['hash']] = archive_object
+            self.archive_refs[file_info['file_path']] = archive_object['hash']
+            log_files.append({
+                'log_id': log_id,
+                'file_path': EvtxArchive.file_path(
+                    archive_object['hash'], f"{file_info['date']}_{file_info['filename']}"
+                ),
+                'file_type': 'evtx'
+            })
+        
+        # Step 6: MaintenanceDetail 행 구성 (기록은 BulkWriter가 배치로 수행)
+        detail_rows = [
+            {
+                'log_id': log_id,
+                'item_name': detail_data['item_name'],
+                'value': detail_data.get('value'),
+                'raw_data': detail_data.get('raw_data')
+            }
+            for detail_data in details
+        ]
+        # 프로세스 목록 등 큰 raw_data는 압축 blob으로 분리하고 참조만 남김
+        blob_rows = self.blob_store.pack_rows(detail_rows)
+        
+        # 성능 데이터(항목별 수치)와 프로세스 수는 수치/단위로 정규화하여 시계열 테이블에도 기록
+        metric_rows = []
+        if file_info['extension'] == 'txt' and check_type in (CheckType.DISK, CheckType.PROCESS):
+            metric_rows = MetricNormalizer.rows(details, self.identity.asset_id(asset_name), check_date, log_id,
+                                                source=file_info['filename'])
+            self._check_metric_overrides(file_info, metric_rows)
+        
+        # 판정 규칙 평가 대상 (업로드 마지막에 한 번에 평가)
+        if metric_rows or event_rows:
+            self.rule_logs.add(log_id)
+        
+        # dict 순서 = 기록 순서 (blob은 참조하는 상세 행보다 먼저 기록)
+        return {
+            Blob: blob_rows,
+            MaintenanceDetail: detail_rows,
+            LogFile: log_files,
+            PerformanceMetric: metric_rows,
+            EventCount: event_rows,
+            IngestedMember: [MemberFingerprintStore.row(file_info, parsed['content_hash'], log_id)]
+        }
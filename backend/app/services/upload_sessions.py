@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.services.upload_receiver import UploadTooLargeError, validate_zip
+
+_SESSION_ID = re.compile(r'^[0-9a-f]{32}$')
+# 청크 본문을 모아서 한 번에 기록하는 크기
+_WRITE_BUFFER = 1024 * 1024
+
+
+class UploadSessionError(Exception):
+    """청크 업로드 요청 오류 (잘못된 청크 번호/크기, 체크섬 불일치 등)"""
+
+
+class UploadSessionNotFound(UploadSessionError):
+    """존재하지 않거나 만료/완료된 세션"""
+
+
+class UploadIncompleteError(UploadSessionError):
+    """수신되지 않은 청크가 남아 있는 상태에서 finalize 요청"""
+
+
+class UploadSessionStore:
+    """
+    재개 가능한 청크 업로드 세션 (디스크 기반)
+
+    UPLOAD_DIR/sessions/<세션 id>/
+        meta.json   파일명, 전체 크기, 청크 크기
+        data.part   전체 크기로 미리 만든 파일 - 검증된 청크를 제 위치에 기록
+        chunks/<n>  수신 완료된 청크의 SHA-256 (본문 기록 후 원자적으로 생성)
+        chunks/<n>.<임시 id>.spool  수신 중인 청크 (크기/체크섬 검증 후 data.part로 복사하고 삭제)
+
+    청크마다 기록 위치가 달라 병렬 수신에 잠금이 필요 없고, finalize는 data.part를
+    UPLOAD_DIR로 rename하므로 조립을 위해 다시 읽거나 복사하지 않는다.
+    상태가 디스크에 있으므로 uvicorn 워커가 여러 개여도 어느 워커로든 이어서 보낼 수 있다.
+    """
+
+    def __init__(self, root: str = None):
+        self.upload_dir = root or settings.UPLOAD_DIR
+        self.root = os.path.join(self.upload_dir, "sessions")
+
+    def _session_dir(self, session_id: str) -> str:
+        if not _SESSION_ID.match(session_id):
+            raise UploadSessionNotFound(f"Upload session not found: {session_id}")
+        return os.path.join(self.root, session_id)
+
+    def _load_meta(self, session_id: str) -> Dict:
+        try:
+            with open(os.path.join(self._session_dir(session_id), "meta.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise UploadSessionNotFound(f"Upload session not found: {session_id}")
+
+    def create(self, filename: str, size: int, chunk_size: Optional[int] = None) -> Dict:
+        """세션 생성 및 전체 크기 파일 준비 (만료된 세션도 함께 정리)"""
+        if size <= 0:
+            raise UploadSessionError("File size must be positive")
+        if size > settings.MAX_UPLOAD_SIZE:
+            raise UploadTooLargeError("File size exceeds maximum limit")
+        chunk_size = chunk_size or settings.RESUMABLE_CHUNK_SIZE
+        if not 0 < chunk_size <= settings.RESUMABLE_MAX_CHUNK_SIZE:
+            raise UploadSessionError(f"chunk_size must be between 1 and {settings.RESUMABLE_MAX_CHUNK_SIZE}")
+
+        self.expire()
+
+        session_id = uuid.uuid4().hex
+        session_dir = os.path.join(self.root, session_id)
+        os.makedirs(os.path.join(session_dir, "chunks"))
+
+        # 희소 파일로 전체 크기만 잡아 둠 (실제 블록은 청크가 기록될 때 할당)
+        with open(os.path.join(session_dir, "data.part"), 'wb') as f:
+            f.truncate(size)
+
+        meta = {
+            'session_id': session_id,
+            'filename': filename,
+            'size': size,
+            'chunk_size': chunk_size,
+            'total_chunks': (size + chunk_size - 1) // chunk_size,
+            'created_at': time.time()
+        }
+        with open(os.path.join(session_dir, "meta.json"), 'w') as f:
+            json.dump(meta, f)
+        return meta
+
+    def chunk_bounds(self, meta: Dict, index: int) -> Tuple[int, int]:
+        """청크 번호 -> (파일 내 시작 위치, 길이)"""
+        if not 0 <= index < meta['total_chunks']:
+            raise UploadSessionError(f"Chunk index out of range: {index}")
+        offset = index * meta['chunk_size']
+        return offset, min(meta['chunk_size'], meta['size'] - offset)
+
+    def _received(self, session_id: str) -> Dict[int, str]:
+        chunk_dir = os.path.join(self._session_dir(session_id), "chunks")
+        received = {}
+        for name in os.listdir(chunk_dir):
+            if name.isdigit():
+                with open(os.path.join(chunk_dir, name)) as f:
+                    received[int(name)] = f.read().strip()
+        return received
+
+    def status(self, session_id: str) -> Dict:
+        """세션 정보와 수신된 청크 구간 ([시작, 끝] 청크 번호, 끝 포함)"""
+        meta = self._load_meta(session_id)
+        indexes = sorted(self._received(session_id))
+
+        ranges: List[List[int]] = []
+        for index in indexes:
+            if ranges and ranges[-1][1] == index - 1:
+                ranges[-1][1] = index
+            else:
+                ranges.append([index, index])
+
+        received_bytes = sum(self.chunk_bounds(meta, index)[1] for index in indexes)
+        return dict(
+            meta,
+            received=ranges,
+            received_chunks=len(indexes),
+            received_bytes=received_bytes,
+            complete=len(indexes) == meta['total_chunks']
+        )
+
+    async def write_chunk(self, session_id: str, index: int, body: AsyncIterator[bytes],
+                          sha256: Optional[str] = None) -> Dict:
+        """
+        청크 본문을 스트리밍으로 받아 제 위치에 기록
+
+        본문은 청크별 임시 파일에 먼저 받고, 크기와 sha256(주어진 경우)이 맞을 때만 data.part에 기록한다.
+        검증에 실패한 재전송은 이전에 수신된 내용과 수신 완료 기록을 그대로 둔다.
+        같은 청크를 다시 보내면 덮어쓴다 (재시도 안전).
+        """
+        meta = self._load_meta(session_id)
+        offset, length = self.chunk_bounds(meta, index)
+        session_dir = self._session_dir(session_id)
+        data_path = os.path.join(session_dir, "data.part")
+        if not os.path.exists(data_path):
+            raise UploadSessionNotFound(f"Upload session not found: {session_id}")
+
+        # 검증 전에는 data.part를 건드리지 않는다 - 이미 수신된 청크를 손상된 재전송이 덮어쓰지 않도록
+        spool_path = os.path.join(session_dir, "chunks", f"{index}.{uuid.uuid4().hex}.spool")
+        try:
+            spool = open(spool_path, 'wb', buffering=0)
+        except FileNotFoundError:
+            raise UploadSessionNotFound(f"Upload session not found: {session_id}")
+
+        hasher = hashlib.sha256()
+        written = 0
+        buffer = bytearray()
+        try:
+            with spool:
+                async for piece in body:
+                    if written + len(buffer) + len(piece) > length:
+                        raise UploadSessionError(f"Chunk {index} exceeds expected size {length}")
+                    hasher.update(piece)
+                    buffer.extend(piece)
+                    if len(buffer) >= _WRITE_BUFFER:
+                        await run_in_threadpool(spool.write, bytes(buffer))
+                        written += len(buffer)
+                        buffer.clear()
+                if buffer:
+                    await run_in_threadpool(spool.write, bytes(buffer))
+                    written += len(buffer)
+
+            if written != length:
+                raise UploadSessionError(f"Chunk {index} size mismatch: expected {length}, got {written}")
+            digest = hasher.hexdigest()
+            if sha256 and sha256.lower() != digest:
+                raise UploadSessionError(f"Chunk {index} checksum mismatch")
+
+            await run_in_threadpool(self._copy_into_place, spool_path, data_path, offset, length)
+        finally:
+            try:
+                os.remove(spool_path)
+            except FileNotFoundError:
+                pass
+
+        await run_in_threadpool(self._mark_received, session_dir, index, digest)
+        return {'index': index, 'offset': offset, 'size': length, 'sha256': digest}
+
+    @staticmethod
+    def _copy_into_place(spool_path: str, data_path: str, offset: int, length: int):
+        """검증된 청크를 data.part의 제 위치에 기록 (가능하면 커널 내 복사)"""
+        src = os.open(spool_path, os.O_RDONLY)
+        try:
+            try:
+                dst = os.open(data_path, os.O_WRONLY)
+            except FileNotFoundError:
+                raise UploadSessionNotFound("Upload session not found")
+            try:
+                copied = 0
+                use_copy_range = hasattr(os, 'copy_file_range')
+                while copied < length:
+                    n = 0
+                    if use_copy_range:
+                        try:
+                            n = os.copy_file_range(src, dst, length - copied, copied, offset + copied)
+                        except OSError:
+                            # 지원하지 않는 파일시스템이면 pread/pwrite로 복사
+                            use_copy_range = False
+                    if not use_copy_range:
+                        n = os.pwrite(dst, os.pread(src, min(_WRITE_BUFFER, length - copied), copied), offset + copied)
+                    if n == 0:
+                        raise UploadSessionError("Chunk spool file truncated")
+                    copied += n
+            finally:
+                os.close(dst)
+        finally:
+            os.close(src)
+
+    @staticmethod
+    def _mark_received(session_dir: str, index: int, digest: str):
+        chunk_dir = os.path.join(session_dir, "chunks")
+        temp_path = os.path.join(chunk_dir, f"{index}.tmp")
+        with open(temp_path, 'w') as f:
+            f.write(digest)
+        os.replace(temp_path, os.path.join(chunk_dir, str(index)))
+
+    def finalize(self, session_id: str) -> Dict:
+        """
+        모든 청크 수신 확인 후 조립된 파일을 UPLOAD_DIR로 옮기고 세션 삭제
+
+        Returns:
+            Dict: {'path', 'filename', 'size', 'chunks_sha256': 청크 해시를 순서대로 이은 값의 SHA-256}
+        """
+        meta = self._load_meta(session_id)
+        received = self._received(session_id)
+        missing = meta['total_chunks'] - len(received)
+        if missing:
+            raise UploadIncompleteError(f"{missing} chunk(s) not received")
+
+        session_dir = self._session_dir(session_id)
+        file_path = os.path.join(self.upload_dir, f"upload_{session_id}.zip")
+        try:
+            # 같은 파일시스템 안의 rename - 동시 finalize는 한 요청만 성공
+            os.replace(os.path.join(session_dir, "data.part"), file_path)
+        except FileNotFoundError:
+            raise UploadSessionNotFound(f"Upload session not found: {session_id}")
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+        try:
+            validate_zip(file_path)
+        except Exception:
+            os.remove(file_path)
+            raise
+
+        chunks_digest = hashlib.sha256(
+            "".join(received[index] for index in range(meta['total_chunks'])).encode()
+        ).hexdigest()
+        return {
+            'path': file_path,
+            'filename': meta['filename'],
+            'size': meta['size'],
+            'chunks_sha256': chunks_digest
+        }
+
+    def abort(self, session_id: str):
+        session_dir = self._session_dir(session_id)
+        if not os.path.isdir(session_dir):
+            raise UploadSessionNotFound(f"Upload session not found: {session_id}")
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+    def expire(self) -> int:
+        """마지막 청크 수신 후 UPLOAD_SESSION_TTL_HOURS가 지난 세션 삭제"""
+        if not os.path.isdir(self.root):
+            return 0
+        cutoff = time.time() - settings.UPLOAD_SESSION_TTL_HOURS * 3600
+        removed = 0
+        for name in os.listdir(self.root):
+            chunk_dir = os.path.join(self.root, name, "chunks")
+            try:
+                last_activity = os.path.getmtime(chunk_dir)
+            except OSError:
+                continue
+            if last_activity < cutoff:
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+                removed += 1
+        return removed
@@ -0,0 +1,136 @@
+import re
+import zipfile
+from typing import Iterable, Iterator, List, Sequence
+from xml.sax.saxutils import escape
+
+# 시트당 최대 행 수 (Excel 제한 1,048,576 - 헤더 1행)
+MAX_SHEET_ROWS = 1048575
+# XML 1.0에서 허용되지 않는 제어 문자 (EVTX 메시지 등에 섞여 있으면 Excel이 파일을 열지 못함)
+_ILLEGAL_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+class _ChunkSink:
+    """ZipFile 출력 대상 - 기록된 바이트를 모아 두었다가 drain()으로 넘김 (seek 불가 스트림)"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _cell(value) -> str:
+    if value is None:
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c><v>{value}</v></c>'
+    text = _ILLEGAL_XML.sub('', str(value))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+def _row(values: Sequence) -> str:
+    return '<row>' + ''.join(_cell(value) for value in values) + '</row>'
+
+
+def stream_xlsx(header: Sequence[str], rows: Iterable[Sequence], sheet_name: str = "Sheet",
+                flush_rows: int = 1000) -> Iterator[bytes]:
+    """
+    행을 읽는 대로 XLSX(zip) 바이트를 내보내는 쓰기 전용 워크북
+
+    openpyxl 등 외부 의존성 없이 인라인 문자열 셀로 시트를 기록한다. 압축된 출력은
+    flush_rows 행마다 넘기므로 전체 행 수와 관계없이 메모리 사용량이 일정하다.
+    시트당 행 수가 Excel 제한을 넘으면 다음 시트(sheet_name 2, 3, ...)로 이어서 기록한다.
+    """
+    sink = _ChunkSink()
+    archive = zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+    sheet_count = 0
+    sheet = None
+    sheet_rows = 0
+    pending: List[str] = []
+
+    def open_sheet():
+        nonlocal sheet, sheet_count, sheet_rows
+        sheet_count += 1
+        sheet = archive.open(f"xl/worksheets/sheet{sheet_count}.xml", 'w')
+        sheet.write((_SHEET_HEAD + _row(header)).encode('utf-8'))
+        sheet_rows = 0
+
+    open_sheet()
+    for values in rows:
+        if sheet_rows >= MAX_SHEET_ROWS:
+            sheet.write(''.join(pending).encode('utf-8'))
+            pending = []
+            sheet.write(_SHEET_TAIL.encode('utf-8'))
+            sheet.close()
+            open_sheet()
+        pending.append(_row(values))
+        sheet_rows += 1
+        if len(pending) >= flush_rows:
+            sheet.write(''.join(pending).encode('utf-8'))
+            pending = []
+            data = sink.drain()
+            if data:
+                yield data
+
+    sheet.write((''.join(pending) + _SHEET_TAIL).encode('utf-8'))
+    sheet.close()
+
+    # 시트 수가 정해진 뒤 워크북 구성 파일 기록 (zip 내 순서는 무관)
+    names = [sheet_name if n == 1 else f"{sheet_name} {n}" for n in range(1, sheet_count + 1)]
+    archive.writestr("[Content_Types].xml", _CONTENT_TYPES_HEAD + ''.join(
+        f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for n in range(1, sheet_count + 1)
+    ) + '</Types>')
+    archive.writestr("_rels/.rels", _ROOT_RELS)
+    archive.writestr("xl/workbook.xml", (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+        + ''.join(f'<sheet name="{escape(name)}" sheetId="{n}" r:id="rId{n}"/>'
+                  for n, name in enumerate(names, start=1))
+        + '</sheets></workbook>'
+    ))
+    archive.writestr("xl/_rels/workbook.xml.rels", (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        + ''.join(f'<Relationship Id="rId{n}" '
+                  'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                  f'Target="worksheets/sheet{n}.xml"/>' for n in range(1, sheet_count + 1))
+        + '</Relationships>'
+    ))
+    archive.close()
+    yield sink.drain()
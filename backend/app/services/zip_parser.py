@@ -1,11 +1,41 @@
 import zipfile
+import io
 import os
+import shutil
+import hashlib
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Iterator, IO
 from datetime import datetime
 import re
 
 
+class HashingStream(io.RawIOBase):
+    """읽는 바이트의 SHA-256을 함께 계산하는 스트림 래퍼"""
+    
+    def __init__(self, raw: IO[bytes]):
+        self._raw = raw
+        self._hasher = hashlib.sha256()
+        self.name = getattr(raw, 'name', None)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        n = self._raw.readinto(buffer)
+        if n:
+            self._hasher.update(memoryview(buffer)[:n])
+        return n
+    
+    def hexdigest(self) -> str:
+        """남은 바이트까지 모두 읽어 전체 내용의 해시 반환"""
+        while True:
+            chunk = self._raw.read(1024 * 1024)
+            if not chunk:
+                break
+            self._hasher.update(chunk)
+        return self._hasher.hexdigest()
+
+
 class ZipParser:
     """ZIP 파일 구조 파싱 클래스"""
     
@@ -13,6 +43,7 @@ class ZipParser:
         self.zip_path = zip_path
         self.work_type_pattern = re.compile(r'^(disk,task|log,process)$')
         self.date_pattern = re.compile(r'^(\d{6})_')
+        self.failed_members: Set[str] = set()  # 열 수 없는 멤버 경로 (여러 패스에서 실패해도 한 번만 집계)
     
     def parse(self) -> List[Dict]:
         """
@@ -28,7 +59,9 @@ class ZipParser:
                     'date': '251209',
                     'filename': 'cpu.txt',
                     'file_path': 'disk,task/1단계_ECMS/1BL_ECMS_EWS1/251209_cpu.txt',
-                    'extension': 'txt'
+                    'extension': 'txt',
+                    'crc32': 3735928559,  # Central Directory 값
+                    'file_size': 1024
                 },
                 ...
             ]
@@ -36,13 +69,15 @@ class ZipParser:
         results = []
         
         with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            for file_info in zip_ref.namelist():
+            for zip_info in zip_ref.infolist():
                 # 디렉토리는 제외
-                if file_info.endswith('/'):
+                if zip_info.is_dir():
                     continue
                 
-                parsed = self._parse_file_path(file_info)
+                parsed = self._parse_file_path(zip_info.filename)
                 if parsed:
+                    parsed['crc32'] = zip_info.CRC
+                    parsed['file_size'] = zip_info.file_size
                     results.append(parsed)
         
         return results
@@ -83,15 +118,31 @@ class ZipParser:
             'extension': extension.lower()
         }
     
-    def extract_file(self, file_path: str, extract_to: str) -> str:
-        """ZIP에서 특정 파일 추출"""
+    def iter_members(self, parsed_files: List[Dict]) -> Iterator[Tuple[Dict, IO[bytes]]]:
+        """
+        ZIP을 한 번만 열고 멤버별 (file_info, stream) 쌍을 순서대로 반환
+
+        stream은 다음 멤버로 넘어가면 닫히므로 yield 구간 안에서 소비해야 한다.
+        열 수 없는 멤버는 건너뛰고 failed_members에 기록한다.
+        """
         with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            zip_ref.extract(file_path, extract_to)
-            return os.path.join(extract_to, file_path)
+            for file_info in parsed_files:
+                try:
+                    stream = zip_ref.open(file_info['file_path'])
+                except Exception as e:
+                    print(f"Error opening ZIP member {file_info['file_path']}: {e}")
+                    self.failed_members.add(file_info['file_path'])
+                    continue
+                
+                with stream:
+                    yield file_info, stream
     
-    def extract_all(self, extract_to: str) -> str:
-        """ZIP 전체 추출"""
-        with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
-        return extract_to
-
+    @staticmethod
+    def spill_member(stream: IO[bytes], file_path: str, extract_to: str) -> str:
+        """멤버 스트림을 디스크에 기록 (보관이 필요한 파일 전용)"""
+        target_path = os.path.join(extract_to, file_path)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        
+        with open(target_path, 'wb') as f:
+            shutil.copyfileobj(stream, f, 1024 * 1024)
+        return target_path
@@ -0,0 +1,135 @@
+"""
+자산 검색 지연시간 벤치마크 (PostgreSQL 전용)
+
+별도 스키마에 자산 50,000건 x NIC 3개를 생성하고 동일한 검색어 집합으로
+    - before: 기존 쿼리 (ILIKE + OUTER JOIN + DISTINCT, 전체 반환, trigram 인덱스 없음)
+    - after:  AssetSearchService (UNION + keyset, pg_trgm / pattern_ops 인덱스)
+의 p50/p95 지연시간을 비교한다. 측정이 끝나면 스키마를 삭제한다.
+
+사용법 (backend 디렉토리에서):
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_asset_search --assets 50000 --nics 3
+"""
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, or_, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models import Asset, NetworkInterface
+from app.services.asset_search import AssetSearchService
+
+SCHEMA = "bench_asset_search"
+SEARCH_INDEXES = ("ix_assets_name_trgm", "ix_assets_asset_tag_trgm", "ix_network_interfaces_ip_address_pattern",
+                  "ix_network_interfaces_ip_inet")
+
+
+def legacy_search(db, search):
+    """기존 get_assets 쿼리"""
+    return db.query(Asset).join(NetworkInterface, isouter=True).filter(
+        or_(
+            Asset.name.ilike(f"%{search}%"),
+            Asset.asset_tag.ilike(f"%{search}%"),
+            NetworkInterface.ip_address.ilike(f"%{search}%")
+        )
+    ).distinct().all()
+
+
+def seed(conn, assets: int, nics: int):
+    conn.execute(text(
+        "INSERT INTO assets (name, asset_tag, status) "
+        "SELECT 'BL' || (g % 8) || '_' || (ARRAY['EWS','OWS','HMI','DCS','PLC','SRV'])[1 + g % 6] || '_' || g, "
+        "'TAG-' || lpad(g::text, 6, '0'), 'OPERATIONAL'::assetstatus FROM generate_series(1, :n) AS g"
+    ), {"n": assets})
+    conn.execute(text(
+        "INSERT INTO network_interfaces (asset_id, ip_address, interface_name) "
+        "SELECT a.id, '10.' || (a.id % 250) || '.' || (a.id / 250 % 250) || '.' || (n + 1), 'eth' || n "
+        "FROM assets a CROSS JOIN generate_series(0, :nics - 1) AS n"
+    ), {"nics": nics})
+    # 생성한 주소는 모두 유효하므로 ORM 저장 시와 같은 값을 SQL로 채움
+    conn.execute(text("UPDATE network_interfaces SET ip_inet = ip_address::inet"))
+    conn.execute(text("ANALYZE assets; ANALYZE network_interfaces"))
+
+
+def search_terms(rng: random.Random, assets: int, count: int):
+    terms = []
+    for _ in range(count):
+        kind = rng.randrange(4)
+        n = rng.randrange(1, assets)
+        if kind == 0:
+            terms.append(f"_{n}")  # 자산명 일부
+        elif kind == 1:
+            terms.append(f"TAG-{n:06d}"[:8])  # 자산번호 접두
+        elif kind == 2:
+            terms.append(f"10.{n % 250}.")  # IP 접두
+        else:
+            terms.append(f"10.{n % 250}.0.0/16")  # CIDR
+    return terms
+
+
+def measure(label, fn, terms):
+    timings = []
+    for term in terms:
+        start = time.perf_counter()
+        fn(term)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p50 = statistics.median(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<8} queries={len(terms):>4} p50={p50:8.1f}ms p95={p95:8.1f}ms max={timings[-1]:8.1f}ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--assets", type=int, default=50000)
+    arg_parser.add_argument("--nics", type=int, default=3)
+    arg_parser.add_argument("--queries", type=int, default=200)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    if not settings.DATABASE_URL.startswith("postgresql"):
+        raise SystemExit("PostgreSQL DATABASE_URL이 필요합니다")
+    # 운영 테이블과 분리된 스키마에서 측정
+    engine = create_engine(settings.DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+
+    rng = random.Random(args.seed)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    try:
+        tables = [Base.metadata.tables["systems"], Base.metadata.tables["locations"],
+                  Asset.__table__, NetworkInterface.__table__]
+        Base.metadata.create_all(engine, tables=tables)
+        with engine.begin() as conn:
+            seed(conn, args.assets, args.nics)
+            for name in SEARCH_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        print(f"assets={args.assets} nics/asset={args.nics}")
+
+        terms = search_terms(rng, args.assets, args.queries)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            measure("before", lambda term: legacy_search(db, term), terms)
+
+        with engine.begin() as conn:
+            for table in (Asset.__table__, NetworkInterface.__table__):
+                for index in table.indexes:
+                    if index.name in SEARCH_INDEXES:
+                        index.create(conn)
+            conn.execute(text("ANALYZE assets; ANALYZE network_interfaces"))
+
+        with Session() as db:
+            measure("after", lambda term: AssetSearchService.search(db, term, 100), terms)
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
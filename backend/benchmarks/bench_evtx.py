@@ -0,0 +1,71 @@
+"""
+EVTX Level/EventID 추출 벤치마크 및 결과 비교(parity) 검증
+
+XML 렌더링 경로(기존)와 EvtxFastReader 고속 경로의 처리량(records/s)을
+비교하고, 두 경로의 event_stats 결과가 동일한지 확인한다.
+결과가 다르면 종료 코드 1로 끝난다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_evtx --records 200000
+    python -m benchmarks.bench_evtx --evtx /path/to/sec.evtx
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from app.services.file_processor import FileProcessor
+from benchmarks.evtx_synth import write_evtx, iter_events, SECURITY_PROFILE
+
+
+def count_records(path: str) -> int:
+    from Evtx.Evtx import Evtx
+
+    with Evtx(path) as evtx:
+        return sum(1 for _ in evtx.records())
+
+
+def measure(label: str, path: str, fast: bool, records: int):
+    start = time.perf_counter()
+    result = FileProcessor.process_evtx(path, fast=fast)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} records={records:>9} wall={elapsed:8.3f}s rate={records / elapsed:>10.0f} records/s")
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--evtx', help="측정할 EVTX 파일 (미지정 시 보안 로그 형태의 합성 파일 생성)")
+    arg_parser.add_argument('--records', type=int, default=100000, help="합성 파일 레코드 수")
+    arg_parser.add_argument('--fallback-ratio', action='store_true',
+                            help="합성 파일에 고속 경로 미지원 템플릿을 섞어 fallback 경로도 검증")
+    args = arg_parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="bench_evtx_")
+    try:
+        path = args.evtx
+        if not path:
+            path = os.path.join(temp_dir, "sec.evtx")
+            variants = ('standard', 'const_level', 'string_level') if args.fallback_ratio else ('standard',)
+            write_evtx(path, iter_events(args.records, SECURITY_PROFILE), variants=variants)
+
+        records = count_records(path)
+        print(f"file={path} size={os.path.getsize(path) / 1024 / 1024:.1f}MB")
+
+        xml_result = measure("xml", path, False, records)
+        fast_result = measure("fast", path, True, records)
+
+        if xml_result != fast_result:
+            print("PARITY MISMATCH")
+            print(f"  xml:  {xml_result}")
+            print(f"  fast: {fast_result}")
+            sys.exit(1)
+        print("parity: OK")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
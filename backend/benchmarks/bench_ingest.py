@@ -0,0 +1,247 @@
+"""
+전체 업로드 처리(ingest) 벤치마크
+
+합성 현장 ZIP(benchmarks.field_zip)을 만들어 UploadService.process_upload 전체를
+빈 DB에 실행하고 files/s, MB/s(압축 해제 기준), rows/s, 피크 RSS를 보고한다.
+각 실행은 새 프로세스(spawn)에서 빈 DB로 수행하므로 피크 RSS에 생성기 메모리가 섞이지 않으며,
+INGEST_WORKERS > 1이면 파싱 프로세스의 피크 RSS도 함께 보고한다.
+
+DB:
+    --database-url 미지정         실행마다 새 임시 SQLite 파일
+    --database-url postgresql://  bench_ingest 스키마를 만들어 측정하고 끝나면 삭제
+
+기준선:
+    --save-baseline PATH  결과(중앙값)를 JSON으로 저장
+    --compare PATH        저장된 기준선과 비교 - 처리량이 --tolerance 이상 떨어지거나
+                          피크 RSS가 --tolerance 이상 늘면 종료 코드 1
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_ingest --repeat 3
+    python -m benchmarks.bench_ingest --compare benchmarks/baselines/sqlite_default.json
+    python -m benchmarks.bench_ingest --database-url postgresql://user:pw@localhost/pms --assets 50 --days 30
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Dict, List
+
+from benchmarks.field_zip import build_field_zip, add_arguments, generator_options
+
+PG_SCHEMA = "bench_ingest"
+# (지표, 높을수록 좋은지)
+COMPARED_METRICS = (
+    ('files_per_sec', True),
+    ('mb_per_sec', True),
+    ('rows_per_sec', True),
+    ('peak_rss_mb', False),
+)
+
+
+def _run_ingest(zip_path: str, database_url: str, work_dir: str, workers: int) -> Dict:
+    """자식 프로세스에서 실행 - 설정은 import 시점에 읽히므로 환경 변수를 먼저 지정"""
+    import resource
+
+    os.environ['DATABASE_URL'] = database_url
+    os.environ['UPLOAD_DIR'] = os.path.join(work_dir, "uploads")
+    os.environ['ARCHIVE_DIR'] = os.path.join(work_dir, "archive")
+    os.environ['INGEST_WORKERS'] = str(workers)
+    os.makedirs(os.environ['UPLOAD_DIR'], exist_ok=True)
+
+    from app.core.database import engine, SessionLocal
+    from app.core.schema import ensure_schema
+    from app.services.upload_service import UploadService
+
+    ensure_schema(engine)
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        stats = UploadService(db).process_upload(zip_path, "bench")
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+        engine.dispose()
+
+    # Linux의 ru_maxrss 단위는 KB
+    return {
+        'seconds': elapsed,
+        'stats': stats,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'children_peak_rss_mb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    }
+
+
+def _pg_schema_url(database_url: str, create: bool) -> str:
+    """측정용 스키마를 (재)생성하고 search_path가 지정된 URL 반환"""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.engine import make_url
+
+    engine = create_engine(database_url)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {PG_SCHEMA} CASCADE"))
+            if create:
+                conn.execute(text(f"CREATE SCHEMA {PG_SCHEMA}"))
+    finally:
+        engine.dispose()
+    url = make_url(database_url).update_query_dict({"options": f"-csearch_path={PG_SCHEMA},public"})
+    return url.render_as_string(hide_password=False)
+
+
+def run_once(zip_path: str, database_url: str, workers: int, summary: Dict) -> Dict:
+    work_dir = tempfile.mkdtemp(prefix="bench_ingest_run_")
+    try:
+        if database_url:
+            run_url = _pg_schema_url(database_url, create=True)
+        else:
+            run_url = f"sqlite:///{os.path.join(work_dir, 'bench.db')}"
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            result = executor.submit(_run_ingest, zip_path, run_url, work_dir, workers).result()
+    finally:
+        if database_url:
+            _pg_schema_url(database_url, create=False)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    stats = result['stats']
+    seconds = result['seconds']
+    return {
+        'seconds': round(seconds, 3),
+        'files': stats['total_files'],
+        'errors': stats['errors'],
+        'rows': stats.get('rows_inserted', 0),
+        'files_per_sec': round(stats['total_files'] / seconds, 1),
+        'mb_per_sec': round(summary['uncompressed_bytes'] / 1024 / 1024 / seconds, 2),
+        'rows_per_sec': round(stats.get('rows_inserted', 0) / seconds, 1),
+        'peak_rss_mb': round(result['peak_rss_mb'], 1),
+        'children_peak_rss_mb': round(result['children_peak_rss_mb'], 1),
+        'timings': stats.get('timings', {})
+    }
+
+
+def _median_result(runs: List[Dict]) -> Dict:
+    result = {}
+    for key in ('seconds', 'files_per_sec', 'mb_per_sec', 'rows_per_sec', 'peak_rss_mb', 'children_peak_rss_mb'):
+        result[key] = round(statistics.median(run[key] for run in runs), 3)
+    stages = sorted({stage for run in runs for stage in run['timings']})
+    result['timings'] = {
+        stage: round(statistics.median(run['timings'].get(stage, 0.0) for run in runs), 3)
+        for stage in stages
+    }
+    return result
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float) -> List[str]:
+    """허용치를 넘는 회귀 항목 목록"""
+    regressions = []
+    for key, higher_is_better in COMPARED_METRICS:
+        before = baseline['result'].get(key)
+        after = current['result'].get(key)
+        if not before:
+            continue
+        change = (after - before) / before
+        marker = ""
+        if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+            marker = "  <-- regression"
+            regressions.append(key)
+        print(f"  {key:<16} baseline={before:>10} current={after:>10} change={change:+7.1%}{marker}")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(arg_parser)
+    arg_parser.add_argument('--database-url', help="PostgreSQL URL (미지정 시 임시 SQLite)")
+    arg_parser.add_argument('--workers', type=int, default=1, help="INGEST_WORKERS")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--zip', help="생성기 대신 기존 ZIP 사용")
+    arg_parser.add_argument('--save-baseline', help="결과를 기준선 JSON으로 저장")
+    arg_parser.add_argument('--compare', help="기준선 JSON과 비교")
+    arg_parser.add_argument('--tolerance', type=float, default=0.15, help="허용 변화율 (0.15 = 15%%)")
+    args = arg_parser.parse_args()
+
+    if args.database_url and not args.database_url.startswith("postgresql"):
+        raise SystemExit("--database-url은 PostgreSQL URL이어야 합니다 (SQLite는 미지정 시 자동 사용)")
+
+    options = generator_options(args)
+    temp_dir = tempfile.mkdtemp(prefix="bench_ingest_")
+    try:
+        zip_path = args.zip
+        if zip_path:
+            import zipfile
+            with zipfile.ZipFile(zip_path) as zf:
+                summary = {'uncompressed_bytes': sum(info.file_size for info in zf.infolist())}
+            options = {'zip': os.path.basename(zip_path)}
+        else:
+            zip_path = os.path.join(temp_dir, "field.zip")
+            summary = build_field_zip(zip_path, **options)
+            print(
+                f"generated members={summary['members']} txt={summary['txt_files']} evtx={summary['evtx_files']} "
+                f"uncompressed={summary['uncompressed_bytes'] / 1024 / 1024:.1f}MB"
+            )
+
+        runs = []
+        for index in range(args.repeat):
+            run = run_once(zip_path, args.database_url, args.workers, summary)
+            runs.append(run)
+            print(
+                f"run {index + 1}: files={run['files']} errors={run['errors']} rows={run['rows']} "
+                f"wall={run['seconds']:.2f}s files/s={run['files_per_sec']} MB/s={run['mb_per_sec']} "
+                f"rows/s={run['rows_per_sec']} peak_rss={run['peak_rss_mb']}MB"
+            )
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    options.pop('compression', None)
+    current = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'database': 'postgresql' if args.database_url else 'sqlite',
+        'workers': args.workers,
+        'generator': dict(options, stored=args.stored) if not args.zip else options,
+        'result': _median_result(runs),
+        'runs': runs
+    }
+    print("median: " + json.dumps({k: v for k, v in current['result'].items() if k != 'timings'}))
+    print("stage timings (median, s): " + json.dumps(current['result']['timings']))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w') as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for key in ('database', 'workers', 'generator'):
+            if baseline.get(key) != current[key]:
+                print(f"warning: {key} differs from baseline ({baseline.get(key)} vs {current[key]})")
+        print(f"compare with {args.compare} (revision {baseline.get('revision')}, tolerance {args.tolerance:.0%})")
+        if compare(baseline, current, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+판정 규칙 엔진(RuleEngine) 재평가 시간 벤치마크
+
+빈 검사용 DB(기본: 메모리 SQLite)에 자산 N대 x D일치 점검 이력(Disk/Process/Log)과
+performance_metrics / event_counts 를 생성한 뒤
+    - batch: 하루치 업로드 규모(점검 이력 id 목록) 평가
+    - full:  전체 기간 재평가 (python -m app.cli evaluate-rules 와 동일)
+    - range: 최근 30일 구간 재평가
+의 소요 시간과 규칙별 적중 수를 출력한다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_rules --assets 300 --days 365
+    python -m benchmarks.bench_rules --database-url postgresql://.../scratch_db
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import Asset, MaintenanceLog, PerformanceMetric, EventCount
+from app.models.maintenance import CheckType
+from app.services.metrics import MetricPartitions
+from app.services.rules import RuleEngine, DEFAULT_RULES
+
+DISKS = ("Disk C", "Disk D", "Disk E")
+INSERT_BATCH = 20000
+
+
+def seed(engine, assets: int, days: int, start: date, rng: random.Random):
+    dates = [start + timedelta(days=n) for n in range(days)]
+    MetricPartitions.ensure(engine, dates)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Asset), [{"id": n + 1, "name": f"BENCH_OWS{n + 1:04d}"} for n in range(assets)])
+
+    logs, metrics, events = [], [], []
+    log_id = 0
+
+    def flush(conn, force=False):
+        for model, rows in ((MaintenanceLog, logs), (PerformanceMetric, metrics), (EventCount, events)):
+            if rows and (force or len(rows) >= INSERT_BATCH):
+                conn.execute(insert(model), rows)
+                rows.clear()
+
+    with engine.begin() as conn:
+        for asset_id in range(1, assets + 1):
+            usage = {disk: rng.uniform(20, 80) for disk in DISKS}
+            processes = rng.randint(80, 160)
+            for day in dates:
+                log_id += 1
+                logs.append({"id": log_id, "asset_id": asset_id, "check_date": day, "check_type": CheckType.DISK})
+                for disk in DISKS:
+                    usage[disk] = min(99.0, max(5.0, usage[disk] + rng.uniform(-2, 2.2)))
+                    metrics.append({"asset_id": asset_id, "metric": disk, "metric_date": day,
+                                    "value": round(usage[disk], 1), "unit": "%", "log_id": log_id})
+
+                log_id += 1
+                logs.append({"id": log_id, "asset_id": asset_id, "check_date": day, "check_type": CheckType.PROCESS})
+                processes = max(20, processes + (rng.randint(-80, 80) if rng.random() < 0.02 else rng.randint(-5, 5)))
+                metrics.append({"asset_id": asset_id, "metric": "Process List", "metric_date": day,
+                                "value": processes, "unit": None, "log_id": log_id})
+
+                log_id += 1
+                logs.append({"id": log_id, "asset_id": asset_id, "check_date": day, "check_type": CheckType.LOG})
+                for level in (1, 2, 3):
+                    if level == 1 and rng.random() > 0.01:
+                        continue
+                    events.append({"log_id": log_id, "channel": "sys", "level": level, "event_id": 7000 + level,
+                                   "asset_id": asset_id, "event_date": day, "count": rng.randint(1, 50)})
+                flush(conn)
+        flush(conn, force=True)
+    return log_id, len(dates) * assets * (len(DISKS) + 1)
+
+
+def measure(label, Session, **scope):
+    with Session() as db:
+        start = time.perf_counter()
+        result = RuleEngine(DEFAULT_RULES).evaluate(db, **scope)
+        db.commit()
+        elapsed = time.perf_counter() - start
+    hits = " ".join(f"{name}={count}" for name, count in result['hits'].items())
+    print(f"{label:<6} {elapsed:7.2f}s failed_logs={result['failed']} {hits}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite://", help="빈 검사용 DB (테이블을 생성하고 데이터를 추가함)")
+    parser.add_argument("--assets", type=int, default=300)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    start = date(2025, 1, 1)
+    end = start + timedelta(days=args.days - 1)
+    seed_start = time.perf_counter()
+    logs, metrics = seed(engine, args.assets, args.days, start, random.Random(args.seed))
+    print(f"assets={args.assets} days={args.days} logs={logs} metrics={metrics} "
+          f"seed={time.perf_counter() - seed_start:.1f}s")
+
+    # 하루치 업로드: 마지막 점검일의 전체 자산 이력
+    with Session() as db:
+        batch = db.query(MaintenanceLog.id).filter(MaintenanceLog.check_date == end).all()
+    measure("batch", Session, log_ids=[log_id for log_id, in batch])
+    measure("full", Session)
+    measure("range", Session, start_date=end - timedelta(days=29), end_date=end)
+
+
+if __name__ == "__main__":
+    main()
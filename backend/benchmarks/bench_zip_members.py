@@ -0,0 +1,126 @@
+"""
+ZIP 멤버 처리 벤치마크: 멤버별 추출(기존) vs 단일 패스 스트림 파싱(현재)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_zip_members --assets 50 --days 30
+
+측정 항목:
+    - wall time
+    - read/write 시스템 콜 수 (/proc/self/io 의 syscr/syscw, Linux 전용)
+    - 파일 open 횟수 (sys.addaudithook 'open' 이벤트)
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+from app.services.zip_parser import ZipParser
+from app.services.file_processor import FileProcessor
+
+
+_open_count = 0
+
+
+def _audit(event, args):
+    global _open_count
+    if event == 'open':
+        _open_count += 1
+
+
+def _read_proc_io():
+    try:
+        with open('/proc/self/io') as f:
+            values = dict(line.split(': ') for line in f.read().splitlines())
+        return int(values['syscr']), int(values['syscw'])
+    except OSError:
+        return 0, 0
+
+
+def build_sample_zip(path: str, assets: int, days: int):
+    """disk,task / log,process 텍스트 멤버로 구성된 샘플 ZIP 생성"""
+    perf_body = "\n".join(f"Disk {d}: {50 + i % 40} %" for i, d in enumerate("CDEFGH")) + "\nCPU Usage: 37 %\n"
+    proc_body = "\n".join(f"{1000 + i} svchost.exe 12,345 K" for i in range(120))
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for a in range(assets):
+            asset = f"1BL_ECMS_EWS{a:03d}"
+            for d in range(days):
+                date = f"2512{d % 28 + 1:02d}" if d < 28 else f"2601{d - 27:02d}"
+                zf.writestr(f"disk,task/1단계_ECMS/{asset}/{date}_cpu.txt", perf_body)
+                zf.writestr(f"log,process/1단계_ECMS/{asset}/{date}_process.txt", proc_body)
+
+
+def run_per_member_extract(zip_path: str, parsed_files, work_dir: str) -> int:
+    """기존 방식: 멤버마다 ZIP을 다시 열어 디스크로 추출 후 재읽기"""
+    rows = 0
+    for file_info in parsed_files:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            extracted = zip_ref.extract(file_info['file_path'], work_dir)
+        if file_info['work_type'] == 'disk,task':
+            rows += len(FileProcessor.process_txt_performance(extracted))
+        else:
+            rows += len(FileProcessor.process_txt_process(extracted))
+    return rows
+
+
+def run_single_pass(zip_path: str, parsed_files, work_dir: str) -> int:
+    """현재 방식: ZIP을 한 번 열고 멤버 스트림을 그대로 파싱"""
+    parser = ZipParser(zip_path)
+    rows = 0
+    for file_info, stream in parser.iter_members(parsed_files):
+        if file_info['work_type'] == 'disk,task':
+            rows += len(FileProcessor.process_txt_performance(stream))
+        else:
+            rows += len(FileProcessor.process_txt_process(stream))
+    return rows
+
+
+def measure(label: str, func, zip_path: str, parsed_files):
+    global _open_count
+    work_dir = tempfile.mkdtemp(prefix="bench_extract_")
+    try:
+        _open_count = 0
+        syscr0, syscw0 = _read_proc_io()
+        start = time.perf_counter()
+        rows = func(zip_path, parsed_files, work_dir)
+        elapsed = time.perf_counter() - start
+        syscr1, syscw1 = _read_proc_io()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(
+        f"{label:<18} files={len(parsed_files):>6} rows={rows:>7} "
+        f"wall={elapsed:8.3f}s read_syscalls={syscr1 - syscr0:>8} "
+        f"write_syscalls={syscw1 - syscw0:>8} opens={_open_count:>6}"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--assets', type=int, default=50)
+    arg_parser.add_argument('--days', type=int, default=30)
+    arg_parser.add_argument('--zip', help="기존 ZIP 사용 (미지정 시 샘플 생성)")
+    args = arg_parser.parse_args()
+
+    sys.addaudithook(_audit)
+
+    temp_dir = tempfile.mkdtemp(prefix="bench_zip_")
+    try:
+        zip_path = args.zip
+        if not zip_path:
+            zip_path = os.path.join(temp_dir, "sample.zip")
+            build_sample_zip(zip_path, args.assets, args.days)
+
+        parsed_files = [f for f in ZipParser(zip_path).parse() if f['extension'] == 'txt']
+
+        measure("before (extract)", run_per_member_extract, zip_path, parsed_files)
+        measure("after (stream)", run_single_pass, zip_path, parsed_files)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
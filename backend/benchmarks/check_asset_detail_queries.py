@@ -0,0 +1,91 @@
+"""
+자산 상세 조회(AssetDetailService) 쿼리 수 검사
+
+임시 DB(기본: 메모리 SQLite)에 자산 1건과 NIC/계정/점검 이력(상세, 증빙 파일 포함)을 만들고
+최근 이력 건수를 바꿔 가며 실행된 SQL 문 수를 센다. 이력 건수와 관계없이
+QUERY_COUNT로 고정되어야 하며, 계정 비밀번호 해시는 SELECT/응답 어디에도 나오지 않아야 한다.
+조건을 만족하지 않으면 종료 코드 1.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.check_asset_detail_queries
+    python -m benchmarks.check_asset_detail_queries --database-url postgresql://.../scratch_db
+"""
+import argparse
+import json
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import (
+    System, Location, Asset, NetworkInterface, Account, MaintenanceLog, MaintenanceDetail, LogFile
+)
+from app.models.maintenance import CheckType
+from app.services.asset_detail import AssetDetailService, QUERY_COUNT
+
+PASSWORD_HASH = "$2b$12$check.asset.detail.password.hash"
+
+
+def seed(db, logs: int, details_per_log: int) -> int:
+    system = System(name="1BL DCS")
+    location = Location(name="1호기 전자기기실")
+    asset = Asset(name="CHECK_OWS001", asset_tag="TAG-001", system=system, location=location)
+    asset.network_interfaces = [
+        NetworkInterface(interface_name=f"eth{n}", ip_address=f"10.0.0.{n + 1}") for n in range(3)
+    ]
+    asset.accounts = [Account(username=f"user{n}", password_hash=PASSWORD_HASH, role="operator") for n in range(2)]
+    db.add(asset)
+    db.flush()
+
+    start = date(2025, 1, 1)
+    for n in range(logs):
+        log = MaintenanceLog(asset_id=asset.id, check_date=start + timedelta(days=n), check_type=CheckType.DISK)
+        log.details = [MaintenanceDetail(item_name=f"Disk {d}", value=f"{d}0 %") for d in range(details_per_log)]
+        log.log_files = [LogFile(file_path=f"archive://{n:064d}/day{n}_System.evtx", file_type="evtx")]
+        db.add(log)
+    db.commit()
+    return asset.id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite://", help="빈 검사용 DB (테이블을 생성하고 데이터를 추가함)")
+    parser.add_argument("--logs", type=int, default=60)
+    parser.add_argument("--details", type=int, default=5, help="이력당 상세 행 수")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session() as db:
+        asset_id = seed(db, args.logs, args.details)
+
+    failed = False
+    for log_limit in (1, 10, args.logs):
+        statements.clear()
+        with Session() as db:
+            detail = AssetDetailService.get(db, asset_id, log_limit)
+        body = json.dumps(detail, default=str)
+
+        leaked = any("password_hash" in statement for statement in statements) or PASSWORD_HASH in body
+        ok = len(statements) == QUERY_COUNT and not leaked and len(detail['recent_logs']) == min(log_limit, args.logs)
+        failed |= not ok
+        print(f"log_limit={log_limit:<4} queries={len(statements)} expected={QUERY_COUNT} "
+              f"logs={len(detail['recent_logs'])} password_hash_leaked={leaked} {'OK' if ok else 'FAIL'}")
+        if not ok:
+            for statement in statements:
+                print("   ", " ".join(statement.split())[:160])
+
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+합성(synthetic) EVTX 파일 생성기
+
+python-evtx가 읽을 수 있는 최소 구조(파일 헤더, 64KB 청크, 템플릿 기반
+Binary XML 레코드)를 직접 기록한다. 벤치마크와 파서 비교 검증용이며
+실제 Windows 로그의 모든 필드를 재현하지는 않는다.
+
+레코드 템플릿 종류:
+    - standard: Level(UInt8)/EventID(UInt16)가 substitution (일반적인 Windows 이벤트)
+    - const_level: Level이 템플릿 상수 값
+    - string_level: Level이 WString substitution (고속 경로 미지원 -> XML fallback)
+"""
+import binascii
+import random
+import struct
+from typing import Iterable, List, Optional, Tuple
+
+
+EVENT_NAMESPACE = 'http://schemas.microsoft.com/win/2004/08/events/event'
+CHUNK_SIZE = 0x10000
+CHUNK_HEADER_SIZE = 0x200
+FILE_HEADER_SIZE = 0x1000
+
+TYPE_NULL = 0x00
+TYPE_WSTRING = 0x01
+TYPE_UINT8 = 0x04
+TYPE_UINT16 = 0x06
+TYPE_UINT64 = 0x0A
+TYPE_FILETIME = 0x11
+
+# 보안 로그 스타일 (Level, EventID) 분포: Level 0(감사) 위주, 일부 1~4
+SECURITY_PROFILE = [
+    ((0, 4624), 40), ((0, 4634), 20), ((0, 4672), 15), ((0, 4688), 10),
+    ((4, 4798), 5), ((3, 4625), 4), ((2, 1102), 3), ((1, 4618), 1),
+    ((2, 5038), 1), ((3, 4740), 1),
+]
+SYSTEM_PROFILE = [
+    ((4, 7036), 40), ((4, 7040), 15), ((3, 10016), 15), ((2, 7000), 10),
+    ((2, 7009), 6), ((1, 41), 2), ((3, 1014), 7), ((4, 6013), 5),
+]
+
+
+def _wstring(text: str) -> bytes:
+    return text.encode('utf-16-le')
+
+
+class _ChunkBuilder:
+    """청크 하나의 레코드 영역을 구성 (오프셋은 청크 기준 상대값)"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.strings = {}
+        self.templates = {}
+        self.record_offsets: List[int] = []
+
+    def pos(self) -> int:
+        return CHUNK_HEADER_SIZE + len(self.data)
+
+    # --- Binary XML 노드 -------------------------------------------------
+
+    def _name(self, name: str, node_header_end: int) -> Tuple[int, bytes]:
+        """이미 정의된 이름이면 참조, 아니면 노드 헤더 직후에 resident로 정의"""
+        if name in self.strings:
+            return self.strings[name], b''
+        self.strings[name] = node_header_end
+        encoded = _wstring(name)
+        body = struct.pack('<IHH', 0, 0, len(name)) + encoded + b'\x00\x00'
+        return node_header_end, body
+
+    def _element(self, out: bytearray, name: str, attrs: List[Tuple[str, str]], content):
+        start = self.pos() + len(out)
+        token = 0x41 if attrs else 0x01
+        name_offset, name_body = self._name(name, start + 11)
+        out += struct.pack('<BHII', token, 0xFFFF, 0, name_offset) + name_body
+        if attrs:
+            out += struct.pack('<I', 0)  # attribute list size (미사용)
+            for attr_name, attr_value in attrs:
+                attr_start = self.pos() + len(out)
+                attr_offset, attr_body = self._name(attr_name, attr_start + 5)
+                out += struct.pack('<BI', 0x06, attr_offset) + attr_body
+                encoded = _wstring(attr_value)
+                out += struct.pack('<BBH', 0x05, TYPE_WSTRING, len(attr_value)) + encoded
+
+        if content is None:
+            out += b'\x03'  # CloseEmptyElement
+            return
+
+        out += b'\x02'  # CloseStartElement
+        for item in content:
+            kind = item[0]
+            if kind == 'sub':
+                out += struct.pack('<BHB', 0x0D, item[1], item[2])
+            elif kind == 'value':
+                text = item[1]
+                out += struct.pack('<BBH', 0x05, TYPE_WSTRING, len(text)) + _wstring(text)
+            elif kind == 'element':
+                self._element(out, item[1], item[2], item[3])
+        out += b'\x04'  # CloseElement
+
+    def _template_body(self, out: bytearray, variant: str):
+        """Event 템플릿 본문 (substitution index는 record_values 순서와 일치)"""
+        if variant == 'const_level':
+            level = [('value', '4')]
+        elif variant == 'string_level':
+            level = [('sub', 0, TYPE_WSTRING)]
+        else:
+            level = [('sub', 0, TYPE_UINT8)]
+
+        system = [
+            ('element', 'Provider', [('Name', 'Microsoft-Windows-Security-Auditing')], None),
+            ('element', 'EventID', [], [('sub', 1, TYPE_UINT16)]),
+            ('element', 'Version', [], [('value', '0')]),
+            ('element', 'Level', [], level),
+            ('element', 'TimeCreated', [], [('sub', 2, TYPE_FILETIME)]),
+            ('element', 'EventRecordID', [], [('sub', 3, TYPE_UINT64)]),
+            ('element', 'Channel', [], [('value', 'Security')]),
+            ('element', 'Computer', [], [('sub', 4, TYPE_WSTRING)]),
+        ]
+        event_data = [
+            ('element', 'Data', [('Name', 'SubjectUserName')], [('sub', 5, TYPE_WSTRING)]),
+        ]
+        out += b'\x0F\x01\x01\x00'
+        self._element(out, 'Event', [('xmlns', EVENT_NAMESPACE)], [
+            ('element', 'System', [], system),
+            ('element', 'EventData', [], event_data),
+        ])
+        out += b'\x00'  # EndOfStream
+
+    # --- 레코드 ----------------------------------------------------------
+
+    def build_record(self, record_num: int, variant: str, level: int, event_id: int,
+                     computer: str, user: str, filetime: int) -> Optional[bytes]:
+        out = bytearray()
+        out += struct.pack('<IIQQ', 0x00002A2A, 0, record_num, filetime)
+        out += b'\x0F\x01\x01\x00'
+
+        instance_pos = self.pos() + len(out)
+        if variant in self.templates:
+            template_offset = self.templates[variant]
+            out += struct.pack('<BBII', 0x0C, 0x01, 0, template_offset)
+        else:
+            # resident 템플릿: 인스턴스 직후에 헤더(0x18)와 본문을 기록
+            template_offset = instance_pos + 10
+            saved = len(out)
+            out += struct.pack('<BBII', 0x0C, 0x01, 0, template_offset)
+            out += b'\x00' * 0x18
+            self._template_body(out, variant)
+            body_len = len(out) - saved - 10 - 0x18
+            guid = struct.pack('<I', 0x1000 + len(self.templates)) + bytes(12)
+            out[saved + 10:saved + 10 + 0x18] = struct.pack('<I', 0) + guid + struct.pack('<I', body_len)
+            self.templates[variant] = template_offset
+
+        if variant == 'string_level':
+            level_value = (_wstring(str(level)), TYPE_WSTRING)
+        else:
+            level_value = (struct.pack('<B', level), TYPE_UINT8)
+
+        values = [
+            level_value,
+            (struct.pack('<H', event_id), TYPE_UINT16),
+            (struct.pack('<Q', filetime), TYPE_FILETIME),
+            (struct.pack('<Q', record_num), TYPE_UINT64),
+            (_wstring(computer), TYPE_WSTRING),
+            (_wstring(user), TYPE_WSTRING),
+        ]
+        out += struct.pack('<I', len(values))
+        for value, type_ in values:
+            out += struct.pack('<HBx', len(value), type_)
+        for value, _ in values:
+            out += value
+
+        size = len(out) + 4
+        out += struct.pack('<I', size)
+        struct.pack_into('<I', out, 4, size)
+
+        if self.pos() + len(out) > CHUNK_SIZE:
+            return None
+        self.record_offsets.append(self.pos())
+        self.data += out
+        return bytes(out)
+
+    def finalize(self, first_record: int, last_record: int) -> bytes:
+        header = bytearray(CHUNK_HEADER_SIZE)
+        header[0:8] = b'ElfChnk\x00'
+        next_record_offset = self.pos()
+        last_record_offset = self.record_offsets[-1] if self.record_offsets else CHUNK_HEADER_SIZE
+        data_checksum = binascii.crc32(bytes(self.data)) & 0xFFFFFFFF
+        struct.pack_into('<QQQQIIII', header, 8, first_record, last_record, first_record, last_record,
+                         0x80, last_record_offset, next_record_offset, data_checksum)
+        checksum = binascii.crc32(bytes(header[0:0x78]) + bytes(header[0x80:0x200])) & 0xFFFFFFFF
+        struct.pack_into('<I', header, 0x7C, checksum)
+
+        chunk = bytes(header) + bytes(self.data)
+        return chunk + b'\x00' * (CHUNK_SIZE - len(chunk))
+
+
+def iter_events(count: int, profile=None, seed: int = 0) -> Iterable[Tuple[int, int]]:
+    """프로필 가중치에 따른 (level, event_id) 시퀀스"""
+    rng = random.Random(seed)
+    profile = profile or SECURITY_PROFILE
+    population = [item for item, _ in profile]
+    weights = [weight for _, weight in profile]
+    for _ in range(count):
+        yield rng.choices(population, weights)[0]
+
+
+def write_evtx(path: str, events: Iterable[Tuple[int, int]], computer: str = 'EWS1',
+               variants: Tuple[str, ...] = ('standard',), seed: int = 0) -> int:
+    """
+    (level, event_id) 시퀀스로 EVTX 파일 생성
+
+    Returns:
+        int: 기록된 레코드 수
+    """
+    rng = random.Random(seed)
+    chunks: List[bytes] = []
+    builder = _ChunkBuilder()
+    first_in_chunk = 1
+    record_num = 1
+    filetime = 133000000000000000
+
+    for level, event_id in events:
+        variant = variants[rng.randrange(len(variants))] if len(variants) > 1 else variants[0]
+        user = rng.choice(('SYSTEM', 'Administrator', 'operator', 'LOCAL SERVICE'))
+        filetime += rng.randrange(1, 50_000_000)
+
+        if builder.build_record(record_num, variant, level, event_id, computer, user, filetime) is None:
+            chunks.append(builder.finalize(first_in_chunk, record_num - 1))
+            builder = _ChunkBuilder()
+            first_in_chunk = record_num
+            builder.build_record(record_num, variant, level, event_id, computer, user, filetime)
+        record_num += 1
+
+    if builder.record_offsets:
+        chunks.append(builder.finalize(first_in_chunk, record_num - 1))
+
+    header = bytearray(FILE_HEADER_SIZE)
+    header[0:8] = b'ElfFile\x00'
+    struct.pack_into('<QQQIHHHH', header, 8, 0, max(len(chunks) - 1, 0), record_num,
+                     0x80, 1, 3, FILE_HEADER_SIZE, len(chunks))
+    checksum = binascii.crc32(bytes(header[0:0x78])) & 0xFFFFFFFF
+    struct.pack_into('<I', header, 0x7C, checksum)
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        for chunk in chunks:
+            f.write(chunk)
+
+    return record_num - 1
@@ -0,0 +1,174 @@
+"""
+현장 점검 ZIP 합성 생성기
+
+현장 수집 ZIP과 같은 <작업유형>/<설비군>/<자산명>/<YYMMDD>_<파일명> 구조로
+성능(txt), 프로세스 목록(txt), 이벤트 로그(EVTX) 멤버를 생성한다.
+같은 인자와 시드를 주면 항상 같은 바이트의 ZIP이 만들어진다 (멤버 시각 고정).
+
+    disk,task/1단계_ECMS/1BL_ECMS_EWS001/251201_cpu.txt        성능 Key: Value
+    disk,task/1단계_ECMS/1BL_ECMS_EWS001/251201_disk2.txt      (--txt-per-day 3 이상일 때 추가 성능 파일)
+    log,process/1단계_ECMS/1BL_ECMS_EWS001/251201_process.txt  프로세스 목록
+    log,process/1단계_ECMS/1BL_ECMS_EWS001/251201_System.evtx  System/Security/Application (--evtx-per-day, 최대 3)
+
+EVTX는 생성 비용이 커서 채널별로 --evtx-variants개를 만들어 돌려 쓴다
+(경로가 다르므로 업로드 시 모두 파싱되고, 아카이브에는 내용별로 한 번만 저장된다).
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.field_zip /tmp/field.zip --assets 20 --days 30 --evtx-per-day 2
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import zipfile
+from datetime import date, timedelta
+from typing import Dict
+
+from benchmarks.evtx_synth import write_evtx, iter_events, SECURITY_PROFILE, SYSTEM_PROFILE
+
+START_DATE = date(2025, 12, 1)
+SYSTEM_GROUPS = ("1단계_ECMS", "2단계_DCS", "공통_SCADA", "3단계_BOP")
+ASSET_ROLES = ("EWS", "OWS", "HMI", "SRV")
+EVTX_CHANNELS = (("System", SYSTEM_PROFILE), ("Security", SECURITY_PROFILE), ("Application", SYSTEM_PROFILE))
+PROCESS_NAMES = ("svchost.exe", "lsass.exe", "services.exe", "explorer.exe", "OPCServer.exe",
+                 "HMIRuntime.exe", "sqlservr.exe", "MsMpEng.exe", "wininit.exe", "csrss.exe")
+MEMBER_TIME = (2025, 12, 1, 0, 0, 0)
+
+
+def _performance_text(rng: random.Random, drives: str = "CDE") -> str:
+    lines = [f"Disk {drive}: {rng.randint(5, 98)} %" for drive in drives]
+    lines.append(f"Disk C Free: {rng.randint(10, 900)} GB")
+    lines.append(f"Memory Usage: {rng.randint(20, 95)} %")
+    lines.append(f"CPU Usage: {rng.randint(1, 100)} %")
+    return "\n".join(lines) + "\n"
+
+
+def _process_text(rng: random.Random, lines: int) -> str:
+    return "\n".join(
+        f"{rng.randint(100, 65000):>6} {rng.choice(PROCESS_NAMES):<20} {rng.randint(1, 900000):,} K"
+        for _ in range(lines)
+    ) + "\n"
+
+
+def _writestr(zf: zipfile.ZipFile, name: str, data, compression: int):
+    info = zipfile.ZipInfo(name, MEMBER_TIME)
+    info.compress_type = compression
+    zf.writestr(info, data)
+
+
+def build_field_zip(path: str, assets: int = 10, days: int = 7, groups: int = 2, txt_per_day: int = 2,
+                    evtx_per_day: int = 1, evtx_events: int = 5000, evtx_variants: int = 4,
+                    process_lines: int = 150, seed: int = 0,
+                    compression: int = zipfile.ZIP_DEFLATED) -> Dict:
+    """
+    합성 현장 ZIP 생성
+
+    Args:
+        txt_per_day: 자산/일자별 txt 수 (1: cpu, 2: +process, 3 이상: +diskN 성능 파일)
+        evtx_per_day: 자산/일자별 EVTX 수 (System, Security, Application 순, 최대 3)
+        evtx_events: EVTX 한 개의 레코드 수
+        evtx_variants: 채널별로 생성해 돌려 쓰는 EVTX 종류 수
+
+    Returns:
+        Dict: {'members', 'txt_files', 'evtx_files', 'uncompressed_bytes', 'zip_bytes'}
+    """
+    rng = random.Random(seed)
+    evtx_per_day = min(evtx_per_day, len(EVTX_CHANNELS))
+    work_dir = tempfile.mkdtemp(prefix="field_evtx_")
+    summary = {'members': 0, 'txt_files': 0, 'evtx_files': 0, 'uncompressed_bytes': 0}
+
+    try:
+        evtx_pool = {}
+        for index, (channel, profile) in enumerate(EVTX_CHANNELS[:evtx_per_day]):
+            evtx_pool[channel] = []
+            for variant in range(evtx_variants):
+                variant_seed = seed * 1000 + index * 100 + variant
+                sample_path = os.path.join(work_dir, f"{channel}_{variant}.evtx")
+                write_evtx(sample_path, iter_events(evtx_events, profile, seed=variant_seed),
+                           computer=f"EWS{variant}", seed=variant_seed)
+                with open(sample_path, 'rb') as f:
+                    evtx_pool[channel].append(f.read())
+
+        with zipfile.ZipFile(path, 'w', compression) as zf:
+            for a in range(assets):
+                group = SYSTEM_GROUPS[a % max(1, min(groups, len(SYSTEM_GROUPS)))]
+                asset = f"1BL_{group.split('_')[-1]}_{ASSET_ROLES[a % len(ASSET_ROLES)]}{a:03d}"
+
+                for d in range(days):
+                    day = (START_DATE + timedelta(days=d)).strftime("%y%m%d")
+                    members = []
+
+                    for t in range(txt_per_day):
+                        if t == 0:
+                            members.append((f"disk,task/{group}/{asset}/{day}_cpu.txt", _performance_text(rng)))
+                        elif t == 1:
+                            members.append((f"log,process/{group}/{asset}/{day}_process.txt",
+                                            _process_text(rng, process_lines)))
+                        else:
+                            members.append((f"disk,task/{group}/{asset}/{day}_disk{t}.txt",
+                                            _performance_text(rng, "FGH")))
+
+                    for e in range(evtx_per_day):
+                        channel = EVTX_CHANNELS[e % len(EVTX_CHANNELS)][0]
+                        members.append((f"log,process/{group}/{asset}/{day}_{channel}.evtx",
+                                        rng.choice(evtx_pool[channel])))
+
+                    for name, data in members:
+                        payload = data.encode('utf-8') if isinstance(data, str) else data
+                        _writestr(zf, name, payload, compression)
+                        summary['members'] += 1
+                        summary['uncompressed_bytes'] += len(payload)
+                        summary['evtx_files' if name.endswith('.evtx') else 'txt_files'] += 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    summary['zip_bytes'] = os.path.getsize(path)
+    return summary
+
+
+def add_arguments(arg_parser: argparse.ArgumentParser):
+    """생성기 인자 (벤치마크 하네스와 공유)"""
+    arg_parser.add_argument('--assets', type=int, default=10)
+    arg_parser.add_argument('--days', type=int, default=7)
+    arg_parser.add_argument('--groups', type=int, default=2, help="설비군 수")
+    arg_parser.add_argument('--txt-per-day', type=int, default=2)
+    arg_parser.add_argument('--evtx-per-day', type=int, default=1)
+    arg_parser.add_argument('--evtx-events', type=int, default=5000)
+    arg_parser.add_argument('--evtx-variants', type=int, default=4)
+    arg_parser.add_argument('--process-lines', type=int, default=150)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--stored', action='store_true', help="무압축(ZIP_STORED)으로 저장")
+
+
+def generator_options(args) -> Dict:
+    return {
+        'assets': args.assets,
+        'days': args.days,
+        'groups': args.groups,
+        'txt_per_day': args.txt_per_day,
+        'evtx_per_day': args.evtx_per_day,
+        'evtx_events': args.evtx_events,
+        'evtx_variants': args.evtx_variants,
+        'process_lines': args.process_lines,
+        'seed': args.seed,
+        'compression': zipfile.ZIP_STORED if args.stored else zipfile.ZIP_DEFLATED
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('output', help="생성할 ZIP 경로")
+    add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    summary = build_field_zip(args.output, **generator_options(args))
+    print(
+        f"{args.output}: members={summary['members']} txt={summary['txt_files']} evtx={summary['evtx_files']} "
+        f"uncompressed={summary['uncompressed_bytes'] / 1024 / 1024:.1f}MB "
+        f"zip={summary['zip_bytes'] / 1024 / 1024:.1f}MB"
+    )
+
+
+if __name__ == '__main__':
+    main()
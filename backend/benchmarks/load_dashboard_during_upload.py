@@ -0,0 +1,174 @@
+"""
+업로드 처리 중 대시보드 응답 지연 부하 테스트
+
+실행 중인 API 서버에 대용량 ZIP을 업로드하면서 /health, /api/dashboard/stats를
+동시에 반복 호출하여, 업로드 전(기준)과 업로드 중의 응답 지연 분포(p50/p99/max)를 비교한다.
+업로드 처리가 이벤트 루프를 막으면 업로드 중 /health p99가 처리 시간 수준으로 튀어 오른다.
+
+사용법 (backend 디렉토리에서, 서버는 별도 실행):
+    uvicorn app.main:app --port 8000
+    python -m benchmarks.load_dashboard_during_upload --base-url http://127.0.0.1:8000 --size-mb 500
+
+주의: 업로드된 합성 데이터(1BL_LOADTEST_* 자산)가 대상 DB에 그대로 기록된다.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import zipfile
+
+import httpx
+
+from benchmarks.evtx_synth import write_evtx, iter_events, SECURITY_PROFILE
+
+PROBE_PATHS = ("/health", "/api/dashboard/stats")
+
+
+def build_large_zip(path: str, size_mb: int, events_per_file: int = 20000) -> int:
+    """
+    합성 EVTX 멤버로 목표 크기 이상의 ZIP 생성 (무압축 저장)
+
+    서로 다른 시드로 만든 EVTX 몇 개를 자산/날짜별 경로에 반복 배치한다.
+
+    Returns:
+        int: 멤버 수
+    """
+    work_dir = tempfile.mkdtemp(prefix="load_evtx_")
+    try:
+        samples = []
+        for seed in range(4):
+            sample_path = os.path.join(work_dir, f"sample{seed}.evtx")
+            write_evtx(sample_path, iter_events(events_per_file, SECURITY_PROFILE, seed=seed), seed=seed)
+            samples.append(sample_path)
+
+        target = size_mb * 1024 * 1024
+        written = 0
+        members = 0
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as zf:
+            while written < target:
+                sample = samples[members % len(samples)]
+                asset = f"1BL_LOADTEST_{members // 28:03d}"
+                date = f"2512{members % 28 + 1:02d}"
+                zf.write(sample, f"log,process/1단계_LOADTEST/{asset}/{date}_Security.evtx")
+                written += os.path.getsize(sample)
+                members += 1
+        return members
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class Prober:
+    """종료 신호가 올 때까지 엔드포인트를 반복 호출하며 지연(ms) 기록"""
+
+    def __init__(self, base_url: str, threads: int):
+        self.base_url = base_url
+        self.threads = threads
+        self.samples = {path: [] for path in PROBE_PATHS}
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def _run(self, stop: threading.Event):
+        with httpx.Client(base_url=self.base_url, timeout=120) as client:
+            while not stop.is_set():
+                for path in PROBE_PATHS:
+                    start = time.perf_counter()
+                    try:
+                        ok = client.get(path).status_code == 200
+                    except httpx.HTTPError:
+                        ok = False
+                    elapsed = (time.perf_counter() - start) * 1000
+                    with self._lock:
+                        if ok:
+                            self.samples[path].append(elapsed)
+                        else:
+                            self.errors += 1
+
+    def run_until(self, stop: threading.Event):
+        workers = [threading.Thread(target=self._run, args=(stop,), daemon=True) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def report(self, label: str):
+        for path, values in self.samples.items():
+            if not values:
+                print(f"{label:<9} {path:<22} no successful requests")
+                continue
+            print(
+                f"{label:<9} {path:<22} n={len(values):>6} "
+                f"p50={statistics.median(values):8.1f}ms p99={_percentile(values, 99):8.1f}ms "
+                f"max={max(values):8.1f}ms"
+            )
+        if self.errors:
+            print(f"{label:<9} errors={self.errors}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--base-url', default="http://127.0.0.1:8000")
+    arg_parser.add_argument('--size-mb', type=int, default=500, help="생성할 ZIP 크기")
+    arg_parser.add_argument('--zip', help="기존 ZIP 사용 (미지정 시 합성 ZIP 생성)")
+    arg_parser.add_argument('--threads', type=int, default=4, help="조회 요청 스레드 수")
+    arg_parser.add_argument('--baseline-seconds', type=float, default=10.0)
+    args = arg_parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="load_upload_")
+    try:
+        zip_path = args.zip
+        if not zip_path:
+            zip_path = os.path.join(temp_dir, "load.zip")
+            members = build_large_zip(zip_path, args.size_mb)
+            print(f"generated {zip_path}: {os.path.getsize(zip_path) / 1024 / 1024:.0f}MB, {members} members")
+
+        # 1) 기준: 업로드 없이 조회만
+        baseline = Prober(args.base_url, args.threads)
+        stop = threading.Event()
+        timer = threading.Timer(args.baseline_seconds, stop.set)
+        timer.start()
+        baseline.run_until(stop)
+
+        # 2) 업로드 진행 중 조회
+        during = Prober(args.base_url, args.threads)
+        stop = threading.Event()
+        result = {}
+
+        def upload():
+            start = time.perf_counter()
+            try:
+                with open(zip_path, 'rb') as f, httpx.Client(base_url=args.base_url, timeout=None) as client:
+                    response = client.post(
+                        "/api/upload/",
+                        files={"file": (os.path.basename(zip_path), f, "application/zip")},
+                        params={"worker": "loadtest"}
+                    )
+                result['status'] = response.status_code
+            except httpx.HTTPError as e:
+                result['status'] = repr(e)
+            finally:
+                result['seconds'] = time.perf_counter() - start
+                stop.set()
+
+        uploader = threading.Thread(target=upload)
+        uploader.start()
+        during.run_until(stop)
+        uploader.join()
+
+        print(f"upload status={result['status']} elapsed={result['seconds']:.1f}s")
+        baseline.report("baseline")
+        during.report("upload")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
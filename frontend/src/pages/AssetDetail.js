@@ -18,34 +18,24 @@ import api from '../services/api';
 function AssetDetail() {
   const { id } = useParams();
   const [asset, setAsset] = useState(null);
-  const [maintenanceLogs, setMaintenanceLogs] = useState([]);
   const [tabValue, setTabValue] = useState(0);
 
   useEffect(() => {
     fetchAsset();
-    fetchMaintenanceLogs();
   }, [id]);
 
+  // 제원, NIC, 계정, 최근 점검 이력(상세 포함)을 한 번에 조회
   const fetchAsset = async () => {
     try {
-      const response = await api.get(`/assets/${id}`);
+      const response = await api.get(`/assets/${id}/detail`, {
+        params: { log_limit: 50 },
+      });
       setAsset(response.data);
     } catch (error) {
       console.error('Error fetching asset:', error);
     }
   };
 
-  const fetchMaintenanceLogs = async () => {
-    try {
-      const response = await api.get('/maintenance/logs', {
-        params: { asset_id: id },
-      });
-      setMaintenanceLogs(response.data);
-    } catch (error) {
-      console.error('Error fetching maintenance logs:', error);
-    }
-  };
-
   if (!asset) {
     return <Typography>로딩 중...</Typography>;
   }
@@ -92,6 +82,58 @@ function AssetDetail() {
                       <TableCell>OS 정보</TableCell>
                       <TableCell>{asset.os_info || '-'}</TableCell>
                     </TableRow>
+                    <TableRow>
+                      <TableCell>설비 / 위치</TableCell>
+                      <TableCell>
+                        {asset.system?.name || '-'} / {asset.location?.name || '-'}
+                      </TableCell>
+                    </TableRow>
+                  </TableBody>
+                </Table>
+              </TableContainer>
+
+              <Typography variant="h6" gutterBottom sx={{ mt: 3 }}>
+                네트워크 인터페이스
+              </Typography>
+              <TableContainer>
+                <Table size="small">
+                  <TableHead>
+                    <TableRow>
+                      <TableCell>인터페이스</TableCell>
+                      <TableCell>IP</TableCell>
+                      <TableCell>MAC</TableCell>
+                    </TableRow>
+                  </TableHead>
+                  <TableBody>
+                    {asset.network_interfaces.map((nic) => (
+                      <TableRow key={nic.id}>
+                        <TableCell>{nic.interface_name || '-'}</TableCell>
+                        <TableCell>{nic.ip_address || '-'}</TableCell>
+                        <TableCell>{nic.mac_address || '-'}</TableCell>
+                      </TableRow>
+                    ))}
+                  </TableBody>
+                </Table>
+              </TableContainer>
+
+              <Typography variant="h6" gutterBottom sx={{ mt: 3 }}>
+                계정
+              </Typography>
+              <TableContainer>
+                <Table size="small">
+                  <TableHead>
+                    <TableRow>
+                      <TableCell>계정명</TableCell>
+                      <TableCell>권한</TableCell>
+                    </TableRow>
+                  </TableHead>
+                  <TableBody>
+                    {asset.accounts.map((account) => (
+                      <TableRow key={account.id}>
+                        <TableCell>{account.username}</TableCell>
+                        <TableCell>{account.role || '-'}</TableCell>
+                      </TableRow>
+                    ))}
                   </TableBody>
                 </Table>
               </TableContainer>
@@ -111,15 +153,23 @@ function AssetDetail() {
                       <TableCell>점검유형</TableCell>
                       <TableCell>작업자</TableCell>
                       <TableCell>결과</TableCell>
+                      <TableCell>상세</TableCell>
                     </TableRow>
                   </TableHead>
                   <TableBody>
-                    {maintenanceLogs.map((log) => (
+                    {asset.recent_logs.map((log) => (
                       <TableRow key={log.id}>
                         <TableCell>{log.check_date}</TableCell>
                         <TableCell>{log.check_type}</TableCell>
                         <TableCell>{log.worker || '-'}</TableCell>
                         <TableCell>{log.result_status}</TableCell>
+                        <TableCell>
+                          {log.details.map((detail) => (
+                            <Typography key={detail.id} variant="body2">
+                              {detail.item_name}: {detail.value || '-'}
+                            </Typography>
+                          ))}
+                        </TableCell>
                       </TableRow>
                     ))}
                   </TableBody>
@@ -15,27 +15,43 @@ import {
 } from '@mui/material';
 import api from '../services/api';
 
+const PAGE_SIZE = 100;
+
 function Assets() {
   const [assets, setAssets] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [search, setSearch] = useState('');
   const [page, setPage] = useState(0);
   const [rowsPerPage, setRowsPerPage] = useState(10);
   const navigate = useNavigate();
 
   useEffect(() => {
-    fetchAssets();
+    setPage(0);
+    fetchAssets(null);
   }, [search]);
 
-  const fetchAssets = async () => {
+  // 서버는 id 순 keyset 페이지로 응답하며 다음 페이지가 있으면 X-Next-Cursor 헤더를 준다
+  const fetchAssets = async (afterId) => {
     try {
-      const params = search ? { search } : {};
+      const params = { limit: PAGE_SIZE };
+      if (search) params.search = search;
+      if (afterId) params.after_id = afterId;
       const response = await api.get('/assets/', { params });
-      setAssets(response.data);
+      setAssets((prev) => (afterId ? [...prev, ...response.data] : response.data));
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching assets:', error);
     }
   };
 
+  const handlePageChange = (e, newPage) => {
+    // 아직 받지 않은 구간으로 넘어가면 다음 페이지 요청
+    if ((newPage + 1) * rowsPerPage > assets.length && nextCursor) {
+      fetchAssets(nextCursor);
+    }
+    setPage(newPage);
+  };
+
   const handleRowClick = (assetId) => {
     navigate(`/assets/${assetId}`);
   };
@@ -89,9 +105,9 @@ function Assets() {
         </Table>
         <TablePagination
           component="div"
-          count={assets.length}
+          count={nextCursor ? -1 : assets.length}
           page={page}
-          onPageChange={(e, newPage) => setPage(newPage)}
+          onPageChange={handlePageChange}
           rowsPerPage={rowsPerPage}
           onRowsPerPageChange={(e) => {
             setRowsPerPage(parseInt(e.target.value, 10));
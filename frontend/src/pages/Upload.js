@@ -8,11 +8,15 @@ import {
   Alert,
 } from '@mui/material';
 import CloudUploadIcon from '@mui/icons-material/CloudUpload';
-import api from '../services/api';
+import { uploadResumable } from '../services/resumableUpload';
+import { watchUpload, watchJob } from '../services/uploadEvents';
 
 function Upload() {
   const [file, setFile] = useState(null);
   const [uploading, setUploading] = useState(false);
+  const [progress, setProgress] = useState(0);
+  const [ingest, setIngest] = useState(null);
+  const [fileErrors, setFileErrors] = useState([]);
   const [result, setResult] = useState(null);
   const [error, setError] = useState(null);
 
@@ -29,23 +33,49 @@ function Upload() {
     }
 
     setUploading(true);
+    setProgress(0);
+    setIngest(null);
+    setFileErrors([]);
     setError(null);
     setResult(null);
 
     try {
-      const formData = new FormData();
-      formData.append('file', file);
-
-      const response = await api.post('/upload/', formData, {
-        headers: {
-          'Content-Type': 'multipart/form-data',
+      // 청크 단위 업로드 - 실패 후 다시 업로드하면 받지 못한 청크부터 이어서 전송
+      const accepted = await uploadResumable(
+        file,
+        (sent, total) => {
+          setProgress(Math.round((sent / total) * 100));
         },
+        { background: true }
+      );
+
+      // 대기열 모드: 워커가 처리하는 동안 작업 상태 조회
+      if (accepted.job_id) {
+        const job = await watchJob(accepted.job_id, (current) => {
+          if (current.progress?.event === 'progress') {
+            setIngest(current.progress);
+          }
+        });
+        setResult(job);
+        setFile(null);
+        return;
+      }
+
+      // 서버 처리 진행 상황 실시간 수신
+      const completed = await watchUpload(accepted.upload_id, (event) => {
+        if (event.event === 'started') {
+          setIngest({ done: 0, total: event.total_files, processed: 0, errors: 0, rows_written: 0 });
+        } else if (event.event === 'progress') {
+          setIngest(event);
+        } else if (event.event === 'file' && event.status !== 'processed') {
+          setFileErrors((prev) => [...prev.slice(-19), `${event.path}: ${event.error}`]);
+        }
       });
 
-      setResult(response.data);
+      setResult(completed);
       setFile(null);
     } catch (err) {
-      setError(err.response?.data?.detail || '업로드 실패');
+      setError(err.response?.data?.detail || err.message || '업로드 실패 (다시 업로드하면 이어서 전송합니다)');
     } finally {
       setUploading(false);
     }
@@ -92,11 +122,42 @@ function Upload() {
 
         {uploading && (
           <Box sx={{ mt: 2 }}>
-            <LinearProgress />
-            <Typography sx={{ mt: 1 }}>업로드 및 처리 중...</Typography>
+            {progress < 100 ? (
+              <>
+                <LinearProgress variant="determinate" value={progress} />
+                <Typography sx={{ mt: 1 }}>업로드 중... {progress}%</Typography>
+              </>
+            ) : ingest && ingest.total ? (
+              <>
+                <LinearProgress
+                  variant="determinate"
+                  value={Math.round((ingest.done / ingest.total) * 100)}
+                />
+                <Typography sx={{ mt: 1 }}>
+                  처리 중... {ingest.done} / {ingest.total} 파일 (오류 {ingest.errors}, 기록 행{' '}
+                  {ingest.rows_written}
+                  {ingest.files_per_sec ? `, ${ingest.files_per_sec} files/s, ${ingest.mb_per_sec} MB/s` : ''})
+                </Typography>
+              </>
+            ) : (
+              <>
+                <LinearProgress />
+                <Typography sx={{ mt: 1 }}>처리 대기 중...</Typography>
+              </>
+            )}
           </Box>
         )}
 
+        {fileErrors.length > 0 && (
+          <Alert severity="warning" sx={{ mt: 2 }}>
+            {fileErrors.map((message) => (
+              <Typography key={message} variant="body2">
+                {message}
+              </Typography>
+            ))}
+          </Alert>
+        )}
+
         {error && (
           <Alert severity="error" sx={{ mt: 2 }}>
             {error}
@@ -0,0 +1,101 @@
+import api from './api';
+
+// 재개 가능한 청크 업로드 (백엔드 /upload/sessions API)
+const PARALLEL_CHUNKS = 3;
+const MAX_RETRIES = 5;
+const STORAGE_PREFIX = 'upload-session:';
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// 같은 파일을 다시 선택하면 이전 세션을 이어서 사용
+const fileKey = (file) => `${STORAGE_PREFIX}${file.name}:${file.size}:${file.lastModified}`;
+
+async function sha256Hex(blob) {
+  // crypto.subtle은 보안 컨텍스트(https, localhost)에서만 제공 - 없으면 서버 검증 생략
+  if (!window.crypto?.subtle) {
+    return null;
+  }
+  const digest = await window.crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+  return Array.from(new Uint8Array(digest))
+    .map((b) => b.toString(16).padStart(2, '0'))
+    .join('');
+}
+
+async function openSession(file) {
+  const saved = localStorage.getItem(fileKey(file));
+  if (saved) {
+    try {
+      const response = await api.get(`/upload/sessions/${saved}`);
+      return response.data;
+    } catch (err) {
+      localStorage.removeItem(fileKey(file));
+    }
+  }
+  const response = await api.post('/upload/sessions', { filename: file.name, size: file.size });
+  localStorage.setItem(fileKey(file), response.data.session_id);
+  return { ...response.data, received: [] };
+}
+
+async function putChunk(file, session, index) {
+  const start = index * session.chunk_size;
+  const blob = file.slice(start, Math.min(start + session.chunk_size, file.size));
+  const checksum = await sha256Hex(blob);
+
+  for (let attempt = 0; ; attempt += 1) {
+    try {
+      await api.put(`/upload/sessions/${session.session_id}/chunks/${index}`, blob, {
+        headers: {
+          'Content-Type': 'application/octet-stream',
+          ...(checksum ? { 'X-Chunk-SHA256': checksum } : {}),
+        },
+      });
+      return blob.size;
+    } catch (err) {
+      // 4xx(잘못된 요청)는 재시도해도 같으므로 즉시 실패
+      const status = err.response?.status;
+      if ((status && status < 500) || attempt >= MAX_RETRIES) {
+        throw err;
+      }
+      await sleep(Math.min(1000 * 2 ** attempt, 15000));
+    }
+  }
+}
+
+/**
+ * 파일을 청크로 나눠 업로드하고 서버 처리 결과를 반환
+ * 끊긴 뒤 다시 호출하면 서버에 없는 청크만 보낸다.
+ *
+ * @param {File} file
+ * @param {(sent: number, total: number) => void} onProgress 전송 바이트 콜백
+ * @param {{ background?: boolean }} options background: 처리 완료를 기다리지 않고 upload_id만 받음
+ */
+export async function uploadResumable(file, onProgress = () => {}, { background = false } = {}) {
+  const session = await openSession(file);
+
+  const received = new Set();
+  session.received.forEach(([first, last]) => {
+    for (let i = first; i <= last; i += 1) received.add(i);
+  });
+  const pending = [];
+  for (let i = 0; i < session.total_chunks; i += 1) {
+    if (!received.has(i)) pending.push(i);
+  }
+
+  let sent = session.received_bytes || 0;
+  onProgress(sent, file.size);
+
+  const worker = async () => {
+    while (pending.length) {
+      const index = pending.shift();
+      sent += await putChunk(file, session, index);
+      onProgress(sent, file.size);
+    }
+  };
+  await Promise.all(Array.from({ length: PARALLEL_CHUNKS }, worker));
+
+  const response = await api.post(`/upload/sessions/${session.session_id}/finalize`, null, {
+    params: { background },
+  });
+  localStorage.removeItem(fileKey(file));
+  return response.data;
+}
@@ -0,0 +1,61 @@
+import api from './api';
+
+const EVENT_TYPES = ['started', 'file', 'progress', 'completed', 'failed'];
+
+/**
+ * 업로드 처리 진행 이벤트 구독 (Server-Sent Events)
+ *
+ * @param {string} uploadId 업로드 응답의 upload_id
+ * @param {(event: object) => void} onEvent 이벤트 콜백 (event.event로 종류 구분)
+ * @returns {Promise<object>} completed 이벤트의 stats (failed 이벤트면 reject)
+ */
+export function watchUpload(uploadId, onEvent = () => {}) {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`${api.defaults.baseURL}/upload/${uploadId}/events`);
+
+    EVENT_TYPES.forEach((type) => {
+      source.addEventListener(type, (message) => {
+        const event = JSON.parse(message.data);
+        onEvent(event);
+        if (type === 'completed') {
+          source.close();
+          resolve(event);
+        } else if (type === 'failed') {
+          source.close();
+          reject(new Error(event.error));
+        }
+      });
+    });
+
+    // 연결이 끊기면 EventSource가 자동 재접속하며, 서버는 이전 이벤트를 재전송한다.
+    // 서버가 업로드를 찾지 못하는 경우(만료 등)에만 종료
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        reject(new Error('진행 상황 연결이 종료되었습니다'));
+      }
+    };
+  });
+}
+
+const JOB_POLL_INTERVAL = 2000;
+
+/**
+ * 대기열 작업 처리 상태 조회 (INGEST_QUEUE 모드 - 워커 프로세스가 처리하므로 주기적 조회)
+ *
+ * @param {number} jobId 업로드 응답의 job_id
+ * @param {(job: object) => void} onUpdate 조회할 때마다 호출 (job.progress: 마지막 진행 이벤트)
+ * @returns {Promise<object>} succeeded 상태의 작업 (failed면 reject)
+ */
+export async function watchJob(jobId, onUpdate = () => {}) {
+  for (;;) {
+    const { data: job } = await api.get(`/jobs/${jobId}`);
+    onUpdate(job);
+    if (job.status === 'succeeded') {
+      return job;
+    }
+    if (job.status === 'failed') {
+      throw new Error(job.error || '처리 실패');
+    }
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL));
+  }
+}